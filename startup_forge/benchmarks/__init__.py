@@ -0,0 +1 @@
+"""Benchmarks for startup_forge."""
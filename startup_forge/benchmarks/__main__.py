@@ -0,0 +1,4 @@
+from startup_forge.benchmarks.matching import main
+
+if __name__ == "__main__":
+    main()
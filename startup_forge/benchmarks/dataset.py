@@ -0,0 +1,169 @@
+"""Synthetic mentor and mentee populations."""
+import random
+import uuid
+from datetime import date, time, timedelta, timezone
+from typing import Any, Iterator
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from startup_forge.db.models.booking import TimeSlot
+from startup_forge.db.models.experience import Experience
+from startup_forge.db.models.industry_footprint import IndustryFootprint
+from startup_forge.db.models.options import (
+    Day,
+    ExpertiseName,
+    Industry,
+    LanguageLevel,
+    LanguageName,
+    Role,
+    SkillName,
+)
+from startup_forge.db.models.profile import Profile
+from startup_forge.db.models.users import User
+from startup_forge.services.matching import availability_mask, industry_mask
+
+# A few industries hold most of the population, as on the platform.
+INDUSTRY_WEIGHTS = [1 / (rank + 1) for rank in range(len(Industry))]
+LANGUAGE_WEIGHTS = [6, 2, 1]
+BATCH_SIZE = 5000
+
+
+def _sample(rng: random.Random, options: list[Any], upto: int) -> list[Any]:
+    """Pick up to `upto` distinct options."""
+    return rng.sample(options, rng.randint(0, min(upto, len(options))))
+
+
+def generate_user(rng: random.Random, role: Role) -> dict[str, list[dict[str, Any]]]:
+    """
+    Generate the rows of one user.
+
+    Mentors have longer careers than mentees, every experience but the
+    latest one is over and users are available a few hours a week.
+
+    :param rng: random generator.
+    :param role: role of the user.
+    :return: rows per table.
+    """
+    user_id = uuid.UUID(int=rng.getrandbits(128), version=4)
+    experiences = []
+    start = date(2000, 1, 1) + timedelta(days=rng.randint(0, 8000))
+    count = rng.randint(1, 4 if role == Role.MENTOR else 2)
+    for position in range(count):
+        end = start + timedelta(days=rng.randint(180, 1500))
+        current = position == count - 1 and rng.random() < 0.7
+        experiences.append(
+            {
+                "id": uuid.UUID(int=rng.getrandbits(128), version=4),
+                "user_id": user_id,
+                "company_name": f"company-{rng.randint(0, 5000)}",
+                "start_date": start,
+                "end_date": None if current else end,
+                "industry": rng.choices(list(Industry), INDUSTRY_WEIGHTS)[0],
+            }
+        )
+        start = end
+    languages = {
+        rng.choices(list(LanguageName), LANGUAGE_WEIGHTS)[0]
+        for _ in range(rng.randint(1, 2))
+    }
+    time_slots = {
+        (rng.choice(list(Day)), rng.randint(7, 20)) for _ in range(rng.randint(0, 4))
+    }
+    return {
+        "user": [
+            {
+                "id": user_id,
+                "email": f"{user_id.hex}@benchmark.local",
+                "hashed_password": "benchmark",
+            }
+        ],
+        "profile": [
+            {
+                "user_id": user_id,
+                "role": role,
+                "first_name": f"first-{user_id.hex[:8]}",
+                "last_name": f"last-{user_id.hex[8:16]}",
+                "skills": [skill.value for skill in _sample(rng, list(SkillName), 2)],
+                "expertises": [
+                    expertise.value
+                    for expertise in _sample(rng, list(ExpertiseName), 2)
+                ],
+                "languages": [
+                    [language.value, rng.choice(list(LanguageLevel)).value]
+                    for language in languages
+                ],
+            }
+        ],
+        "experience": experiences,
+        "time_slot": [
+            {
+                "id": uuid.UUID(int=rng.getrandbits(128), version=4),
+                "user_id": user_id,
+                "day": day,
+                "start_time": time(hour, tzinfo=timezone.utc),
+                "end_time": time(hour + 1, tzinfo=timezone.utc),
+            }
+            for day, hour in time_slots
+        ],
+        "industry_footprint": [
+            {
+                "user_id": user_id,
+                "industries": industry_mask(
+                    experience["industry"] for experience in experiences
+                ),
+                "current_industries": industry_mask(
+                    experience["industry"]
+                    for experience in experiences
+                    if experience["end_date"] is None
+                ),
+                "availability": availability_mask(
+                    (day, time(hour), time(hour + 1)) for day, hour in time_slots
+                ),
+            }
+        ],
+    }
+
+
+TABLES = {
+    "user": User,
+    "profile": Profile,
+    "experience": Experience,
+    "time_slot": TimeSlot,
+    "industry_footprint": IndustryFootprint,
+}
+
+
+def _batches(
+    rng: random.Random,
+    role: Role,
+    count: int,
+) -> Iterator[dict[str, list[dict[str, Any]]]]:
+    """Generate users in batches of rows per table."""
+    for start in range(0, count, BATCH_SIZE):
+        batch: dict[str, list[dict[str, Any]]] = {table: [] for table in TABLES}
+        for _ in range(min(BATCH_SIZE, count - start)):
+            for table, rows in generate_user(rng, role).items():
+                batch[table].extend(rows)
+        yield batch
+
+
+async def populate(
+    session: AsyncSession,
+    rng: random.Random,
+    role: Role,
+    count: int,
+) -> None:
+    """
+    Insert users in bulk, along with the footprints DAOs would maintain.
+
+    :param session: session to database.
+    :param rng: random generator.
+    :param role: role of the users.
+    :param count: number of users.
+    """
+    for batch in _batches(rng, role, count):
+        for table, model in TABLES.items():
+            if batch[table]:
+                await session.execute(insert(model), batch[table])
+        await session.commit()
@@ -0,0 +1,130 @@
+import argparse
+import math
+import random
+import statistics
+import time
+import uuid
+from typing import Callable
+
+from startup_forge.db.models.options import (
+    ExpertiseName,
+    Industry,
+    LanguageName,
+    RelatedIndustry,
+    SkillName,
+)
+from startup_forge.services.matching import (
+    AVAILABILITY_BLOCKS,
+    FULL_MASK,
+    MatchFeatures,
+    MentorIndex,
+    decode_mask,
+)
+
+
+def _set_scores(mentors: list[set[Industry]], mentee: set[Industry]) -> list[float]:
+    """
+    Score mentors with plain set intersections, as a baseline.
+
+    :param mentors: industries of every mentor.
+    :param mentee: industries of the mentee.
+    :return: compatibility of every mentor.
+    """
+    mentee_related = {
+        related for industry in mentee for related in RelatedIndustry[industry.name]
+    }
+    scores = []
+    for mentor in mentors:
+        mentor_related = {
+            related for industry in mentor for related in RelatedIndustry[industry.name]
+        }
+        scores.append(
+            (
+                len(mentor & mentee) / len(mentee)
+                + len(mentor_related & mentee_related) / max(len(mentee_related), 1)
+            )
+            / 2
+        )
+    return scores
+
+
+def _timeit(func: Callable[[], object], repeat: int) -> list[float]:
+    """
+    Time a function.
+
+    :param func: function to time.
+    :param repeat: number of runs.
+    :return: duration of every run in milliseconds.
+    """
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - start) * 1000)
+    return durations
+
+
+def main() -> None:
+    """Benchmark scoring a mentee against synthetic mentors."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--mentors", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    masks = [
+        rng.randint(1, FULL_MASK) & rng.randint(1, FULL_MASK)
+        for _ in range(args.mentors)
+    ]
+    mentor_ids = [uuid.uuid4() for _ in masks]
+    mentee_mask = rng.randint(1, FULL_MASK)
+
+    mentor_features = [
+        MatchFeatures(
+            industries=mask,
+            skills=rng.getrandbits(len(SkillName)),
+            expertises=rng.getrandbits(len(ExpertiseName)),
+            languages=rng.getrandbits(len(LanguageName)),
+            availability=rng.getrandbits(AVAILABILITY_BLOCKS),
+        )
+        for mask in masks
+    ]
+    mentee = MatchFeatures(
+        industries=mentee_mask,
+        skills=1,
+        expertises=1,
+        languages=1,
+        availability=rng.getrandbits(AVAILABILITY_BLOCKS),
+    )
+
+    index = MentorIndex()
+    build = _timeit(
+        lambda: [index.add(*mentor) for mentor in zip(mentor_ids, mentor_features)],
+        repeat=1,
+    )
+    industry_only = {"industries": 1.0}
+    mentor_sets = [decode_mask(mask) for mask in masks]
+    mentee_set = decode_mask(mentee_mask)
+    assert all(  # noqa: S101
+        math.isclose(bitmask, baseline)
+        for bitmask, baseline in zip(
+            index.scores(mentee, industry_only), _set_scores(mentor_sets, mentee_set)
+        )
+    )
+
+    print(f"mentors: {len(index)}, index build: {build[0]:.1f} ms")
+    for name, func in (
+        ("bitmask", lambda: index.scores(mentee, industry_only)),
+        ("sets", lambda: _set_scores(mentor_sets, mentee_set)),
+        ("factors", lambda: index.scores(mentee)),
+    ):
+        durations = _timeit(func, args.repeat)
+        print(
+            f"{name:>8}: median {statistics.median(durations):.1f} ms, "
+            f"max {max(durations):.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
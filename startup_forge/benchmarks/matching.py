@@ -0,0 +1,233 @@
+"""
+Benchmark mentor matching against synthetic populations.
+
+Mentors are added in steps up to every requested size, and at every step
+the same mentees request their matches through `MentorMenteeDAO` with an
+empty and a warm match cache, and through the in-memory engine alone.
+Latency percentiles, queries per request and peak traced memory are
+reported, optionally as JSON to compare runs before and after a change.
+"""
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable, Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from startup_forge.benchmarks.dataset import populate
+from startup_forge.db.dao.mentor_mentee_dao import MentorMenteeDAO
+from startup_forge.db.meta import meta
+from startup_forge.db.models import load_all_models
+from startup_forge.db.models.options import Role
+from startup_forge.db.models.profile import Profile
+from startup_forge.db.utils import count_queries, create_database, drop_database
+from startup_forge.services.matching import (
+    MentorIndex,
+    match_cache,
+    top_matches,
+)
+from startup_forge.settings import settings
+
+Scenario = Callable[[UUID], Awaitable[None]]
+
+
+async def measure(
+    name: str,
+    scenario: Scenario,
+    mentee_ids: list[UUID],
+    engine: AsyncEngine,
+) -> dict[str, Any]:
+    """
+    Run a scenario for every mentee.
+
+    Every mentee is matched once before measuring, so caches are warm
+    unless the scenario clears them. Memory is traced in a separate pass so
+    tracing does not skew latency.
+
+    :param name: name of the scenario.
+    :param scenario: coroutine function matching one mentee.
+    :param mentee_ids: ids of the mentees.
+    :param engine: engine the scenario runs against.
+    :return: measurements.
+    """
+    for mentee_id in mentee_ids:
+        await scenario(mentee_id)
+
+    durations = []
+    with count_queries(engine) as statements:
+        for mentee_id in mentee_ids:
+            start = time.perf_counter()
+            await scenario(mentee_id)
+            durations.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    try:
+        peak = 0
+        for mentee_id in mentee_ids[:5]:
+            tracemalloc.reset_peak()
+            await scenario(mentee_id)
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+    finally:
+        tracemalloc.stop()
+
+    percentiles = statistics.quantiles(durations, n=100, method="inclusive")
+    return {
+        "scenario": name,
+        "p50_ms": statistics.median(durations),
+        "p99_ms": percentiles[98],
+        "queries": len(statements) / len(mentee_ids),
+        "peak_kib": peak / 1024,
+    }
+
+
+async def _scenarios(
+    session_factory: async_sessionmaker[AsyncSession],
+    index: MentorIndex,
+    mentee_ids: list[UUID],
+    limit: int,
+) -> dict[str, Scenario]:
+    """
+    Build the scenarios to measure.
+
+    :param session_factory: factory of sessions to database.
+    :param index: mentor index for the engine-only scenario.
+    :param mentee_ids: ids of the mentees requesting matches.
+    :param limit: number of mentors per request.
+    :return: scenario per name.
+    """
+    async with session_factory() as session:
+        features = dict(
+            await MentorMenteeDAO(session).get_features(
+                Role.MENTEE, user_ids=mentee_ids
+            )
+        )
+
+    async def _dao(mentee_id: UUID) -> None:  # noqa: WPS430
+        async with session_factory() as session:
+            mentee = await session.get(Profile, mentee_id)
+            await MentorMenteeDAO(session).match_mentees_to_mentors(mentee, limit)
+
+    async def _dao_cold(mentee_id: UUID) -> None:  # noqa: WPS430
+        match_cache.clear()
+        await _dao(mentee_id)
+
+    async def _engine(mentee_id: UUID) -> None:  # noqa: WPS430
+        scores = index.scores(features[mentee_id])
+        top_matches(index.mentor_ids, scores, limit)
+
+    return {"dao": _dao_cold, "dao (cached)": _dao, "engine": _engine}
+
+
+async def run(
+    sizes: list[int],
+    mentees: int,
+    requests: int,
+    limit: int,
+    seed: int,
+    database: str,
+) -> list[dict[str, Any]]:
+    """
+    Populate a scratch database step by step and measure every scenario.
+
+    :param sizes: numbers of mentors to measure at.
+    :param mentees: number of mentees in the population.
+    :param requests: number of mentees requesting matches per scenario.
+    :param limit: number of mentors per request.
+    :param seed: seed of the synthetic population.
+    :param database: name of the scratch database, dropped afterwards.
+    :return: measurements.
+    """
+    load_all_models()
+    await create_database(database)
+    engine = create_async_engine(str(settings.db_url.with_path(f"/{database}")))
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    rng = random.Random(seed)
+    results = []
+    try:
+        async with engine.begin() as connection:
+            await connection.run_sync(meta.create_all)
+        async with session_factory() as session:
+            await populate(session, rng, Role.MENTEE, mentees)
+            mentee_ids = list(
+                await session.scalars(
+                    select(Profile.user_id).where(Profile.role == Role.MENTEE)
+                )
+            )
+        sample = rng.sample(mentee_ids, min(requests, len(mentee_ids)))
+
+        mentors = 0
+        for size in sorted(sizes):
+            async with session_factory() as session:
+                await populate(session, rng, Role.MENTOR, size - mentors)
+                mentors = size
+                index = MentorIndex()
+                for mentor_id, features in await MentorMenteeDAO(session).get_features(
+                    Role.MENTOR
+                ):
+                    index.add(mentor_id, features)
+
+            scenarios = await _scenarios(session_factory, index, sample, limit)
+            for name, scenario in scenarios.items():
+                result = await measure(name, scenario, sample, engine)
+                result["mentors"] = size
+                results.append(result)
+                _report(result)
+    finally:
+        await engine.dispose()
+        await drop_database(database)
+    return results
+
+
+def _report(result: dict[str, Any]) -> None:
+    """Print one measurement."""
+    print(  # noqa: WPS421
+        f"{result['mentors']:>7} mentors  {result['scenario']:<13}"
+        f"p50 {result['p50_ms']:>8.1f} ms  p99 {result['p99_ms']:>8.1f} ms  "
+        f"{result['queries']:>4.1f} queries  peak {result['peak_kib']:>9.0f} KiB"
+    )
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """
+    Entrypoint of the benchmark.
+
+    :param argv: command line arguments.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--mentees", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--database", default=f"{settings.db_base}_benchmark")
+    parser.add_argument("--json", help="write the measurements to this file")
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(
+        run(
+            sizes=args.sizes,
+            mentees=args.mentees,
+            requests=args.requests,
+            limit=args.limit,
+            seed=args.seed,
+            database=args.database,
+        )
+    )
+    if args.json:
+        with open(args.json, "w") as output:
+            json.dump(results, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -15,7 +15,8 @@ from startup_forge.db.dependencies import get_db_session
 from startup_forge.db.utils import create_database, drop_database
 from startup_forge.db.models.profile import Profile
 from startup_forge.db.models.options import Role
-from startup_forge.db.dao.profile_dao import ProfileDAO
+from startup_forge.db.dao.profile_dao import ProfileDAO, profile_cache
+from startup_forge.services.matching import match_cache
 from startup_forge.settings import settings
 from startup_forge.web.application import get_app
 
@@ -30,6 +31,13 @@ def anyio_backend() -> str:
     return "asyncio"
 
 
+@pytest.fixture(autouse=True)
+def _clear_caches() -> None:
+    """Start every test with empty in-process caches."""
+    match_cache.clear()
+    profile_cache.clear()
+
+
 @pytest.fixture(scope="session")
 async def _engine() -> AsyncGenerator[AsyncEngine, None]:
     """
@@ -261,7 +269,7 @@ async def mentor_profile(
     )
 
     dao = ProfileDAO(dbsession)
-    instances = await dao.filter(first_name=first_name)
+    instances = (await dao.filter(first_name=first_name)).items
 
     return instances[0]
 
@@ -290,7 +298,7 @@ async def mentor_profile2(
     )
 
     dao = ProfileDAO(dbsession)
-    instances = await dao.filter(first_name=first_name)
+    instances = (await dao.filter(first_name=first_name)).items
 
     return instances[0]
 
@@ -319,7 +327,7 @@ async def mentor_profile3(
     )
 
     dao = ProfileDAO(dbsession)
-    instances = await dao.filter(first_name=first_name)
+    instances = (await dao.filter(first_name=first_name)).items
 
     return instances[0]
 
@@ -348,7 +356,7 @@ async def mentee_profile(
     )
 
     dao = ProfileDAO(dbsession)
-    instances = await dao.filter(first_name=first_name)
+    instances = (await dao.filter(first_name=first_name)).items
 
     return instances[0]
 
@@ -377,7 +385,7 @@ async def mentee_profile(
     )
 
     dao = ProfileDAO(dbsession)
-    instances = await dao.filter(first_name=first_name)
+    instances = (await dao.filter(first_name=first_name)).items
 
     return instances[0]
 
@@ -406,6 +414,6 @@ async def mentee_profile(
     )
 
     dao = ProfileDAO(dbsession)
-    instances = await dao.filter(first_name=first_name)
+    instances = (await dao.filter(first_name=first_name)).items
 
     return instances[0]
@@ -1,15 +1,40 @@
-from datetime import date, time
+from datetime import date, datetime, time
 from uuid import UUID
 from typing import Optional
 
 from fastapi import Depends
-from sqlalchemy import select
+from sqlalchemy import Select, or_, select
 from sqlalchemy.sql import func
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from startup_forge.db.dao.industry_footprint_dao import IndustryFootprintDAO
 from startup_forge.db.dependencies import get_db_session
 from startup_forge.db.models.booking import TimeSlot, Booking, BookingActivity
 from startup_forge.db.models.options import Day, BookingStatus, BookingStatus2, Role
+from startup_forge.db.pagination import Page, paginate
+from startup_forge.settings import settings
+
+
+def completed_sessions(user_id: UUID) -> Select[tuple[int]]:
+    """
+    Count the completed sessions of a user, as mentee or as mentor.
+
+    :param user_id: id of the user.
+    :return: statement returning the number of sessions.
+    """
+    return (
+        select(func.count())
+        .select_from(Booking)
+        .join(TimeSlot, TimeSlot.id == Booking.time_slot_id)
+        .join(BookingActivity, BookingActivity.booking_id == Booking.id)
+        .where(
+            or_(Booking.user_id == user_id, TimeSlot.user_id == user_id),
+            or_(
+                BookingActivity.mentor_activity == BookingStatus.COMPLETED,
+                BookingActivity.mentee_activity == BookingStatus.COMPLETED,
+            ),
+        )
+    )
 
 
 class BookingDAO:
@@ -17,6 +42,7 @@ class BookingDAO:
 
     def __init__(self, session: AsyncSession = Depends(get_db_session)):
         self.session = session
+        self.footprints = IndustryFootprintDAO(session)
 
     async def create_time_slot(
         self,
@@ -41,6 +67,7 @@ class BookingDAO:
                 end_time=end_time,
             )
         )
+        await self.footprints.refresh_availability(user_id)
 
     async def get_time_slot(
         self,
@@ -111,6 +138,7 @@ class BookingDAO:
         # save
         time_slot.updated_at = func.now()
         self.session.add(time_slot)
+        await self.footprints.refresh_availability(time_slot.user_id)
 
     async def get_time_slot_by_id(
         self,
@@ -139,6 +167,7 @@ class BookingDAO:
         """
         time_slot = await self.get_time_slot_by_id(time_slot_id=time_slot_id)
         await self.session.delete(time_slot)
+        await self.footprints.refresh_availability(time_slot.user_id)
 
     async def create_booking(
         self,
@@ -250,19 +279,26 @@ class BookingDAO:
     async def get_bookings(
         self,
         user_id: UUID,
-    ) -> list[Booking] | None:
+        limit: int = settings.page_size,
+        after: Optional[tuple[datetime, UUID]] = None,
+    ) -> Page[Booking]:
         """
-        Get a bookings.
+        Get a page of the bookings made by or with a user, newest first.
 
         :param user_id: id of the user.
-        :return: a bookings.
-        """
-        booking = await self.session.execute(
-            select(Booking).where(
-                Booking.user_id == user_id or Booking.time_slot.user_id == user_id
-            )
+        :param limit: maximum number of bookings in the page.
+        :param after: keys of the last booking of the previous page.
+        :return: a page of bookings.
+        """
+        return await paginate(
+            self.session,
+            select(Booking)
+            .join(TimeSlot, TimeSlot.id == Booking.time_slot_id)
+            .where(or_(Booking.user_id == user_id, TimeSlot.user_id == user_id)),
+            (Booking.created_at, Booking.id),
+            limit,
+            after,
         )
-        return list(booking.scalars().fetchall())
 
     async def delete_booking(
         self,
@@ -298,25 +334,15 @@ class BookingDAO:
         booking.updated_at = func.now()
         self.session.add(booking)
 
-    async def get_sessions(self, user_id: UUID) -> None:
+    async def get_sessions(self, user_id: UUID) -> int:
         """
         Get the total number of completed sessions.
 
         :param user_id: id of the user.
         :return: total number of completed sessions.
         """
-        bookings = await self.session.execute(
-            select(Booking).where(
-                (Booking.user_id == user_id or Booking.time_slot.user_id == user_id)
-                and (
-                    Booking.booking_activity.mentor_activity == BookingStatus2.COMPLETED
-                    or Booking.booking_activity.mentee_activity
-                    == BookingStatus2.COMPLETED
-                )
-            )
-        )
-
-        return bookings.scalars().fetchall().count()
+        sessions = await self.session.execute(completed_sessions(user_id))
+        return sessions.scalar_one()
 
     async def get_available_sessions(
         self, user_id: UUID
@@ -1,16 +1,60 @@
-from datetime import date, time
+from datetime import date, datetime, time
 from uuid import UUID
-from typing import Optional
+from typing import NamedTuple, Optional
 
 from fastapi import Depends
-from sqlalchemy import select
+from sqlalchemy import (
+    Select,
+    and_,
+    case,
+    delete,
+    exists,
+    literal,
+    or_,
+    select,
+    true,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.sql import func
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql.sqltypes import Uuid
 from pydantic import HttpUrl
 
 from startup_forge.db.dependencies import get_db_session
 from startup_forge.db.models.community import Post, Comment, CommentReply, Repost, Like
+from startup_forge.db.models.connection import Connection
 from startup_forge.db.models.options import Day, BookingStatus, BookingStatus2, Role
+from startup_forge.db.models.timeline import Timeline
+from startup_forge.db.pagination import Page, keyset, paginate
+from startup_forge.db.versions import fetch_version
+from startup_forge.settings import settings
+
+
+class LikeState(NamedTuple):
+    """Whether a user likes a post, and the like count of the post."""
+
+    liked: bool
+    like_count: int
+
+
+class CommentNode(NamedTuple):
+    """A comment of a thread and its replies, oldest first."""
+
+    comment: Comment
+    replies: list["CommentNode"]
+
+
+# Columns a post is versioned on, counters are updated without `updated_at`.
+POST_VERSION = (
+    Post.id,
+    Post.updated_at,
+    Post.like_count,
+    Post.comment_count,
+    Post.repost_count,
+)
 
 
 class CommunityDAO:
@@ -26,21 +70,82 @@ class CommunityDAO:
         files_urls: Optional[list[HttpUrl]] = None,
     ) -> Post:
         """
-        Add single post to session.
+        Add single post to session and push it to the home timelines.
+
+        The post goes to the timeline of its author and, unless the author has
+        more than `timeline_fanout_limit` connections, to the timelines of the
+        author's connections. Posts that are not fanned out are read from
+        their author by `get_home` instead.
 
         :param user_id: id of the user registering the time_slot.
         :param text: post's textual content.
         :param files_urls: urls of files.
         :return: a post.
         """
+        connections = select(Connection.request_from).where(
+            or_(Connection.request_from == user_id, Connection.request_to == user_id)
+        )
+        connection_count = await self.session.scalar(
+            select(func.count()).select_from(
+                connections.limit(settings.timeline_fanout_limit + 1).subquery()
+            )
+        )
         post = Post(
             user_id=user_id,
             text=text,
             files_urls=files_urls,
+            fanned_out=connection_count <= settings.timeline_fanout_limit,
         )
         self.session.add(post)
+        await self.session.flush()  # the timelines need the creation date
+
+        timelines = select(Post.user_id, Post.id, Post.created_at).where(
+            Post.id == post.id
+        )
+        if post.fanned_out:
+            connected = case(
+                (Connection.request_from == user_id, Connection.request_to),
+                else_=Connection.request_from,
+            )
+            timelines = union_all(
+                timelines,
+                select(connected, Post.id, Post.created_at)
+                .join(
+                    Connection,
+                    or_(
+                        Connection.request_from == Post.user_id,
+                        Connection.request_to == Post.user_id,
+                    ),
+                )
+                .where(Post.id == post.id),
+            )
+        await self.session.execute(
+            insert(Timeline)
+            .from_select(["user_id", "post_id", "created_at"], timelines)
+            .on_conflict_do_nothing(),  # users connected both ways
+        )
         return post
 
+    async def _count(
+        self,
+        post_id: UUID,
+        counter: InstrumentedAttribute[int],
+        delta: int,
+    ) -> None:
+        """
+        Add to a counter of a post in the database.
+
+        The addition is done by the database, so that concurrent requests
+        do not overwrite each other's counts.
+
+        :param post_id: post's id.
+        :param counter: counter column of `Post`.
+        :param delta: number to add to the counter.
+        """
+        await self.session.execute(
+            update(Post).where(Post.id == post_id).values({counter: counter + delta})
+        )
+
     async def create_repost(
         self, post_id: UUID, repost_id: Optional[UUID] = None
     ) -> None:
@@ -56,6 +161,7 @@ class CommunityDAO:
                 repost_id=repost_id,
             )
         )
+        await self._count(post_id, Post.repost_count, 1)
 
     async def update_post(self, post_id: UUID, text: str) -> None:
         """
@@ -85,23 +191,193 @@ class CommunityDAO:
 
         return post.scalars().first()
 
+    async def get_feed(
+        self,
+        limit: int = settings.page_size,
+        after: Optional[tuple[datetime, UUID]] = None,
+    ) -> Page[Post]:
+        """
+        Get a page of the posts of the whole community, newest first.
+
+        Pages are read from the `ix_post_created_at` index, so that any page
+        costs the same whatever the number of posts.
+
+        :param limit: maximum number of posts in the page.
+        :param after: keys of the last post of the previous page.
+        :return: a page of posts.
+        """
+        return await paginate(
+            self.session, select(Post), (Post.created_at, Post.id), limit, after
+        )
+
+    async def get_feed_version(
+        self,
+        limit: int = settings.page_size,
+        after: Optional[tuple[datetime, UUID]] = None,
+    ) -> Optional[str]:
+        """
+        Get the version of the page of posts returned by `get_feed`.
+
+        :param limit: maximum number of posts in the page.
+        :param after: keys of the last post of the previous page.
+        :return: fingerprint of the posts, `None` if there are none.
+        """
+        return await fetch_version(
+            self.session,
+            keyset(
+                select(*POST_VERSION),
+                (Post.created_at, Post.id),
+                limit,
+                after,
+            ),
+        )
+
     async def get_posts(
         self,
-        user_id: Optional[UUID] = None,
-    ) -> list[Post] | None:
+        user_id: UUID,
+        limit: int = settings.page_size,
+        after: Optional[tuple[datetime, UUID]] = None,
+    ) -> Page[Post]:
         """
-        Get a posts.
+        Get a page of the posts of a user, newest first.
 
         :param user_id: user's id.
-        :return: a stream of post.
+        :param limit: maximum number of posts in the page.
+        :param after: keys of the last post of the previous page.
+        :return: a page of posts.
         """
-        posts = (
-            await self.session.execute(select(Post))
-            if not user_id
-            else await self.session.execute(select(Post).where(Post.user_id == user_id))
+        return await paginate(
+            self.session,
+            select(Post).where(Post.user_id == user_id),
+            (Post.created_at, Post.id),
+            limit,
+            after,
         )
 
-        return list(posts.scalars().fetchall())
+    async def get_posts_version(
+        self,
+        user_id: UUID,
+        limit: int = settings.page_size,
+        after: Optional[tuple[datetime, UUID]] = None,
+    ) -> Optional[str]:
+        """
+        Get the version of the page of posts returned by `get_posts`.
+
+        :param user_id: user's id.
+        :param limit: maximum number of posts in the page.
+        :param after: keys of the last post of the previous page.
+        :return: fingerprint of the posts, `None` if there are none.
+        """
+        return await fetch_version(
+            self.session,
+            keyset(
+                select(*POST_VERSION).where(Post.user_id == user_id),
+                (Post.created_at, Post.id),
+                limit,
+                after,
+            ),
+        )
+
+    def _home_ids(
+        self,
+        user_id: UUID,
+        limit: int,
+        after: Optional[tuple[datetime, UUID]],
+    ) -> Select[tuple[UUID]]:
+        """
+        Select the ids of the posts of a page of the home feed of a user.
+
+        Fanned out posts are read from the timeline of the user. Only the
+        posts that were not fanned out, those of authors over the fan-out
+        limit, are pulled from the `ix_post_user_id_created_at_pulled` index
+        of the connections of the user, and only when published after the
+        connection was accepted. Both reads are limited to the page, so their
+        union never exceeds twice its size.
+
+        :param user_id: user's id.
+        :param limit: maximum number of posts in the page.
+        :param after: keys of the last post of the previous page.
+        :return: statement selecting the ids.
+        """
+        pushed = keyset(
+            select(Timeline.post_id).where(Timeline.user_id == user_id),
+            (Timeline.created_at, Timeline.post_id),
+            limit,
+            after,
+        ).subquery()
+        pulled = keyset(
+            select(Post.id)
+            .join(
+                Connection,
+                or_(
+                    and_(
+                        Connection.request_from == user_id,
+                        Connection.request_to == Post.user_id,
+                    ),
+                    and_(
+                        Connection.request_to == user_id,
+                        Connection.request_from == Post.user_id,
+                    ),
+                ),
+            )
+            .where(
+                ~Post.fanned_out,
+                Post.created_at >= Connection.accepted_at,
+            ),
+            (Post.created_at, Post.id),
+            limit,
+            after,
+        ).subquery()
+        return union_all(select(pushed.c.post_id), select(pulled.c.id))
+
+    async def get_home(
+        self,
+        user_id: UUID,
+        limit: int = settings.page_size,
+        after: Optional[tuple[datetime, UUID]] = None,
+    ) -> Page[Post]:
+        """
+        Get a page of the home feed of a user, newest first.
+
+        The home feed holds the posts of the user and of the user's
+        connections, published while they were connected.
+
+        :param user_id: user's id.
+        :param limit: maximum number of posts in the page.
+        :param after: keys of the last post of the previous page.
+        :return: a page of posts.
+        """
+        return await paginate(
+            self.session,
+            select(Post).where(Post.id.in_(self._home_ids(user_id, limit, after))),
+            (Post.created_at, Post.id),
+            limit,
+        )
+
+    async def get_home_version(
+        self,
+        user_id: UUID,
+        limit: int = settings.page_size,
+        after: Optional[tuple[datetime, UUID]] = None,
+    ) -> Optional[str]:
+        """
+        Get the version of the page of posts returned by `get_home`.
+
+        :param user_id: user's id.
+        :param limit: maximum number of posts in the page.
+        :param after: keys of the last post of the previous page.
+        :return: fingerprint of the posts, `None` if there are none.
+        """
+        return await fetch_version(
+            self.session,
+            keyset(
+                select(*POST_VERSION).where(
+                    Post.id.in_(self._home_ids(user_id, limit, after))
+                ),
+                (Post.created_at, Post.id),
+                limit,
+            ),
+        )
 
     async def delete_post(
         self,
@@ -114,6 +390,14 @@ class CommunityDAO:
         """
         post = await self.get_post(post_id=post_id)
 
+        # the reposts of the post go with it
+        await self.session.execute(
+            update(Post)
+            .where(
+                Post.id.in_(select(Repost.post_id).where(Repost.repost_id == post_id))
+            )
+            .values(repost_count=Post.repost_count - 1)
+        )
         await self.session.delete(post)
 
     async def create_comment(
@@ -135,6 +419,7 @@ class CommunityDAO:
             post_id=post_id,
         )
         self.session.add(comment)
+        await self._count(post_id, Post.comment_count, 1)
         return comment
 
     async def create_reply(
@@ -186,34 +471,110 @@ class CommunityDAO:
     async def get_comments(
         self,
         post_id: UUID,
-    ) -> list[Comment] | None:
+        limit: int = settings.page_size,
+        after: Optional[tuple[datetime, UUID]] = None,
+    ) -> Page[Comment]:
         """
-        Get a comments.
+        Get a page of the comments of a post, newest first.
 
         :param post_id: original post's id.
-        :return: a stream of comments.
+        :param limit: maximum number of comments in the page.
+        :param after: keys of the last comment of the previous page.
+        :return: a page of comments.
         """
-        comments = await self.session.execute(
-            select(Comment).where(Comment.post_id == post_id)
+        return await paginate(
+            self.session,
+            select(Comment).where(Comment.post_id == post_id),
+            (Comment.created_at, Comment.id),
+            limit,
+            after,
         )
 
-        return list(comments.scalars().fetchall())
-
     async def get_my_comments(
         self,
         user_id: UUID,
-    ) -> list[Comment] | None:
+        limit: int = settings.page_size,
+        after: Optional[tuple[datetime, UUID]] = None,
+    ) -> Page[Comment]:
         """
-        Get a comments.
+        Get a page of the comments of a user, newest first.
 
         :param user_id: user's id.
-        :return: a stream of comments.
+        :param limit: maximum number of comments in the page.
+        :param after: keys of the last comment of the previous page.
+        :return: a page of comments.
         """
-        comments = await self.session.execute(
-            select(Comment).where(Comment.user_id == user_id)
+        return await paginate(
+            self.session,
+            select(Comment).where(Comment.user_id == user_id),
+            (Comment.created_at, Comment.id),
+            limit,
+            after,
         )
 
-        return list(comments.scalars().fetchall())
+    async def get_thread(
+        self,
+        post_id: UUID,
+        max_depth: int = settings.thread_max_depth,
+        max_replies: int = settings.thread_max_replies,
+    ) -> list[CommentNode]:
+        """
+        Get the comments of a post as a tree of replies.
+
+        The whole tree is selected by one recursive query walking
+        `comment_reply` from the comments that reply to no other comment,
+        then assembled in a single pass over the rows.
+
+        :param post_id: original post's id.
+        :param max_depth: maximum number of levels of the tree.
+        :param max_replies: maximum number of replies kept per comment, and of
+            comments at the top of the tree, the oldest ones.
+        :return: comments of the post that reply to no other comment.
+        """
+        top = (
+            select(
+                Comment.id,
+                literal(None, Uuid()).label("parent_id"),
+                literal(0).label("depth"),
+            )
+            .where(
+                Comment.post_id == post_id,
+                ~exists().where(CommentReply.reply_id == Comment.id),
+            )
+            .order_by(Comment.created_at, Comment.id)
+            .limit(max_replies)
+            .subquery()
+        )
+        thread = select(top).cte("thread", recursive=True)
+        replies = (
+            select(CommentReply.reply_id, CommentReply.comment_id)
+            .join(Comment, Comment.id == CommentReply.reply_id)
+            .where(CommentReply.comment_id == thread.c.id)
+            .order_by(Comment.created_at, Comment.id)
+            .limit(max_replies)
+            .lateral("replies")
+        )
+        thread = thread.union_all(
+            select(replies.c.reply_id, replies.c.comment_id, thread.c.depth + 1)
+            .join_from(thread, replies, true())
+            .where(thread.c.depth < max_depth - 1),
+        )
+        rows = await self.session.execute(
+            select(Comment, thread.c.parent_id)
+            .join(thread, Comment.id == thread.c.id)
+            .order_by(thread.c.depth, Comment.created_at, Comment.id),
+        )
+
+        roots: list[CommentNode] = []
+        nodes: dict[UUID, CommentNode] = {}
+        for comment, parent_id in rows.tuples():
+            node = CommentNode(comment, [])
+            nodes[comment.id] = node
+            if parent_id is None:
+                roots.append(node)
+            else:
+                nodes[parent_id].replies.append(node)
+        return roots
 
     async def delete_comment(
         self,
@@ -227,24 +588,53 @@ class CommunityDAO:
         comment = await self.get_comment(comment_id=comment_id)
 
         await self.session.delete(comment)
+        await self._count(comment.post_id, Post.comment_count, -1)
 
-    async def like_unlike(self, post_id: UUID, user_id: UUID) -> None:
+    async def like_unlike(self, post_id: UUID, user_id: UUID) -> Optional[LikeState]:
         """
-        Like and unlike a comment
+        Like and unlike a post in a single statement.
+
+        The like is deleted if it exists and inserted otherwise, and the like
+        counter of the post is moved accordingly, by one statement on the
+        primary key of `like`. Concurrent toggles of the same like wait on
+        each other, and one that finds the like inserted meanwhile leaves it.
 
         :param post_id: original post id.
         :param user_id: user's id.
+        :return: whether the user likes the post and its like count, `None`
+            if the post does not exist.
         """
-        like = await self.get_like(post_id=post_id, user_id=user_id)
-        if like:
-            await self.session.delete(like)  # unlike
-            return
-        self.session.add(
-            Like(
-                post_id=post_id,
-                user_id=user_id,
+        deleted = (
+            delete(Like)
+            .where(Like.post_id == post_id, Like.user_id == user_id)
+            .returning(Like.post_id)
+            .cte("deleted")
+        )
+        was_liked = exists(select(deleted.c.post_id))
+        inserted = (
+            insert(Like)
+            .from_select(
+                ["user_id", "post_id"],
+                select(literal(user_id, Uuid()), Post.id).where(
+                    Post.id == post_id, ~was_liked
+                ),
+            )
+            .on_conflict_do_nothing()
+            .returning(Like.post_id)
+            .cte("inserted")
+        )
+        row = await self.session.execute(
+            update(Post)
+            .where(Post.id == post_id)
+            .values(
+                like_count=Post.like_count
+                + select(func.count()).select_from(inserted).scalar_subquery()
+                - select(func.count()).select_from(deleted).scalar_subquery()
             )
+            .returning(~was_liked, Post.like_count),
         )
+        state = row.one_or_none()
+        return LikeState(*state) if state else None
 
     async def get_like(self, post_id: UUID, user_id: UUID) -> Like | None:
         """
@@ -256,7 +646,7 @@ class CommunityDAO:
         """
 
         like = await self.session.execute(
-            select(Like).where(Like.post_id == post_id and Like.user_id == user_id)
+            select(Like).where(Like.post_id == post_id, Like.user_id == user_id)
         )
 
         return like.scalars().first()
@@ -1,15 +1,17 @@
-from datetime import date
+from datetime import date, datetime
 from uuid import UUID
 from typing import Optional
 
 from fastapi import Depends
-from sqlalchemy import select
+from sqlalchemy import or_, select
 from sqlalchemy.sql import func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from startup_forge.db.dependencies import get_db_session
 from startup_forge.db.models.connection import Connection, ConnectionRequest
 from startup_forge.db.models.options import ConnectionRequestStatus
+from startup_forge.db.pagination import Page, paginate
+from startup_forge.settings import settings
 
 
 class ConnectionDAO:
@@ -64,19 +66,25 @@ class ConnectionDAO:
     async def get_requests(
         self,
         user_id: UUID,
-    ) -> list[ConnectionRequest] | None:
+        limit: int = settings.page_size,
+        after: Optional[tuple[datetime, UUID]] = None,
+    ) -> Page[ConnectionRequest]:
         """
-        Get a stream of connection requests education.
+        Get a page of the connection requests sent to a user, newest first.
 
         :param user_id: id of the user.
-        :return: stream of connection_request.
+        :param limit: maximum number of requests in the page.
+        :param after: date and sender of the last request of the previous page.
+        :return: a page of connection requests.
         """
-        requests = await self.session.execute(
+        return await paginate(
+            self.session,
             select(ConnectionRequest).where(ConnectionRequest.request_to == user_id),
+            (ConnectionRequest.requested_at, ConnectionRequest.request_from),
+            limit,
+            after,
         )
 
-        return list(requests.scalars().fetchall())
-
     async def accept_request(self, request_from: UUID, request_to: UUID) -> None:
         """
         Change the status of a connect_request to ACCEPTED.
@@ -124,23 +132,24 @@ class ConnectionDAO:
     async def get_connections(
         self,
         user_id: UUID,
-    ) -> list[UUID] | None:
+    ) -> list[UUID]:
         """
-        Get a stream of connections.
+        Get the ids of the users connected to a user.
 
         :param user_id: id of the user.
-        :return: stream of connection.
+        :return: ids of the connected users.
         """
-        requests = await self.session.execute(
-            select(ConnectionRequest).where(
-                ConnectionRequest.request_to == user_id
-                or ConnectionRequest.request_from == user_id
+        rows = await self.session.execute(
+            select(Connection.request_from, Connection.request_to).where(
+                or_(
+                    Connection.request_to == user_id,
+                    Connection.request_from == user_id,
+                )
             ),
         )
-
-        connections = list(requests.scalars().fetchall())
-
-        connections_ids = [connection.request_from for connection in connections]
-        connections_ids.extend([connection.request_to for connection in connections])
-        connections_ids = list(set(connections_ids)).remove(user_id)
-        return connections_ids
+        return list(
+            dict.fromkeys(
+                request_to if request_from == user_id else request_from
+                for request_from, request_to in rows.tuples()
+            )
+        )
@@ -1,4 +1,4 @@
-from datetime import date
+from datetime import date, datetime
 from uuid import UUID
 from typing import Optional
 
@@ -10,6 +10,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from startup_forge.db.dependencies import get_db_session
 from startup_forge.db.models.education import Education
 from startup_forge.db.models.options import Industry
+from startup_forge.db.pagination import Page, paginate
+from startup_forge.db.versions import fetch_version
+from startup_forge.settings import settings
 
 
 class EducationDAO:
@@ -93,6 +96,34 @@ class EducationDAO:
         education.updated_at = func.now()
         self.session.add(education)
 
+    async def get_education_version(self, education_id: UUID) -> Optional[str]:
+        """
+        Get the version of a particular education.
+
+        :param education_id: id of the education.
+        :return: fingerprint of the education, `None` if it does not exist.
+        """
+        return await fetch_version(
+            self.session,
+            select(Education.id, Education.updated_at).where(
+                Education.id == education_id,
+            ),
+        )
+
+    async def get_educations_version(self, user_id: UUID) -> Optional[str]:
+        """
+        Get the version of a user's educations.
+
+        :param user_id: id of the user.
+        :return: fingerprint of the educations, `None` if there are none.
+        """
+        return await fetch_version(
+            self.session,
+            select(Education.id, Education.updated_at).where(
+                Education.user_id == user_id,
+            ),
+        )
+
     async def get_education(self, education_id: UUID) -> Education | None:
         """
         Get a particular education.
@@ -145,15 +176,20 @@ class EducationDAO:
     async def filter(
         self,
         institution_name: Optional[str] = None,
-    ) -> list[Education] | None:
+        limit: int = settings.page_size,
+        after: Optional[tuple[datetime, UUID]] = None,
+    ) -> Page[Education]:
         """
-        Get specific ducation.
+        Get a page of educations, newest first.
 
         :param institution_name: name of institution.
-        :return: Educations.
+        :param limit: maximum number of educations in the page.
+        :param after: keys of the last education of the previous page.
+        :return: a page of educations.
         """
         query = select(Education)
         if institution_name:
             query = query.where(Education.institution_name == institution_name)
-        rows = await self.session.execute(query)
-        return list(rows.scalars().fetchall())
+        return await paginate(
+            self.session, query, (Education.created_at, Education.id), limit, after
+        )
@@ -1,4 +1,4 @@
-from datetime import date
+from datetime import date, datetime
 from uuid import UUID
 from typing import List, Optional
 
@@ -7,9 +7,13 @@ from sqlalchemy import select
 from sqlalchemy.sql import func
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from startup_forge.db.dao.industry_footprint_dao import IndustryFootprintDAO
 from startup_forge.db.dependencies import get_db_session
 from startup_forge.db.models.experience import Experience
 from startup_forge.db.models.options import Role, Industry
+from startup_forge.db.pagination import Page, paginate
+from startup_forge.db.versions import fetch_version
+from startup_forge.settings import settings
 
 
 class ExperienceDAO:
@@ -17,6 +21,7 @@ class ExperienceDAO:
 
     def __init__(self, session: AsyncSession = Depends(get_db_session)):
         self.session = session
+        self.footprints = IndustryFootprintDAO(session)
 
     async def create_experience(
         self,
@@ -47,6 +52,9 @@ class ExperienceDAO:
                 industry=industry,
             )
         )
+        await self.footprints.add_industry(
+            user_id=user_id, industry=industry, current=end_date is None
+        )
 
     async def get_experiences(self, user_id: UUID) -> list[Experience] | None:
         """
@@ -61,6 +69,34 @@ class ExperienceDAO:
 
         return list(profile.scalars().fetchall())
 
+    async def get_experiences_version(self, user_id: UUID) -> Optional[str]:
+        """
+        Get the version of the experiences of a user.
+
+        :param user_id: id of the user.
+        :return: fingerprint of the experiences, `None` if there are none.
+        """
+        return await fetch_version(
+            self.session,
+            select(Experience.id, Experience.updated_at).where(
+                Experience.user_id == user_id,
+            ),
+        )
+
+    async def get_experience_version(self, experience_id: UUID) -> Optional[str]:
+        """
+        Get the version of a particular experience.
+
+        :param experience_id: id of the experience.
+        :return: fingerprint of the experience, `None` if it does not exist.
+        """
+        return await fetch_version(
+            self.session,
+            select(Experience.id, Experience.updated_at).where(
+                Experience.id == experience_id,
+            ),
+        )
+
     async def get_experience(self, experience_id: UUID) -> Experience | None:
         """
         Get a particular experience.
@@ -109,6 +145,7 @@ class ExperienceDAO:
         # save experience
         experience.updated_at = func.now()
         self.session.add(experience)
+        await self.footprints.refresh(experience.user_id)
 
     async def delete_experience(self, experience_id: UUID) -> None:
         """
@@ -122,6 +159,7 @@ class ExperienceDAO:
 
         # delete experience
         await self.session.delete(experience)
+        await self.footprints.refresh(experience.user_id)
 
     async def delete_experiences(self, experiences: list[Experience]) -> None:
         """
@@ -131,19 +169,26 @@ class ExperienceDAO:
         """
         for experience in experiences:
             await self.session.delete(experience)  # delete experience
+        for user_id in {experience.user_id for experience in experiences}:
+            await self.footprints.refresh(user_id)
 
     async def filter(
         self,
         company_name: Optional[str] = None,
-    ) -> list[Experience] | None:
+        limit: int = settings.page_size,
+        after: Optional[tuple[datetime, UUID]] = None,
+    ) -> Page[Experience]:
         """
-        Get specific experience.
+        Get a page of experiences, newest first.
 
         :param company_name: name of company.
-        :return: experiences.
+        :param limit: maximum number of experiences in the page.
+        :param after: keys of the last experience of the previous page.
+        :return: a page of experiences.
         """
         query = select(Experience)
         if company_name:
             query = query.where(Experience.company_name == company_name)
-        rows = await self.session.execute(query)
-        return list(rows.scalars().fetchall())
+        return await paginate(
+            self.session, query, (Experience.created_at, Experience.id), limit, after
+        )
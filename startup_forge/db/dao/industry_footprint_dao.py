@@ -0,0 +1,145 @@
+from uuid import UUID
+
+from fastapi import Depends
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import func
+
+from startup_forge.db.dependencies import get_db_session
+from startup_forge.db.models.booking import TimeSlot
+from startup_forge.db.models.experience import Experience
+from startup_forge.db.models.industry_footprint import IndustryFootprint
+from startup_forge.db.models.options import Industry
+from startup_forge.services.matching import (
+    INDUSTRY_BITS,
+    availability_mask,
+    industry_mask,
+    mentor_set_version,
+)
+
+
+class IndustryFootprintDAO:
+    """
+    Class for accessing industry_footprint table.
+
+    Footprints do not record roles, so every change invalidates cached
+    matches.
+    """
+
+    def __init__(self, session: AsyncSession = Depends(get_db_session)):
+        self.session = session
+
+    async def add_industry(
+        self,
+        user_id: UUID,
+        industry: Industry,
+        current: bool,
+    ) -> None:
+        """
+        Add an industry to a user's footprint without reading it.
+
+        :param user_id: id of the user.
+        :param industry: industry of the new experience.
+        :param current: whether the experience is still ongoing.
+        """
+        bit = INDUSTRY_BITS[industry]
+        query = insert(IndustryFootprint).values(
+            user_id=user_id,
+            industries=bit,
+            current_industries=bit if current else 0,
+        )
+        excluded = query.excluded
+        await self.session.execute(
+            query.on_conflict_do_update(
+                index_elements=[IndustryFootprint.user_id],
+                set_={
+                    "industries": IndustryFootprint.industries.op("|")(
+                        excluded.industries
+                    ),
+                    "current_industries": IndustryFootprint.current_industries.op("|")(
+                        excluded.current_industries
+                    ),
+                    "updated_at": func.now(),
+                },
+            )
+        )
+        mentor_set_version.bump_on_commit(self.session)
+
+    async def refresh(self, user_id: UUID) -> None:
+        """
+        Recompute a user's footprint from their experiences.
+
+        Used when an experience is changed or removed, since a bit can only
+        be cleared once no other experience shares the industry.
+
+        :param user_id: id of the user.
+        """
+        await self.session.flush()  # make pending experience changes visible
+        rows = await self.session.execute(
+            select(Experience.industry, Experience.end_date).where(
+                Experience.user_id == user_id
+            )
+        )
+        experiences = list(rows.tuples())
+        industries = industry_mask(industry for industry, _ in experiences)
+        current_industries = industry_mask(
+            industry for industry, end_date in experiences if end_date is None
+        )
+
+        query = insert(IndustryFootprint).values(
+            user_id=user_id,
+            industries=industries,
+            current_industries=current_industries,
+        )
+        await self.session.execute(
+            query.on_conflict_do_update(
+                index_elements=[IndustryFootprint.user_id],
+                set_={
+                    "industries": query.excluded.industries,
+                    "current_industries": query.excluded.current_industries,
+                    "updated_at": func.now(),
+                },
+            )
+        )
+        mentor_set_version.bump_on_commit(self.session)
+
+    async def refresh_availability(self, user_id: UUID) -> None:
+        """
+        Recompute a user's availability from their time slots.
+
+        :param user_id: id of the user.
+        """
+        await self.session.flush()  # make pending time slot changes visible
+        rows = await self.session.execute(
+            select(TimeSlot.day, TimeSlot.start_time, TimeSlot.end_time).where(
+                TimeSlot.user_id == user_id
+            )
+        )
+        query = insert(IndustryFootprint).values(
+            user_id=user_id,
+            availability=availability_mask(rows.tuples()),
+        )
+        await self.session.execute(
+            query.on_conflict_do_update(
+                index_elements=[IndustryFootprint.user_id],
+                set_={
+                    "availability": query.excluded.availability,
+                    "updated_at": func.now(),
+                },
+            )
+        )
+        mentor_set_version.bump_on_commit(self.session)
+
+    async def get_footprint(self, user_id: UUID) -> IndustryFootprint | None:
+        """
+        Get a user's footprint.
+
+        :param user_id: id of the user.
+        :return: the footprint, if the user has ever recorded an experience.
+        """
+        footprint = await self.session.execute(
+            select(IndustryFootprint).where(IndustryFootprint.user_id == user_id)
+        )
+
+        return footprint.scalars().first()
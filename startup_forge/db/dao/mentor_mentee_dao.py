@@ -2,17 +2,32 @@ from uuid import UUID
 from typing import List, Optional
 
 from fastapi import Depends
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import func
 
+from startup_forge.db.dao.industry_footprint_dao import IndustryFootprintDAO
+from startup_forge.db.dao.mentor_recommendation_dao import MentorRecommendationDAO
 from startup_forge.db.dependencies import get_db_session
 from startup_forge.db.models.profile import Profile
 from startup_forge.db.dao.profile_dao import ProfileDAO
 from startup_forge.db.models.mentor_mentee import MentorMentee
 from startup_forge.db.models.mentor_mentee_history import MentorMenteeHistory
-from startup_forge.db.models.experience import Experience
-from startup_forge.db.models.options import Role, RelatedIndustry
+from startup_forge.db.models.industry_footprint import IndustryFootprint
+from startup_forge.db.models.options import Role
+from startup_forge.services.assignment import assign_mentees
+from startup_forge.services.matching import (
+    MatchFeatures,
+    MentorIndex,
+    match_cache,
+    mentor_set_version,
+    profile_features,
+    top_matches,
+)
+
+# Key of the advisory lock serializing cohort assignments, which all draw on
+# the same mentor capacities.
+ASSIGNMENT_LOCK = 0x6D656E746F72
 
 
 class MentorMenteeDAO:
@@ -20,6 +35,9 @@ class MentorMenteeDAO:
 
     def __init__(self, session: AsyncSession = Depends(get_db_session)):
         self.session = session
+        self.profiles = ProfileDAO(session)
+        self.footprints = IndustryFootprintDAO(session)
+        self.recommendations = MentorRecommendationDAO(session)
 
     async def create_match(self, user_id: UUID, mentor_id: UUID) -> None:
         """
@@ -73,59 +91,210 @@ class MentorMenteeDAO:
         )
         return list(mentor_mentees.scalars().fetchall())
 
+    async def get_features(
+        self,
+        role: Role,
+        user_ids: Optional[list[UUID]] = None,
+    ) -> list[tuple[UUID, MatchFeatures]]:
+        """
+        Get the matching bitmasks of every user with a role.
+
+        Mentors are matched on every industry they have worked in, mentees on
+        the industries they currently work in.
+
+        :param role: role of the users.
+        :param user_ids: only get these users, if given.
+        :return: list of user id and bitmasks.
+        """
+        industries = (
+            IndustryFootprint.industries
+            if role == Role.MENTOR
+            else IndustryFootprint.current_industries
+        )
+        query = (
+            select(
+                Profile.user_id,
+                func.coalesce(industries, 0),
+                Profile.skills_mask,
+                Profile.expertises_mask,
+                Profile.languages_mask,
+                func.coalesce(IndustryFootprint.availability, 0),
+            )
+            .outerjoin(IndustryFootprint, IndustryFootprint.user_id == Profile.user_id)
+            .where(Profile.role == role)
+        )
+        if user_ids is not None:
+            query = query.where(Profile.user_id.in_(user_ids))
+        rows = await self.session.execute(query)
+        return [(user_id, MatchFeatures(*row)) for user_id, *row in rows.tuples()]
+
     async def match_mentees_to_mentors(
-        self, mentee: Profile
+        self,
+        mentee: Profile,
+        limit: int,
+        min_score: float = 0.0,
+        after: Optional[tuple[float, UUID]] = None,
     ) -> list[tuple[Profile, float]]:
         """
-        Get compatible mentors for a mentee
+        Get the most compatible mentors for a mentee
+
+        Rankings are cached per mentee bitmasks and mentor set version, see
+        `startup_forge.services.matching.match_cache`. On a miss,
+        recommendations precomputed by `startup_forge.jobs.recommendations`
+        are served when they are newer than the mentee's profile and
+        footprint, unless the page goes past the `recommendation_count`
+        mentors stored per mentee. Otherwise mentor bitmasks are fetched in a
+        single query and scored in memory.
+        Only the profiles of the selected mentors are loaded.
 
         :param mentee: profile of mentee
-        :return: list of tuple comprised of the profile data and a compatibility percentage
+        :param limit: maximum number of mentors to return.
+        :param min_score: minimum compatibility of a returned mentor.
+        :param after: compatibility and id of the last mentor of the previous page.
+        :return: list of tuple comprised of the profile data and a compatibility percentage,
+            most compatible first
         """
-        mentors = await self.session.execute(
-            select(Profile).where(Profile.role == Role.MENTOR)
-        )  # get all mentors
-        mentors = list(mentors.scalars().fetchall())
+        mentee_footprint = await self.footprints.get_footprint(mentee.user_id)
+        mentee_features = profile_features(
+            mentee.skills,
+            mentee.expertises,
+            mentee.languages,
+            industries=mentee_footprint.current_industries if mentee_footprint else 0,
+            availability=mentee_footprint.availability if mentee_footprint else 0,
+        )
+        key = (mentee_features, mentor_set_version.value, limit, min_score, after)
+        ranking = match_cache.get(key)
+        if ranking is None:
+            computed_at = await self.recommendations.get_computed_at(mentee.user_id)
+            # Skills, expertises and languages are stored on the profile.
+            if (
+                computed_at is not None
+                and mentee.updated_at <= computed_at
+                and (
+                    mentee_footprint is None
+                    or mentee_footprint.updated_at <= computed_at
+                )
+            ):
+                ranking = await self.recommendations.get_recommendations(
+                    mentee.user_id, limit, min_score=min_score, after=after
+                )
+                # A short page may have reached the end of the stored window,
+                # scoring every mentor continues it in the same order.
+                if len(ranking) < limit and await self.recommendations.is_truncated(
+                    mentee.user_id
+                ):
+                    ranking = None
+            if ranking is None:
+                ranking = await self._rank_mentors(
+                    mentee_features, limit, min_score=min_score, after=after
+                )
+            match_cache.set(key, ranking)
+        if not ranking:
+            return []
 
-        # Calculate compatibility percentage based on industry match
-        matches: list[tuple[Profile, float]] = []
+        profiles = await self.profiles.get_profiles(
+            mentor_id for mentor_id, _ in ranking
+        )
+        mentors = {
+            profile.user_id: profile
+            for profile in profiles
+            if profile.role == Role.MENTOR
+        }
+        return [
+            (mentors[mentor_id], score)
+            for mentor_id, score in ranking
+            if mentor_id in mentors
+        ]
 
-        mentee_experiences = await self.session.execute(
-            select(Experience).where(
-                Experience.user_id == mentee.user_id and Experience.end_date == None
-            )
+    async def _rank_mentors(
+        self,
+        mentee_features: MatchFeatures,
+        limit: int,
+        min_score: float = 0.0,
+        after: Optional[tuple[float, UUID]] = None,
+    ) -> list[tuple[UUID, float]]:
+        """
+        Score every mentor against a mentee.
+
+        :param mentee_features: bitmasks of the mentee.
+        :param limit: maximum number of mentors to return.
+        :param min_score: minimum compatibility of a returned mentor.
+        :param after: compatibility and id of the last mentor of the previous page.
+        :return: list of tuple comprised of the mentor id and a compatibility percentage,
+            most compatible first
+        """
+        index = MentorIndex()
+        for mentor_id, features in await self.get_features(Role.MENTOR):
+            index.add(mentor_id, features)
+
+        # Calculate compatibility percentage based on the weighted factors
+        scores = index.scores(mentee_features)
+        selected = top_matches(
+            index.mentor_ids, scores, limit, min_score=min_score, after=after
         )
-        mentee_experiences = mentee_experiences.scalars().fetchall()
+        return [(index.mentor_ids[position], scores[position]) for position in selected]
 
-        for mentor in mentors:
-            mentor_experiences = await self.session.execute(
-                select(Experience).where(Experience.user_id == mentor.user_id)
-            )
-            mentor_experiences = list(mentor_experiences.scalars().fetchall())
+    async def assign_cohort(
+        self,
+        mentee_ids: list[UUID],
+        capacity: int,
+        candidates: int,
+    ) -> dict[UUID, UUID]:
+        """
+        Assign a cohort of mentees to mentors in one pass.
 
-            common_industries = set(exp.industry for exp in mentor_experiences) & set(
-                mentee_exp.industry for mentee_exp in mentee_experiences
-            )
+        Every mentee ranks their `candidates` most compatible mentors among
+        those with room left, then mentees are assigned with deferred
+        acceptance, see `startup_forge.services.assignment`. Mentees who
+        already have a mentor are skipped. All matches are inserted at once.
+        Assignments are serialized by a transaction level advisory lock, so
+        that concurrent runs do not fill the same free places.
 
-            related_industries = []
-            related_industries.extend(
-                RelatedIndustry[mentor_exp.industry.name]
-                for mentor_exp in mentor_experiences
+        :param mentee_ids: ids of the mentees of the cohort.
+        :param capacity: maximum number of mentees of a mentor, current ones included.
+        :param candidates: number of mentors every mentee ranks.
+        :return: mentor id per assigned mentee id.
+        """
+        await self.session.execute(select(func.pg_advisory_xact_lock(ASSIGNMENT_LOCK)))
+        loads = await self.session.execute(
+            select(MentorMentee.mentor_id, func.count()).group_by(
+                MentorMentee.mentor_id
             )
-            related_industries = set(related_industries[0])
+        )
+        capacities = {mentor_id: capacity - load for mentor_id, load in loads.tuples()}
+        matched = await self.session.execute(
+            select(MentorMentee.mentee_id).where(MentorMentee.mentee_id.in_(mentee_ids))
+        )
+        matched_ids = set(matched.scalars())
 
-            mentee_related_industries = []
-            mentee_related_industries.extend(
-                RelatedIndustry[mentee_exp.industry.name]
-                for mentee_exp in mentee_experiences
-            )
-            common_related_industries = related_industries & set(
-                mentee_related_industries[0]
-            )
+        index = MentorIndex()
+        for mentor_id, features in await self.get_features(Role.MENTOR):
+            capacities.setdefault(mentor_id, capacity)
+            if capacities[mentor_id] > 0:
+                index.add(mentor_id, features)
 
-            compatibility = (
-                len(common_industries) + len(common_related_industries)
-            ) / (len(mentee_experiences) * 2)
-            matches.append((mentor, compatibility))
+        rankings: dict[MatchFeatures, list[tuple[UUID, float]]] = {}
+        preferences = {}
+        for mentee_id, features in await self.get_features(
+            Role.MENTEE, user_ids=mentee_ids
+        ):
+            if mentee_id in matched_ids:
+                continue
+            if features not in rankings:  # mentees sharing bitmasks share rankings
+                scores = index.scores(features)
+                rankings[features] = [
+                    (index.mentor_ids[position], scores[position])
+                    for position in top_matches(index.mentor_ids, scores, candidates)
+                ]
+            preferences[mentee_id] = rankings[features]
 
-        return matches
+        assignments = assign_mentees(preferences, capacities)
+        if assignments:
+            await self.session.execute(
+                insert(MentorMentee),
+                [
+                    {"mentee_id": mentee_id, "mentor_id": mentor_id}
+                    for mentee_id, mentor_id in assignments.items()
+                ],
+            )
+        return assignments
@@ -0,0 +1,128 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from fastapi import Depends
+from sqlalchemy import and_, delete, insert, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import func
+
+from startup_forge.db.dependencies import get_db_session
+from startup_forge.db.models.mentor_recommendation import MentorRecommendation
+from startup_forge.db.models.options import Role
+from startup_forge.db.models.profile import Profile
+
+
+class MentorRecommendationDAO:
+    """Class for accessing mentor_recommendation table."""
+
+    def __init__(self, session: AsyncSession = Depends(get_db_session)):
+        self.session = session
+
+    async def get_computed_at(self, mentee_id: UUID) -> Optional[datetime]:
+        """
+        Get when a mentee's recommendations were computed.
+
+        :param mentee_id: id of the mentee.
+        :return: time of computation, `None` if nothing is stored.
+        """
+        return await self.session.scalar(
+            select(func.min(MentorRecommendation.computed_at)).where(
+                MentorRecommendation.mentee_id == mentee_id
+            )
+        )
+
+    async def is_truncated(self, mentee_id: UUID) -> bool:
+        """
+        Tell whether a mentee's stored recommendations leave mentors out.
+
+        The job only stores the best `recommendation_count` mentors of every
+        mentee, pages past them must be scored.
+
+        :param mentee_id: id of the mentee.
+        :return: whether fewer mentors are stored than there are mentors.
+        """
+        stored = (
+            select(func.count())
+            .where(MentorRecommendation.mentee_id == mentee_id)
+            .scalar_subquery()
+        )
+        mentors = (
+            select(func.count())
+            .select_from(Profile)
+            .where(Profile.role == Role.MENTOR)
+            .scalar_subquery()
+        )
+        return bool(await self.session.scalar(select(stored < mentors)))
+
+    async def get_recommendations(
+        self,
+        mentee_id: UUID,
+        limit: int,
+        min_score: float = 0.0,
+        after: Optional[tuple[float, UUID]] = None,
+    ) -> list[tuple[UUID, float]]:
+        """
+        Get a page of a mentee's stored recommendations.
+
+        :param mentee_id: id of the mentee.
+        :param limit: maximum number of mentors to return.
+        :param min_score: minimum compatibility of a returned mentor.
+        :param after: compatibility and id of the last mentor of the previous page.
+        :return: list of tuple comprised of the mentor id and a compatibility percentage,
+            most compatible first
+        """
+        query = (
+            select(MentorRecommendation.mentor_id, MentorRecommendation.score)
+            .join(Profile, Profile.user_id == MentorRecommendation.mentor_id)
+            .where(
+                MentorRecommendation.mentee_id == mentee_id,
+                MentorRecommendation.score >= min_score,
+                Profile.role == Role.MENTOR,
+            )
+            .order_by(MentorRecommendation.rank)
+            .limit(limit)
+        )
+        if after is not None:
+            after_score, after_id = after
+            query = query.where(
+                or_(
+                    MentorRecommendation.score < after_score,
+                    and_(
+                        MentorRecommendation.score == after_score,
+                        MentorRecommendation.mentor_id > after_id,
+                    ),
+                )
+            )
+        rows = await self.session.execute(query)
+        return list(rows.tuples())
+
+    async def replace_recommendations(
+        self,
+        recommendations: dict[UUID, list[tuple[UUID, float]]],
+        computed_at: datetime,
+    ) -> None:
+        """
+        Replace the stored recommendations of mentees.
+
+        :param recommendations: ranked mentor ids and compatibility per mentee id.
+        :param computed_at: time the mentor data was read.
+        """
+        await self.session.execute(
+            delete(MentorRecommendation).where(
+                MentorRecommendation.mentee_id.in_(list(recommendations))
+            )
+        )
+        rows = [
+            {
+                "mentee_id": mentee_id,
+                "rank": rank,
+                "mentor_id": mentor_id,
+                "score": score,
+                "computed_at": computed_at,
+            }
+            for mentee_id, mentors in recommendations.items()
+            for rank, (mentor_id, score) in enumerate(mentors)
+        ]
+        if rows:
+            await self.session.execute(insert(MentorRecommendation), rows)
@@ -1,14 +1,41 @@
+import copy
+import re
+from datetime import datetime
+from enum import Enum
 from uuid import UUID
-from typing import List, Optional
+from typing import Any, Iterable, List, Optional
 
 from fastapi import Depends
-from sqlalchemy import select
+from sqlalchemy import (
+    BindParameter,
+    ColumnElement,
+    TextClause,
+    and_,
+    any_,
+    bindparam,
+    inspect,
+    literal,
+    literal_column,
+    or_,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached, selectinload
+from sqlalchemy.orm.util import identity_key
 from sqlalchemy.sql import func
+from sqlalchemy.sql.sqltypes import String, Uuid
 from pydantic import HttpUrl
 
+from startup_forge.db.dao.booking_dao import completed_sessions
 from startup_forge.db.dependencies import get_db_session
-from startup_forge.db.models.profile import Profile
+from startup_forge.db.pagination import Page, paginate
+from startup_forge.db.models.profile import Profile, pack_language
+from startup_forge.services.cache import TTLCache
+from startup_forge.services.matching import mentor_set_version
+from startup_forge.settings import settings
 from startup_forge.db.models.options import (
     Role,
     LanguageLevel,
@@ -18,6 +45,241 @@ from startup_forge.db.models.options import (
     ExpertiseName,
 )
 
+# Loaded columns of profiles, by user id. Entries are dropped by every
+# mutation of `ProfileDAO`, once more when its session ends.
+profile_cache: TTLCache[dict[str, Any]] = TTLCache(
+    maxsize=settings.profile_cache_size,
+    ttl=settings.profile_cache_ttl,
+)
+
+# Array mutations are single statements computed from the stored value, so
+# concurrent edits of a profile cannot overwrite each other. Entries keep
+# their order and `languages` / `social_links` pairs are keyed by their first
+# element: the last pair given for a key wins, at the place of the first.
+_MERGE_NAMES = """
+ARRAY(
+    SELECT entry.name
+    FROM unnest(coalesce(profile.{column}, '{{}}') || CAST(:{column} AS text[]))
+        WITH ORDINALITY AS entry(name, position)
+    GROUP BY entry.name
+    ORDER BY min(entry.position)
+)
+"""
+_REMOVE_NAMES = """
+ARRAY(
+    SELECT entry.name
+    FROM unnest(coalesce(profile.{column}, '{{}}'))
+        WITH ORDINALITY AS entry(name, position)
+    WHERE entry.name <> ALL(CAST(:{column} AS text[]))
+    ORDER BY entry.position
+)
+"""
+_MERGE_PAIRS = """
+ARRAY(
+    SELECT ARRAY[entry.key, entry.value]
+    FROM (
+        SELECT DISTINCT ON (merged.pairs[i][1])
+            merged.pairs[i][1] AS key,
+            merged.pairs[i][2] AS value,
+            min(i) OVER (PARTITION BY merged.pairs[i][1]) AS position
+        FROM (
+            SELECT coalesce(profile.{column}, '{{}}')
+                || CAST(:{column} AS text[]) AS pairs
+        ) AS merged,
+            generate_subscripts(merged.pairs, 1) AS i
+        ORDER BY merged.pairs[i][1], i DESC
+    ) AS entry
+    ORDER BY entry.position
+)
+"""
+_REMOVE_PAIRS = """
+ARRAY(
+    SELECT ARRAY[stored.pairs[i][1], stored.pairs[i][2]]
+    FROM (SELECT coalesce(profile.{column}, '{{}}') AS pairs) AS stored,
+        generate_subscripts(stored.pairs, 1) AS i
+    WHERE stored.pairs[i][1] <> ALL(CAST(:{column} AS text[]))
+    ORDER BY i
+)
+"""
+
+
+def _text(value: Any) -> str:
+    """Store enum members by value and urls as strings."""
+    return str(value.value if isinstance(value, Enum) else value)
+
+
+def _names(values: Iterable[str] | str) -> list[str]:
+    """
+    Normalise a name or a list of names.
+
+    :param values: a name or a list of names.
+    :return: list of names.
+    """
+    if isinstance(values, str):
+        values = [values]
+    return [_text(value) for value in values]
+
+
+def _pairs(values: Iterable[Any]) -> list[list[str]]:
+    """
+    Normalise a pair or a list of pairs.
+
+    :param values: a pair or a list of pairs.
+    :return: list of pairs.
+    """
+    values = list(values)
+    if values and isinstance(values[0], str):
+        values = [values]
+    return [[_text(key), _text(value)] for key, value in values]
+
+
+def _array_expression(
+    template: str,
+    column: str,
+    values: list[Any],
+    dimensions: int,
+) -> TextClause:
+    """
+    Build the SQL expression of an array column bound to its values.
+
+    :param template: SQL template of the expression.
+    :param column: name of the array column.
+    :param values: values bound to the expression.
+    :param dimensions: dimensions of the bound array.
+    :return: SQL expression.
+    """
+    return text(template.format(column=column)).bindparams(
+        bindparam(column, value=values, type_=ARRAY(String, dimensions=dimensions)),
+    )
+
+
+def _merge_names(column: str, names: Iterable[str] | str) -> TextClause:
+    """Add names missing from a one dimensional array column."""
+    return _array_expression(_MERGE_NAMES, column, _names(names), 1)
+
+
+def _remove_names(column: str, names: Iterable[str] | str) -> TextClause:
+    """Remove names from a one dimensional array column."""
+    return _array_expression(_REMOVE_NAMES, column, _names(names), 1)
+
+
+def _merge_pairs(column: str, pairs: Iterable[Any]) -> TextClause:
+    """Add or replace pairs of a two dimensional array column."""
+    return _array_expression(_MERGE_PAIRS, column, _pairs(pairs), 2)
+
+
+def _remove_pairs(column: str, keys: Iterable[str] | str) -> TextClause:
+    """Remove the pairs of a two dimensional array column with given keys."""
+    return _array_expression(_REMOVE_PAIRS, column, _names(keys), 1)
+
+
+def _flat(values: list[str]) -> BindParameter[list[str]]:
+    """Bind values as a one dimensional array."""
+    return bindparam(None, values, type_=ARRAY(String))
+
+
+def _languages_clause(
+    languages: list[tuple[LanguageName, Optional[LanguageLevel]]],
+    match_all: bool,
+) -> ColumnElement[bool]:
+    """
+    Filter profiles on languages, with or without a level.
+
+    Languages with a level are looked up by their code in
+    `Profile.languages_packed`: containment on the two dimensional
+    `Profile.languages` ignores how names and levels are paired.
+
+    :param languages: pairs of language name and optional level.
+    :param match_all: whether every language or any of them must match.
+    :return: SQL condition.
+    """
+    codes = [pack_language(name, level) for name, level in languages if level]
+    names = [_text(name) for name, level in languages if not level]
+    clauses = []
+    if codes:
+        clauses.append(
+            Profile.languages_packed.contains(codes)
+            if match_all
+            else Profile.languages_packed.overlap(codes)
+        )
+    if names:
+        clauses.append(
+            Profile.languages.contains(_flat(names))
+            if match_all
+            else Profile.languages.overlap(_flat(names))
+        )
+    return and_(*clauses) if match_all else or_(*clauses)
+
+
+def _conditions(
+    role: Optional[Role],
+    skills: Optional[list[SkillName]],
+    expertises: Optional[list[ExpertiseName]],
+    languages: Optional[list[tuple[LanguageName, Optional[LanguageLevel]]]],
+    match_all: bool,
+) -> list[ColumnElement[bool]]:
+    """
+    Build the conditions shared by profile filters and searches.
+
+    :param role: role of the user.
+    :param skills: skills the user has.
+    :param expertises: expertises the user has.
+    :param languages: languages the user speaks, at a level if given.
+    :param match_all: whether the user must have every given skill,
+        expertise and language or any of them.
+    :return: SQL conditions.
+    """
+    conditions = []
+    if role:
+        conditions.append(Profile.role == role)
+    for column, names in (
+        (Profile.skills, skills),
+        (Profile.expertises, expertises),
+    ):
+        if names:
+            names = _names(names)
+            conditions.append(
+                column.contains(names) if match_all else column.overlap(names)
+            )
+    if languages:
+        conditions.append(_languages_clause(languages, match_all))
+    return conditions
+
+
+def _search_query(text: Optional[str]) -> Optional[ColumnElement[Any]]:
+    """
+    Build a prefix query matching every word of a text.
+
+    Only word characters are kept, so the text cannot inject tsquery
+    operators.
+
+    :param text: text typed by the user.
+    :return: tsquery, `None` if the text has no words.
+    """
+    words = re.findall(r"\w+", (text or "").lower())
+    if not words:
+        return None
+    return func.to_tsquery(
+        literal_column("'simple'"), " & ".join(f"{word}:*" for word in words)
+    )
+
+
+def _snapshot(profile: Profile) -> dict[str, Any]:
+    """
+    Copy the loaded columns of a profile, to be cached across sessions.
+
+    :param profile: a profile loaded from the database.
+    :return: value of every loaded column.
+    """
+    loaded = inspect(profile).dict
+    return copy.deepcopy(
+        {
+            column.key: loaded[column.key]
+            for column in inspect(Profile).column_attrs
+            if column.key in loaded
+        }
+    )
+
 
 class ProfileDAO:
     """Class for accessing profile table."""
@@ -52,19 +314,131 @@ class ProfileDAO:
                 bio=bio,
             )
         )
+        profile_cache.delete_on_commit(self.session, user_id)
+        self._invalidate_matches(role)
+
+    def _invalidate_matches(self, role: Optional[Role]) -> None:
+        """
+        Invalidate cached matches when a mentor's profile changes.
 
-    async def get_profile(self, user_id: UUID) -> Profile:
+        :param role: role of the changed profile.
+        """
+        if role == Role.MENTOR:
+            mentor_set_version.bump_on_commit(self.session)
+
+    def _from_session(self, user_id: UUID) -> Optional[Profile]:
+        """
+        Get a profile already loaded in the session.
+
+        :param user_id: id of the profile.
+        :return: the profile, `None` if it is not loaded or expired.
+        """
+        profile = self.session.identity_map.get(identity_key(Profile, user_id))
+        if profile is None:
+            return None
+        state = inspect(profile)
+        if not state.persistent or state.expired_attributes:
+            return None
+        return profile
+
+    async def get_profile(self, user_id: UUID) -> Optional[Profile]:
         """
         Get a profile.
 
+        The profile is looked up in the session, then in `profile_cache`,
+        then in the database.
+
         :param user_id: id of the profile.
         :return: a profile.
         """
+        profile = self._from_session(user_id)
+        if profile is not None:
+            return profile
+        if identity_key(Profile, user_id) not in self.session.identity_map:
+            values = profile_cache.get(user_id)
+            if values is not None:
+                profile = Profile(**copy.deepcopy(values))
+                make_transient_to_detached(profile)
+                return await self.session.merge(profile, load=False)
+
         profile = await self.session.execute(
             select(Profile).where(Profile.user_id == user_id),
         )
+        profile = profile.scalars().first()
+        if profile is not None:
+            profile_cache.set(user_id, _snapshot(profile))
+        return profile
+
+    async def get_profiles(self, user_ids: Iterable[UUID]) -> list[Profile]:
+        """
+        Get the profiles of several users in one query.
+
+        Profiles loaded in the session are not queried again. The ids are
+        bound as a single array, so the statement is the same whatever their
+        number.
+
+        :param user_ids: ids of the profiles.
+        :return: the existing profiles, in no particular order.
+        """
+        profiles = []
+        missing = []
+        for user_id in user_ids:
+            profile = self._from_session(user_id)
+            if profile is None:
+                missing.append(user_id)
+            else:
+                profiles.append(profile)
+        if not missing:
+            return profiles
+        rows = await self.session.execute(
+            select(Profile).where(
+                Profile.user_id
+                == any_(bindparam("user_ids", missing, type_=ARRAY(Uuid()))),
+            ),
+        )
+        profiles.extend(rows.scalars())
+        return profiles
 
-        return profile.scalars().first()
+    async def get_card(self, user_id: UUID) -> Optional[tuple[Profile, int]]:
+        """
+        Get a profile with everything its card shows.
+
+        The profile comes with its number of completed sessions, and its
+        experiences, educations and reviews are loaded with one query each,
+        whatever their number.
+
+        :param user_id: id of the profile.
+        :return: the profile and its number of completed sessions, `None` if
+            it does not exist.
+        """
+        rows = await self.session.execute(
+            select(Profile, completed_sessions(user_id).scalar_subquery())
+            .where(Profile.user_id == user_id)
+            .options(
+                selectinload(Profile.experiences),
+                selectinload(Profile.educations),
+                selectinload(Profile.reviews),
+            ),
+        )
+        row = rows.first()
+        return (row[0], row[1]) if row else None
+
+    async def _update(self, user_id: UUID, **values: Any) -> None:
+        """
+        Update columns of a profile in a single statement.
+
+        :param user_id: id of the profile owner.
+        :param values: new value or SQL expression of every column.
+        """
+        role = await self.session.scalar(
+            update(Profile)
+            .where(Profile.user_id == user_id)
+            .values(updated_at=func.now(), **values)
+            .returning(Profile.role)
+            .execution_options(synchronize_session="fetch"),
+        )
+        profile_cache.delete_on_commit(self.session, user_id)
+        self._invalidate_matches(role)
 
     async def update_profile(
         self,
@@ -82,45 +456,39 @@ class ProfileDAO:
         """
         Update a specific profile
 
+        Given lists are merged into the existing ones.
+
         :param user_id: id of the profile owner.
-        :param role: role of the user.
         :param first_name: first name of the user.
         :param last_name: last name of the user.
+        :param years_of_experience: years of experience of the user.
+        :param bio: bio of the user.
+        :param profile_picture_url: url of the profile picture.
+        :param expertises: expertises to add.
+        :param skills: skills to add.
+        :param languages: languages to add or update.
+        :param social_links: social links to add or update.
         """
-        profile = await self.get_profile(user_id=user_id)  # get the profile
-
-        # edit profile
-        profile.first_name = first_name if first_name else profile.first_name
-        profile.last_name = last_name if last_name else profile.last_name
-        profile.years_of_experience = (
-            years_of_experience if years_of_experience else profile.years_of_experience
-        )
-        profile.bio = bio if bio else profile.bio
-        profile.profile_picture_url = (
-            profile_picture_url if profile_picture_url else profile.profile_picture_url
-        )
-        profile.expertises = (
-            profile.expertises.extend(expertises) if expertises else profile.expertises
-        )
-        profile.skills = profile.skills.extend(skills) if skills else profile.skills
-        profile.languages = (
-            profile.languages.extend(languages) if languages else profile.languages
-        )
-        profile.social_links = (
-            profile.social_links.extend(social_links)
-            if social_links
-            else profile.social_links
-        )
-
-        # remove duplicates
-        profile.expertises = list(set(profile.expertises))
-        profile.skills = list(set(profile.skills))
-        profile.languages = list(set(profile.languages))
-        profile.social_links = list(set(profile.social_links))
-
-        # save changes
-        profile.updated_at = func.now()
-        self.session.add(profile)
+        values: dict[str, Any] = {
+            column: value
+            for column, value in (
+                ("first_name", first_name),
+                ("last_name", last_name),
+                ("years_of_experience", years_of_experience),
+                ("bio", bio),
+                ("profile_picture_url", profile_picture_url),
+            )
+            if value
+        }
+        if values.get("profile_picture_url"):
+            values["profile_picture_url"] = str(values["profile_picture_url"])
+        for column, names in (("expertises", expertises), ("skills", skills)):
+            if names:
+                values[column] = _merge_names(column, names)
+        for column, pairs in (("languages", languages), ("social_links", social_links)):
+            if pairs:
+                values[column] = _merge_pairs(column, pairs)
+        await self._update(user_id, **values)
 
     async def register_expertises(
         self,
@@ -128,48 +496,29 @@ class ProfileDAO:
         expertise_names: list[ExpertiseName] | ExpertiseName,
     ) -> None:
         """
-        Register an expertise
+        Register expertises, ignoring the ones already registered.
 
         :param user_id: id of the profile owner.
-        :param expertise_names: expertise name.
+        :param expertise_names: expertise names.
         """
-        profile = await self.get_profile(user_id=user_id)  # get the profile
-
-        # edit profile
-        profile.expertises = (
-            profile.expertises.append(expertise_names)
-            if type(expertise_names) == "str"
-            else profile.expertises.extend(expertise_names)
+        await self._update(
+            user_id, expertises=_merge_names("expertises", expertise_names)
         )
 
-        # remove duplicates
-        profile.expertises = list(set(profile.expertises))
-
-        # save profile
-        profile.updated_at = func.now()
-        self.session.add(profile)
-
     async def remove_expertises(
         self,
         user_id: UUID,
         expertise_names: list[ExpertiseName] | ExpertiseName,
     ) -> None:
         """
-        Register an expertise
+        Remove expertises.
 
         :param user_id: id of the profile owner.
-        :param expertise_names: expertise name.
+        :param expertise_names: expertise names.
         """
-        profile = await self.get_profile(user_id=user_id)  # get the profile
-
-        # edit profile
-        for expertise in profile.expertises:
-            if expertise == expertise_names or expertise in expertise_names:
-                profile.expertises.remove(expertise)
-
-        # save profile
-        profile.updated_at = func.now()
-        self.session.add(profile)
+        await self._update(
+            user_id, expertises=_remove_names("expertises", expertise_names)
+        )
 
     async def register_skills(
         self,
@@ -177,26 +526,12 @@ class ProfileDAO:
         skill_names: list[SkillName] | SkillName,
     ) -> None:
         """
-        Register a skill
+        Register skills, ignoring the ones already registered.
 
         :param user_id: id of the profile owner.
         :param skill_names: skill names.
         """
-        profile = await self.get_profile(user_id=user_id)  # get the profile
-
-        # edit profile
-        profile.skills = (
-            profile.skills.append(skill_names)
-            if type(skill_names) == "str"
-            else profile.skills.extend(skill_names)
-        )
-
-        # remove duplicates
-        profile.skills = list(set(profile.skills))
-
-        # save profile
-        profile.updated_at = func.now()
-        self.session.add(profile)
+        await self._update(user_id, skills=_merge_names("skills", skill_names))
 
     async def remove_skills(
         self,
@@ -204,21 +539,12 @@ class ProfileDAO:
         skill_names: list[SkillName] | SkillName,
     ) -> None:
         """
-        Register an skill
+        Remove skills.
 
         :param user_id: id of the profile owner.
-        :param skill_names: skill name.
+        :param skill_names: skill names.
         """
-        profile = await self.get_profile(user_id=user_id)  # get the profile
-
-        # edit profile
-        for skill in profile.skills:
-            if skill == skill_names or skill in skill_names:
-                profile.skills.remove(skill)
-
-        # save profile
-        profile.updated_at = func.now()
-        self.session.add(profile)
+        await self._update(user_id, skills=_remove_names("skills", skill_names))
 
     async def register_language(
         self,
@@ -227,26 +553,12 @@ class ProfileDAO:
         | list[LanguageName, LanguageLevel],
     ) -> None:
         """
-        Register a language
+        Register languages, the level of a registered language is updated.
 
         :param user_id: id of the profile owner.
-        :param language_names: language names.
+        :param language_names: pairs of language name and level.
         """
-        profile = await self.get_profile(user_id=user_id)  # get the profile
-
-        # edit profile
-        profile.languages = (
-            profile.languages.append(language_names)
-            if type(language_names[0]) == LanguageName
-            else profile.languages.extend(language_names)
-        )
-
-        # remove duplicates
-        profile.languages = list(set(profile.languages))
-
-        # save profile
-        profile.updated_at = func.now()
-        self.session.add(profile)
+        await self._update(user_id, languages=_merge_pairs("languages", language_names))
 
     async def remove_language(
         self,
@@ -257,18 +569,9 @@ class ProfileDAO:
         Remove a language
 
         :param user_id: id of the profile owner.
-        :param language_name: skill name.
+        :param language_name: language name.
         """
-        profile = await self.get_profile(user_id=user_id)  # get the profile
-
-        # edit profile
-        for language in profile.languages:
-            if language[0] == language_name:
-                profile.languages.remove(language)
-
-        # save profile
-        profile.updated_at = func.now()
-        self.session.add(profile)
+        await self._update(user_id, languages=_remove_pairs("languages", language_name))
 
     async def register_social_link(
         self,
@@ -276,27 +579,15 @@ class ProfileDAO:
         social_links: list[list[Platform, HttpUrl]] | list[Platform, HttpUrl],
     ) -> None:
         """
-        Register a social link
+        Register social links, the link of a registered platform is updated.
 
         :param user_id: id of the profile owner.
-        :param social_links: social links.
+        :param social_links: pairs of platform and link.
         """
-        profile = await self.get_profile(user_id=user_id)  # get the profile
-
-        # edit profile
-        profile.social_links = (
-            profile.social_links.append(social_links)
-            if type(social_links[0]) == Platform
-            else profile.social_links.extend(social_links)
+        await self._update(
+            user_id, social_links=_merge_pairs("social_links", social_links)
         )
 
-        # remove duplicates
-        profile.social_links = list(set(profile.social_links))
-
-        # save profile
-        profile.updated_at = func.now()
-        self.session.add(profile)
-
     async def remove_social_link(
         self,
         user_id: UUID,
@@ -308,29 +599,95 @@ class ProfileDAO:
         :param user_id: id of the profile owner.
         :param platform: name of platform.
         """
-        profile = await self.get_profile(user_id=user_id)  # get the profile
-
-        # edit profile
-        for link in profile.social_links:
-            if link[0] == platform:
-                profile.social_links.remove(platform)
-                profile.updated_at = func.now()
-
-        # save profile
-        self.session.add(profile)
+        await self._update(
+            user_id, social_links=_remove_pairs("social_links", platform)
+        )
 
     async def filter(
         self,
         first_name: Optional[str] = None,
-    ) -> List[Profile]:
+        role: Optional[Role] = None,
+        skills: Optional[list[SkillName]] = None,
+        expertises: Optional[list[ExpertiseName]] = None,
+        languages: Optional[list[tuple[LanguageName, Optional[LanguageLevel]]]] = None,
+        match_all: bool = True,
+        limit: int = settings.page_size,
+        after: Optional[tuple[datetime, UUID]] = None,
+    ) -> Page[Profile]:
         """
-        Get specific profile.
+        Get a page of profiles, newest first.
+
+        Skills, expertises and languages are filtered with array operators
+        backed by GIN indexes.
 
         :param first_name: first name of the user.
-        :return: profiles.
+        :param role: role of the user.
+        :param skills: skills the user has.
+        :param expertises: expertises the user has.
+        :param languages: languages the user speaks, at a level if given.
+        :param match_all: whether the user must have every given skill,
+            expertise and language or any of them.
+        :param limit: maximum number of profiles in the page.
+        :param after: keys of the last profile of the previous page.
+        :return: a page of profiles.
         """
-        query = select(Profile)
+        query = select(Profile).where(
+            *_conditions(role, skills, expertises, languages, match_all)
+        )
         if first_name:
             query = query.where(Profile.first_name == first_name)
-        rows = await self.session.execute(query)
-        return list(rows.scalars().fetchall())
+        return await paginate(
+            self.session, query, (Profile.created_at, Profile.user_id), limit, after
+        )
+
+    async def search(
+        self,
+        text: Optional[str],
+        limit: int,
+        after: Optional[tuple[float, UUID]] = None,
+        role: Optional[Role] = None,
+        skills: Optional[list[SkillName]] = None,
+        expertises: Optional[list[ExpertiseName]] = None,
+        languages: Optional[list[tuple[LanguageName, Optional[LanguageLevel]]]] = None,
+        match_all: bool = True,
+    ) -> list[tuple[Profile, float]]:
+        """
+        Search profiles by name and bio, best ranked first.
+
+        Every word of the text must prefix a word of the first name, last name
+        or bio. Without text, every profile matching the filters ranks 0.
+        Profiles are ordered by rank then id, so that a page can be resumed
+        from the last profile of the previous one.
+
+        :param text: words to look for.
+        :param limit: maximum number of profiles to return.
+        :param after: rank and id of the last profile of the previous page.
+        :param role: role of the user.
+        :param skills: skills the user has.
+        :param expertises: expertises the user has.
+        :param languages: languages the user speaks, at a level if given.
+        :param match_all: whether the user must have every given skill,
+            expertise and language or any of them.
+        :return: profiles and their rank.
+        """
+        conditions = _conditions(role, skills, expertises, languages, match_all)
+        rank: ColumnElement[float] = literal(0.0)
+        query = _search_query(text)
+        if query is not None:
+            conditions.append(Profile.search_vector.bool_op("@@")(query))
+            rank = func.ts_rank(Profile.search_vector, query)
+        if after is not None:
+            after_rank, after_id = after
+            conditions.append(
+                or_(
+                    rank < after_rank,
+                    and_(rank == after_rank, Profile.user_id > after_id),
+                )
+            )
+        rows = await self.session.execute(
+            select(Profile, rank)
+            .where(*conditions)
+            .order_by(rank.desc(), Profile.user_id)
+            .limit(limit),
+        )
+        return list(rows.tuples())
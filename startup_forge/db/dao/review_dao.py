@@ -1,4 +1,4 @@
-from datetime import date
+from datetime import date, datetime
 from uuid import UUID
 from typing import Optional
 
@@ -6,10 +6,15 @@ from fastapi import Depends
 from sqlalchemy import select
 from sqlalchemy.sql import func
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from startup_forge.db.dependencies import get_db_session
+from startup_forge.db.models.profile import Profile
 from startup_forge.db.models.review import Review
 from startup_forge.db.models.options import Role
+from startup_forge.db.pagination import Page, keyset, paginate
+from startup_forge.db.versions import fetch_version
+from startup_forge.settings import settings
 
 
 class ReviewDAO:
@@ -64,25 +69,67 @@ class ReviewDAO:
 
         return review.scalars().first()
 
-    async def get_reviews(self, user_id: UUID, role: Role) -> Review | None:
+    async def get_reviews(
+        self,
+        user_id: UUID,
+        role: Role,
+        limit: int = settings.page_size,
+        after: Optional[tuple[datetime, UUID]] = None,
+    ) -> Page[Review]:
         """
-        Get a particular review.
+        Get a page of the reviews written by a mentee or about a mentor.
 
-        :param review_id: id of the review.
+        :param user_id: id of the user.
         :param role: role of user.
-        :return: a review.
+        :param limit: maximum number of reviews in the page.
+        :param after: keys of the last review of the previous page.
+        :return: a page of reviews, newest first.
         """
-        review = (
-            await self.session.execute(
-                select(Review).where(Review.user_id == user_id),
-            )
-            if role == Role.MENTEE
-            else await self.session.execute(
-                select(Review).where(Review.mentor_id == user_id),
-            )
+        column = Review.mentee_id if role == Role.MENTEE else Review.mentor_id
+        return await paginate(
+            self.session,
+            select(Review).where(column == user_id),
+            (Review.created_at, Review.id),
+            limit,
+            after,
         )
 
-        return list(review.scalars().fetchall())
+    async def get_reviews_version(
+        self,
+        user_id: UUID,
+        role: Role,
+        limit: int = settings.page_size,
+        after: Optional[tuple[datetime, UUID]] = None,
+    ) -> Optional[str]:
+        """
+        Get the version of a page of reviews, along with their profiles.
+
+        :param user_id: id of the user.
+        :param role: role of user.
+        :param limit: maximum number of reviews in the page.
+        :param after: keys of the last review of the previous page.
+        :return: fingerprint of the reviews, `None` if there are none.
+        """
+        mentee = aliased(Profile)
+        mentor = aliased(Profile)
+        column = Review.mentee_id if role == Role.MENTEE else Review.mentor_id
+        return await fetch_version(
+            self.session,
+            keyset(
+                select(
+                    Review.id,
+                    Review.updated_at,
+                    mentee.updated_at,
+                    mentor.updated_at,
+                )
+                .outerjoin(mentee, mentee.user_id == Review.mentee_id)
+                .outerjoin(mentor, mentor.user_id == Review.mentor_id)
+                .where(column == user_id),
+                (Review.created_at, Review.id),
+                limit,
+                after,
+            ),
+        )
 
     async def delete_review(self, review_id: UUID) -> None:
         """
@@ -107,15 +154,20 @@ class ReviewDAO:
     async def filter(
         self,
         content: Optional[str] = None,
-    ) -> list[Review] | None:
+        limit: int = settings.page_size,
+        after: Optional[tuple[datetime, UUID]] = None,
+    ) -> Page[Review]:
         """
-        Get specific review.
+        Get a page of reviews, newest first.
 
-        :param content: content of review.
-        :return: a list of Review.
+        :param content: text the content of the review contains.
+        :param limit: maximum number of reviews in the page.
+        :param after: keys of the last review of the previous page.
+        :return: a page of reviews.
         """
         query = select(Review)
         if content:
-            query = query.where(content in Review.content)
-        rows = await self.session.execute(query)
-        return list(rows.scalars().fetchall())
+            query = query.where(Review.content.contains(content))
+        return await paginate(
+            self.session, query, (Review.created_at, Review.id), limit, after
+        )
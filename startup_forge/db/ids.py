@@ -0,0 +1,42 @@
+import os
+import time
+from uuid import UUID, uuid4
+
+from startup_forge.settings import settings
+
+_TIMESTAMP_MASK = (1 << 48) - 1
+_RAND_A_MASK = (1 << 12) - 1
+_RAND_B_MASK = (1 << 62) - 1
+
+
+def uuid7() -> UUID:
+    """
+    Generate a time-ordered UUID, version 7 of RFC 9562.
+
+    The 48 most significant bits hold the Unix time in milliseconds, so ids
+    generated later sort after the earlier ones and new rows are appended
+    to the end of the primary key index instead of all over it. The other
+    bits, but for the version and variant, are random.
+
+    :return: new UUID.
+    """
+    milliseconds = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    return UUID(
+        int=(milliseconds & _TIMESTAMP_MASK) << 80
+        | 0x7 << 76
+        | (rand >> 62 & _RAND_A_MASK) << 64
+        | 0b10 << 62
+        | rand & _RAND_B_MASK,
+    )
+
+
+def new_id() -> UUID:
+    """
+    Generate a primary key, time-ordered unless `time_ordered_ids` is off.
+
+    :return: new UUID.
+    """
+    if settings.time_ordered_ids:
+        return uuid7()
+    return uuid4()
@@ -0,0 +1,77 @@
+"""Add industry_footprint table
+
+Revision ID: 3f9c1a7d2b64
+Revises: eb00c0fdd630
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3f9c1a7d2b64"
+down_revision = "eb00c0fdd630"
+branch_labels = None
+depends_on = None
+
+# Bit positions follow the declaration order of the `Industry` enum.
+INDUSTRIES = (
+    "FINTECH",
+    "AI",
+    "ECOMMERCE",
+    "HEALTHCARE",
+    "EDTECH",
+    "HEALTHTECH",
+    "CYBERSECURITY",
+    "LOGISTICS",
+    "MUSIC_ENTERTAINMENT",
+    "REAL_ESTATE",
+    "SAAS",
+    "CONSUMER",
+    "BLOCKCHAIN",
+    "DIGITAL_MEDIA",
+)
+
+
+def _industry_mask(condition: str) -> str:
+    cases = " ".join(
+        f"WHEN '{name}' THEN {1 << position}"  # noqa: S608
+        for position, name in enumerate(INDUSTRIES)
+    )
+    return (
+        f"coalesce(bit_or(CASE industry::text {cases} END) "
+        f"FILTER (WHERE {condition}), 0)"
+    )
+
+
+def upgrade() -> None:
+    op.create_index(
+        op.f("ix_experience_user_id"), "experience", ["user_id"], unique=False
+    )
+    op.create_table(
+        "industry_footprint",
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("industries", sa.Integer(), nullable=False),
+        sa.Column("current_industries", sa.Integer(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"], ["user.id"], onupdate="CASCADE", ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    op.execute(
+        "INSERT INTO industry_footprint (user_id, industries, current_industries) "
+        f"SELECT user_id, {_industry_mask('TRUE')}, "  # noqa: S608
+        f"{_industry_mask('end_date IS NULL')} "
+        "FROM experience GROUP BY user_id"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("industry_footprint")
+    op.drop_index(op.f("ix_experience_user_id"), table_name="experience")
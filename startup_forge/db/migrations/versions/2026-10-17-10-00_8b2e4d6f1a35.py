@@ -0,0 +1,55 @@
+"""Add mentor_recommendation table
+
+Revision ID: 8b2e4d6f1a35
+Revises: 3f9c1a7d2b64
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8b2e4d6f1a35"
+down_revision = "3f9c1a7d2b64"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Run the upgrade migrations."""
+    op.create_table(
+        "mentor_recommendation",
+        sa.Column("mentee_id", sa.Uuid(), nullable=False),
+        sa.Column("rank", sa.Integer(), nullable=False),
+        sa.Column("mentor_id", sa.Uuid(), nullable=False),
+        sa.Column("score", sa.Float(), nullable=False),
+        sa.Column("computed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["mentee_id"],
+            ["user.id"],
+            onupdate="CASCADE",
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["mentor_id"],
+            ["user.id"],
+            onupdate="CASCADE",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("mentee_id", "rank"),
+    )
+    op.create_index(
+        op.f("ix_mentor_recommendation_mentor_id"),
+        "mentor_recommendation",
+        ["mentor_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Run the downgrade migrations."""
+    op.drop_index(
+        op.f("ix_mentor_recommendation_mentor_id"),
+        table_name="mentor_recommendation",
+    )
+    op.drop_table("mentor_recommendation")
@@ -0,0 +1,75 @@
+"""Add availability to industry_footprint
+
+Revision ID: c4d8e2a9f713
+Revises: 8b2e4d6f1a35
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c4d8e2a9f713"
+down_revision = "8b2e4d6f1a35"
+branch_labels = None
+depends_on = None
+
+# Mirrors `startup_forge.services.matching.availability_mask`: the week is
+# split in 56 UTC blocks of 3 hours starting on monday, every time slot sets
+# the bit of the blocks it overlaps.
+BACKFILL = """
+INSERT INTO industry_footprint (user_id, industries, current_industries, availability)
+SELECT user_id, 0, 0, bit_or(1::bigint << (((block % 56) + 56) % 56))
+FROM (
+    SELECT
+        user_id,
+        generate_series(
+            floor(start_minute / 180.0)::int,
+            ceil(
+                (CASE WHEN end_minute <= start_minute THEN end_minute + 1440
+                ELSE end_minute END) / 180.0
+            )::int - 1
+        ) AS block
+    FROM (
+        SELECT
+            user_id,
+            day_start + pg_temp.minutes(start_time) AS start_minute,
+            day_start + pg_temp.minutes(end_time) AS end_minute
+        FROM (
+            SELECT
+                user_id,
+                start_time,
+                end_time,
+                (array_position(enum_range(NULL::day), day) - 1) * 1440 AS day_start
+            FROM time_slot
+        ) AS slot
+    ) AS slot
+) AS block
+GROUP BY user_id
+ON CONFLICT (user_id) DO UPDATE SET availability = excluded.availability
+"""
+
+MINUTES = """
+CREATE FUNCTION pg_temp.minutes(value timetz) RETURNS int AS $$
+    SELECT (
+        extract(hour FROM value) * 60
+        + extract(minute FROM value)
+        - extract(timezone FROM value) / 60
+    )::int
+$$ LANGUAGE sql IMMUTABLE
+"""
+
+
+def upgrade() -> None:
+    """Run the upgrade migrations."""
+    op.add_column(
+        "industry_footprint",
+        sa.Column("availability", sa.BigInteger(), server_default="0", nullable=False),
+    )
+    op.execute(MINUTES)
+    op.execute(BACKFILL)
+
+
+def downgrade() -> None:
+    """Run the downgrade migrations."""
+    op.drop_column("industry_footprint", "availability")
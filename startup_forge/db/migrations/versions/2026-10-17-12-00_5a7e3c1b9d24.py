@@ -0,0 +1,34 @@
+"""Add GIN indexes on profile arrays
+
+Revision ID: 5a7e3c1b9d24
+Revises: c4d8e2a9f713
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5a7e3c1b9d24"
+down_revision = "c4d8e2a9f713"
+branch_labels = None
+depends_on = None
+
+COLUMNS = ("skills", "expertises", "languages")
+
+
+def upgrade() -> None:
+    """Run the upgrade migrations."""
+    for column in COLUMNS:
+        op.create_index(
+            f"ix_profile_{column}",
+            "profile",
+            [column],
+            unique=False,
+            postgresql_using="gin",
+        )
+
+
+def downgrade() -> None:
+    """Run the downgrade migrations."""
+    for column in COLUMNS:
+        op.drop_index(f"ix_profile_{column}", table_name="profile")
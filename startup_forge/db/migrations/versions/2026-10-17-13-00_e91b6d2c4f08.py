@@ -0,0 +1,82 @@
+"""Add compact encodings of profile arrays
+
+Revision ID: e91b6d2c4f08
+Revises: 5a7e3c1b9d24
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "e91b6d2c4f08"
+down_revision = "5a7e3c1b9d24"
+branch_labels = None
+depends_on = None
+
+# Bits and codes follow the declaration order of the enums at the time of
+# this revision, see `startup_forge.db.models.profile`.
+SKILLS_MASK = """
+CASE WHEN skills @> ARRAY['LEADERSHIP']::varchar[] THEN 1 ELSE 0 END
+| CASE WHEN skills @> ARRAY['COMMUNICATION']::varchar[] THEN 2 ELSE 0 END
+| CASE WHEN skills @> ARRAY['TEAM WORK']::varchar[] THEN 4 ELSE 0 END
+"""
+EXPERTISES_MASK = """
+CASE WHEN expertises @> ARRAY['BRANDING']::varchar[] THEN 1 ELSE 0 END
+| CASE WHEN expertises @> ARRAY['MARKETING']::varchar[] THEN 2 ELSE 0 END
+"""
+LANGUAGES_MASK = """
+CASE WHEN languages @> ARRAY['ENGLISH']::varchar[] THEN 1 ELSE 0 END
+| CASE WHEN languages @> ARRAY['SPANISH']::varchar[] THEN 2 ELSE 0 END
+| CASE WHEN languages @> ARRAY['ARABIC']::varchar[] THEN 4 ELSE 0 END
+"""
+LANGUAGE_CODE = (
+    "(CASE languages[{entry}][1] "
+    "WHEN 'ENGLISH' THEN 0 WHEN 'SPANISH' THEN 1 WHEN 'ARABIC' THEN 2 END) * 3"
+    " + (CASE languages[{entry}][2] "
+    "WHEN 'BASIC' THEN 0 WHEN 'CONVERSATIONAL' THEN 1 WHEN 'FLUENT' THEN 2 END)"
+)
+LANGUAGES_PACKED = "array_remove(ARRAY[{codes}]::smallint[], NULL)".format(
+    codes=", ".join(LANGUAGE_CODE.format(entry=entry) for entry in (1, 2, 3)),
+)
+
+
+def upgrade() -> None:
+    """Run the upgrade migrations."""
+    for column, expression in (
+        ("skills_mask", SKILLS_MASK),
+        ("expertises_mask", EXPERTISES_MASK),
+        ("languages_mask", LANGUAGES_MASK),
+    ):
+        op.add_column(
+            "profile",
+            sa.Column(column, sa.Integer(), sa.Computed(expression.strip())),
+        )
+    op.add_column(
+        "profile",
+        sa.Column(
+            "languages_packed",
+            postgresql.ARRAY(sa.SmallInteger()),
+            sa.Computed(LANGUAGES_PACKED),
+        ),
+    )
+    op.create_index(
+        "ix_profile_languages_packed",
+        "profile",
+        ["languages_packed"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    """Run the downgrade migrations."""
+    op.drop_index("ix_profile_languages_packed", table_name="profile")
+    for column in (
+        "languages_packed",
+        "languages_mask",
+        "expertises_mask",
+        "skills_mask",
+    ):
+        op.drop_column("profile", column)
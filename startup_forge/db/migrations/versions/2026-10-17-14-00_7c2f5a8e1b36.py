@@ -0,0 +1,47 @@
+"""Add full-text search vector to profile
+
+Revision ID: 7c2f5a8e1b36
+Revises: e91b6d2c4f08
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "7c2f5a8e1b36"
+down_revision = "e91b6d2c4f08"
+branch_labels = None
+depends_on = None
+
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('simple', coalesce(first_name, '')), 'A')"
+    " || setweight(to_tsvector('simple', coalesce(last_name, '')), 'A')"
+    " || setweight(to_tsvector('simple', coalesce(bio, '')), 'B')"
+)
+
+
+def upgrade() -> None:
+    """Run the upgrade migrations."""
+    op.add_column(
+        "profile",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR),
+        ),
+    )
+    op.create_index(
+        "ix_profile_search_vector",
+        "profile",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    """Run the downgrade migrations."""
+    op.drop_index("ix_profile_search_vector", table_name="profile")
+    op.drop_column("profile", "search_vector")
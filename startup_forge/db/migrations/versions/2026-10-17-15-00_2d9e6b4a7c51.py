@@ -0,0 +1,41 @@
+"""Add keyset pagination indexes
+
+Revision ID: 2d9e6b4a7c51
+Revises: 7c2f5a8e1b36
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "2d9e6b4a7c51"
+down_revision = "7c2f5a8e1b36"
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    ("ix_post_user_id_created_at", "post", ["user_id", "created_at", "id"]),
+    ("ix_comment_post_id_created_at", "comment", ["post_id", "created_at", "id"]),
+    ("ix_comment_user_id_created_at", "comment", ["user_id", "created_at", "id"]),
+    ("ix_review_mentee_id_created_at", "review", ["mentee_id", "created_at", "id"]),
+    ("ix_review_mentor_id_created_at", "review", ["mentor_id", "created_at", "id"]),
+    (
+        "ix_connection_request_request_to_requested_at",
+        "connection_request",
+        ["request_to", "requested_at", "request_from"],
+    ),
+    ("ix_booking_user_id_created_at", "booking", ["user_id", "created_at", "id"]),
+    ("ix_profile_created_at", "profile", ["created_at", "user_id"]),
+)
+
+
+def upgrade() -> None:
+    """Run the upgrade migrations."""
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    """Run the downgrade migrations."""
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
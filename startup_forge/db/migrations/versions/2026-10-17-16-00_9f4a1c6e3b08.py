@@ -0,0 +1,27 @@
+"""Keep the ids of posts, comments, bookings and reviews
+
+Revision ID: 9f4a1c6e3b08
+Revises: 2d9e6b4a7c51
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9f4a1c6e3b08"
+down_revision = "2d9e6b4a7c51"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Run the upgrade migrations."""
+    # New rows get time-ordered ids from `startup_forge.db.ids.new_id`. The
+    # existing ids are held by clients, so they are left alone, and the pages
+    # already order by `(created_at, id)`. The function once used to re-key
+    # them is dropped where an earlier version of this revision created it.
+    op.execute("DROP FUNCTION IF EXISTS uuid_v7(timestamptz)")
+
+
+def downgrade() -> None:
+    """Run the downgrade migrations."""
@@ -0,0 +1,30 @@
+"""Add community feed index
+
+Revision ID: 4b8d2f7a9e13
+Revises: 9f4a1c6e3b08
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "4b8d2f7a9e13"
+down_revision = "9f4a1c6e3b08"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Run the upgrade migrations."""
+    op.create_index(
+        "ix_post_created_at",
+        "post",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Run the downgrade migrations."""
+    op.drop_index("ix_post_created_at", table_name="post")
@@ -0,0 +1,111 @@
+"""Add timeline table
+
+Revision ID: 6e3a9d1f5c27
+Revises: 4b8d2f7a9e13
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "6e3a9d1f5c27"
+down_revision = "4b8d2f7a9e13"
+branch_labels = None
+depends_on = None
+
+# Default of `settings.timeline_fanout_limit` when the timelines were added.
+FANOUT_LIMIT = 500
+
+
+def upgrade() -> None:
+    """Run the upgrade migrations."""
+    op.create_table(
+        "timeline",
+        sa.Column("post_id", sa.Uuid(), nullable=False),
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["post_id"],
+            ["post.id"],
+            onupdate="CASCADE",
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["user.id"],
+            onupdate="CASCADE",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("post_id", "user_id"),
+    )
+    op.create_index(
+        "ix_timeline_user_id_created_at",
+        "timeline",
+        ["user_id", "created_at", "post_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_connection_request_to", "connection", ["request_to"], unique=False
+    )
+    op.add_column(
+        "post",
+        sa.Column(
+            "fanned_out", sa.Boolean(), server_default=sa.false(), nullable=False
+        ),
+    )
+
+    # Fan the existing posts out like `CommunityDAO.create_post` does, only to
+    # the connections accepted before the post, as `CommunityDAO._home_ids`
+    # pulls them.
+    op.execute(
+        sa.text(
+            """
+            UPDATE post SET fanned_out = true
+            WHERE user_id NOT IN (
+                SELECT author FROM (
+                    SELECT request_from AS author FROM connection
+                    UNION ALL
+                    SELECT request_to FROM connection
+                ) AS connected
+                GROUP BY author
+                HAVING count(*) > :limit
+            )
+            """,
+        ).bindparams(limit=FANOUT_LIMIT),
+    )
+    op.execute(
+        """
+        INSERT INTO timeline (user_id, post_id, created_at)
+        SELECT user_id, id, created_at FROM post
+        UNION
+        SELECT
+            CASE WHEN connection.request_from = post.user_id
+                THEN connection.request_to
+                ELSE connection.request_from
+            END,
+            post.id,
+            post.created_at
+        FROM post
+        JOIN connection ON post.user_id IN (
+            connection.request_from, connection.request_to
+        )
+        WHERE post.fanned_out AND post.created_at >= connection.accepted_at
+        """,
+    )
+    op.create_index(
+        "ix_post_user_id_created_at_pulled",
+        "post",
+        ["user_id", "created_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("NOT fanned_out"),
+    )
+
+
+def downgrade() -> None:
+    """Run the downgrade migrations."""
+    op.drop_index("ix_post_user_id_created_at_pulled", table_name="post")
+    op.drop_column("post", "fanned_out")
+    op.drop_index("ix_connection_request_to", table_name="connection")
+    op.drop_index("ix_timeline_user_id_created_at", table_name="timeline")
+    op.drop_table("timeline")
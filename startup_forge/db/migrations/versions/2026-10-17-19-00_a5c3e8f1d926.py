@@ -0,0 +1,42 @@
+"""Add post counters
+
+Revision ID: a5c3e8f1d926
+Revises: 6e3a9d1f5c27
+Create Date: 2026-10-17 19:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a5c3e8f1d926"
+down_revision = "6e3a9d1f5c27"
+branch_labels = None
+depends_on = None
+
+COUNTERS = ("like_count", "comment_count", "repost_count")
+
+
+def upgrade() -> None:
+    """Run the upgrade migrations."""
+    op.create_index("ix_like_post_id", "like", ["post_id"], unique=False)
+    for counter in COUNTERS:
+        op.add_column(
+            "post",
+            sa.Column(counter, sa.Integer(), server_default="0", nullable=False),
+        )
+    op.execute(
+        """
+        UPDATE post SET
+            like_count = (SELECT count(*) FROM "like" WHERE post_id = post.id),
+            comment_count = (SELECT count(*) FROM comment WHERE post_id = post.id),
+            repost_count = (SELECT count(*) FROM repost WHERE post_id = post.id)
+        """,
+    )
+
+
+def downgrade() -> None:
+    """Run the downgrade migrations."""
+    for counter in reversed(COUNTERS):
+        op.drop_column("post", counter)
+    op.drop_index("ix_like_post_id", table_name="like")
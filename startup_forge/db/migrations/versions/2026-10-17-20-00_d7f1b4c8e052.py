@@ -0,0 +1,31 @@
+"""Add comment reply indexes
+
+Revision ID: d7f1b4c8e052
+Revises: a5c3e8f1d926
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d7f1b4c8e052"
+down_revision = "a5c3e8f1d926"
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    ("ix_comment_reply_comment_id", "comment_id"),
+    ("ix_comment_reply_reply_id", "reply_id"),
+)
+
+
+def upgrade() -> None:
+    """Run the upgrade migrations."""
+    for name, column in INDEXES:
+        op.create_index(name, "comment_reply", [column], unique=False)
+
+
+def downgrade() -> None:
+    """Run the downgrade migrations."""
+    for name, _ in reversed(INDEXES):
+        op.drop_index(name, table_name="comment_reply")
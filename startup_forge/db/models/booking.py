@@ -1,7 +1,7 @@
 from datetime import time, date as dt
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, Enum, UniqueConstraint
+from sqlalchemy import ForeignKey, Enum, Index, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql.sqltypes import Uuid, Time, Date
 
@@ -33,6 +33,10 @@ class Booking(BaseModel, Base):
     """Model for booking."""
 
     __tablename__ = "booking"
+    # Keyset of the pages of `BookingDAO.get_bookings`.
+    __table_args__ = (
+        Index("ix_booking_user_id_created_at", "user_id", "created_at", "id"),
+    )
 
     user_id: Mapped[UUID] = mapped_column(
         Uuid(), ForeignKey("user.id", ondelete="CASCADE", onupdate="CASCADE")
@@ -1,10 +1,11 @@
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import ForeignKey, PrimaryKeyConstraint
+from sqlalchemy import ForeignKey, Index, PrimaryKeyConstraint, false, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.sql.sqltypes import Uuid, String, Text, ARRAY
+from sqlalchemy.sql.sqltypes import Boolean, Integer, Uuid, String, Text, ARRAY
 
 from startup_forge.db.base import Base
+from startup_forge.db.ids import new_id
 from startup_forge.db.models.base_model import BaseModel
 
 
@@ -12,12 +13,33 @@ class Post(BaseModel, Base):
     """Model for post."""
 
     __tablename__ = "post"
+    # Keysets of the pages of `CommunityDAO.get_feed`, `get_posts` and of the
+    # posts `get_home` reads from their authors instead of the timeline.
+    __table_args__ = (
+        Index("ix_post_created_at", text("created_at DESC"), text("id DESC")),
+        Index("ix_post_user_id_created_at", "user_id", "created_at", "id"),
+        Index(
+            "ix_post_user_id_created_at_pulled",
+            "user_id",
+            "created_at",
+            "id",
+            postgresql_where=text("NOT fanned_out"),
+        ),
+    )
 
     user_id: Mapped[UUID] = mapped_column(
         Uuid(), ForeignKey("user.id", ondelete="CASCADE", onupdate="CASCADE")
     )
     text: Mapped[str] = mapped_column(Text(), nullable=True)
     files_urls: Mapped[list[str]] = mapped_column(ARRAY(String), nullable=True)
+    # Whether the post was pushed to the timelines of the author's connections.
+    fanned_out: Mapped[bool] = mapped_column(
+        Boolean(), default=False, server_default=false()
+    )
+    # Maintained by `CommunityDAO`, see `startup_forge.jobs.post_counters`.
+    like_count: Mapped[int] = mapped_column(Integer(), default=0, server_default="0")
+    comment_count: Mapped[int] = mapped_column(Integer(), default=0, server_default="0")
+    repost_count: Mapped[int] = mapped_column(Integer(), default=0, server_default="0")
 
     comments: Mapped[list["Comment"]] = relationship("Comment", back_populates="post")
     likes: Mapped[list["Like"]] = relationship("Like", back_populates="post")
@@ -27,6 +49,11 @@ class Comment(BaseModel, Base):
     """Model for comment."""
 
     __tablename__ = "comment"
+    # Keysets of the pages of `CommunityDAO.get_comments` and `get_my_comments`.
+    __table_args__ = (
+        Index("ix_comment_post_id_created_at", "post_id", "created_at", "id"),
+        Index("ix_comment_user_id_created_at", "user_id", "created_at", "id"),
+    )
 
     user_id: Mapped[UUID] = mapped_column(
         Uuid(), ForeignKey("user.id", ondelete="CASCADE", onupdate="CASCADE")
@@ -43,6 +70,8 @@ class Like(Base):
     """Model for like."""
 
     __tablename__ = "like"
+    # The primary key only covers the lookups by `user_id`.
+    __table_args__ = (Index("ix_like_post_id", "post_id"),)
 
     user_id: Mapped[UUID] = mapped_column(
         Uuid(), ForeignKey("user.id", ondelete="CASCADE", onupdate="CASCADE")
@@ -60,8 +89,13 @@ class CommentReply(Base):
     """Model for comment reply."""
 
     __tablename__ = "comment_reply"
+    # Walked both ways by `CommunityDAO.get_thread`.
+    __table_args__ = (
+        Index("ix_comment_reply_comment_id", "comment_id"),
+        Index("ix_comment_reply_reply_id", "reply_id"),
+    )
 
-    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=new_id)
     comment_id: Mapped[UUID] = mapped_column(
         Uuid(), ForeignKey("comment.id", ondelete="CASCADE", onupdate="CASCADE")
     )
@@ -1,7 +1,7 @@
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, Enum, PrimaryKeyConstraint
+from sqlalchemy import ForeignKey, Enum, Index, PrimaryKeyConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 from sqlalchemy.sql.sqltypes import Uuid, DateTime
@@ -14,6 +14,15 @@ class ConnectionRequest(Base):
     """Model for connection request."""
 
     __tablename__ = "connection_request"
+    # Keyset of the pages of `ConnectionDAO.get_requests`.
+    __table_args__ = (
+        Index(
+            "ix_connection_request_request_to_requested_at",
+            "request_to",
+            "requested_at",
+            "request_from",
+        ),
+    )
 
     request_from: Mapped[UUID] = mapped_column(
         Uuid(), ForeignKey("user.id", ondelete="CASCADE", onupdate="CASCADE")
@@ -35,6 +44,8 @@ class Connection(Base):
     """Model for connection."""
 
     __tablename__ = "connection"
+    # The primary key only covers the lookups by `request_from`.
+    __table_args__ = (Index("ix_connection_request_to", "request_to"),)
 
     request_from: Mapped[UUID] = mapped_column(
         Uuid(), ForeignKey("user.id", ondelete="CASCADE", onupdate="CASCADE")
@@ -16,7 +16,9 @@ class Experience(BaseModel, Base):
     __tablename__ = "experience"
 
     user_id: Mapped[UUID] = mapped_column(
-        Uuid(), ForeignKey("user.id", ondelete="CASCADE", onupdate="CASCADE")
+        Uuid(),
+        ForeignKey("user.id", ondelete="CASCADE", onupdate="CASCADE"),
+        index=True,
     )
     company_name: Mapped[str] = mapped_column(String(), nullable=False)
     description: Mapped[str] = mapped_column(Text(), nullable=True)
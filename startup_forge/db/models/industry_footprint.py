@@ -0,0 +1,35 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+from sqlalchemy.sql.sqltypes import BigInteger, DateTime, Integer, Uuid
+
+from startup_forge.db.base import Base
+
+
+class IndustryFootprint(Base):
+    """
+    Model for the industries a user has worked in, and their availability.
+
+    Both are stored as bitmasks, see `startup_forge.services.matching`.
+    Rows are maintained by `ExperienceDAO` and `BookingDAO` so matching never
+    has to scan the experience and time_slot tables.
+    """
+
+    __tablename__ = "industry_footprint"
+
+    user_id: Mapped[UUID] = mapped_column(
+        Uuid(),
+        ForeignKey("user.id", ondelete="CASCADE", onupdate="CASCADE"),
+        primary_key=True,
+    )
+    industries: Mapped[int] = mapped_column(Integer(), default=0)
+    current_industries: Mapped[int] = mapped_column(Integer(), default=0)
+    availability: Mapped[int] = mapped_column(
+        BigInteger(), default=0, server_default="0"
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
@@ -0,0 +1,34 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import ForeignKey, PrimaryKeyConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql.sqltypes import DateTime, Float, Integer, Uuid
+
+from startup_forge.db.base import Base
+
+
+class MentorRecommendation(Base):
+    """
+    Model for the precomputed best mentors of a mentee.
+
+    Rows are written by `startup_forge.jobs.recommendations`; `rank` follows
+    the order of `startup_forge.services.matching.top_matches`.
+    """
+
+    __tablename__ = "mentor_recommendation"
+
+    mentee_id: Mapped[UUID] = mapped_column(
+        Uuid(),
+        ForeignKey("user.id", ondelete="CASCADE", onupdate="CASCADE"),
+    )
+    rank: Mapped[int] = mapped_column(Integer())
+    mentor_id: Mapped[UUID] = mapped_column(
+        Uuid(),
+        ForeignKey("user.id", ondelete="CASCADE", onupdate="CASCADE"),
+        index=True,
+    )
+    score: Mapped[float] = mapped_column(Float())
+    computed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+
+    PrimaryKeyConstraint(mentee_id, rank)
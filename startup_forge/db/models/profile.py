@@ -1,11 +1,21 @@
 from datetime import datetime
+from enum import Enum as PyEnum
+from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
 from pydantic import HttpUrl
-from sqlalchemy import ForeignKey, Enum
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Computed, ForeignKey, Enum, Index
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
-from sqlalchemy.sql.sqltypes import String, Uuid, DateTime, Text, ARRAY
+from sqlalchemy.sql.sqltypes import (
+    String,
+    Uuid,
+    DateTime,
+    Text,
+    Integer,
+    SmallInteger,
+)
 
 from startup_forge.db.base import Base
 from startup_forge.db.models.base_model import BaseModel
@@ -18,11 +28,114 @@ from startup_forge.db.models.options import (
     Platform,
 )
 
+if TYPE_CHECKING:
+    from startup_forge.db.models.education import Education
+    from startup_forge.db.models.experience import Experience
+    from startup_forge.db.models.review import Review
+
+LANGUAGE_NAMES = list(LanguageName)
+LANGUAGE_LEVELS = list(LanguageLevel)
+
+
+def _mask_expression(column: str, options: type[PyEnum]) -> str:
+    """
+    SQL expression of the bitmask of the enum values an array holds.
+
+    Bits follow the declaration order of the enum, like
+    `startup_forge.services.matching.enum_mask`.
+
+    :param column: name of the array column.
+    :param options: enum of the values.
+    :return: SQL expression.
+    """
+    return " | ".join(
+        f"CASE WHEN {column} @> ARRAY['{option.value}']::varchar[] "
+        f"THEN {1 << position} ELSE 0 END"
+        for position, option in enumerate(options)
+    )
+
+
+def _case_expression(value: str, options: type[PyEnum]) -> str:
+    """SQL expression of the position of a value in an enum."""
+    cases = " ".join(
+        f"WHEN '{option.value}' THEN {position}"
+        for position, option in enumerate(options)
+    )
+    return f"CASE {value} {cases} END"
+
+
+def _packed_languages_expression() -> str:
+    """
+    SQL expression of the packed codes of the language pairs of a profile.
+
+    Languages are unique per profile, so there is at most one pair per
+    language name; generated columns cannot use subqueries to unnest them.
+    """
+    codes = ", ".join(
+        f"({_case_expression(f'languages[{entry}][1]', LanguageName)})"
+        f" * {len(LANGUAGE_LEVELS)}"
+        f" + ({_case_expression(f'languages[{entry}][2]', LanguageLevel)})"
+        for entry in range(1, len(LANGUAGE_NAMES) + 1)
+    )
+    return f"array_remove(ARRAY[{codes}]::smallint[], NULL)"
+
+
+def pack_language(name: LanguageName, level: LanguageLevel) -> int:
+    """
+    Encode a language and its level as in `Profile.languages_packed`.
+
+    :param name: language name.
+    :param level: language level.
+    :return: code of the pair.
+    """
+    return LANGUAGE_NAMES.index(LanguageName(name)) * len(
+        LANGUAGE_LEVELS
+    ) + LANGUAGE_LEVELS.index(LanguageLevel(level))
+
+
+def unpack_languages(
+    packed: Optional[list[int]],
+) -> list[tuple[LanguageName, LanguageLevel]]:
+    """
+    Decode `Profile.languages_packed`.
+
+    :param packed: codes of the language pairs.
+    :return: pairs of language name and level.
+    """
+    return [
+        (
+            LANGUAGE_NAMES[code // len(LANGUAGE_LEVELS)],
+            LANGUAGE_LEVELS[code % len(LANGUAGE_LEVELS)],
+        )
+        for code in packed or ()
+    ]
+
+
+# Names weigh more than the bio. The `simple` configuration does not stem
+# words, so that names are matched as typed, prefixes included.
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('simple', coalesce(first_name, '')), 'A')"
+    " || setweight(to_tsvector('simple', coalesce(last_name, '')), 'A')"
+    " || setweight(to_tsvector('simple', coalesce(bio, '')), 'B')"
+)
+
 
 class Profile(Base):
     """Model for profile."""
 
     __tablename__ = "profile"
+    # Array operators (`@>`, `&&`) used by `ProfileDAO.filter` run on these.
+    __table_args__ = (
+        Index("ix_profile_skills", "skills", postgresql_using="gin"),
+        Index("ix_profile_expertises", "expertises", postgresql_using="gin"),
+        Index("ix_profile_languages", "languages", postgresql_using="gin"),
+        Index(
+            "ix_profile_languages_packed", "languages_packed", postgresql_using="gin"
+        ),
+        Index("ix_profile_search_vector", "search_vector", postgresql_using="gin"),
+        # Keyset of the pages of `ProfileDAO.filter`.
+        Index("ix_profile_created_at", "created_at", "user_id"),
+    )
 
     first_name: Mapped[str] = mapped_column(String(length=150))
     last_name: Mapped[str] = mapped_column(String(length=150))
@@ -45,6 +158,25 @@ class Profile(Base):
     social_links: Mapped[list[list[Platform, HttpUrl]]] = mapped_column(
         ARRAY(String, dimensions=2), nullable=True
     )
+    # Compact copies of the enum arrays, computed by the database on write:
+    # bitmasks of skills, expertises and language names, and one code per
+    # (language, level) pair, see `pack_language`. The enums must fit the
+    # signed integers, `startup_forge.services.matching.mask_bits` checks it.
+    skills_mask: Mapped[int] = mapped_column(
+        Integer(), Computed(_mask_expression("skills", SkillName))
+    )
+    expertises_mask: Mapped[int] = mapped_column(
+        Integer(), Computed(_mask_expression("expertises", ExpertiseName))
+    )
+    languages_mask: Mapped[int] = mapped_column(
+        Integer(), Computed(_mask_expression("languages", LanguageName))
+    )
+    languages_packed: Mapped[list[int]] = mapped_column(
+        ARRAY(SmallInteger), Computed(_packed_languages_expression())
+    )
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR(), Computed(SEARCH_VECTOR), deferred=True
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
@@ -52,6 +184,33 @@ class Profile(Base):
         DateTime(timezone=True), server_default=func.now()
     )
 
+    # Rows of the user, only ever eager loaded, see `ProfileDAO.get_card`.
+    experiences: Mapped[list["Experience"]] = relationship(
+        "Experience",
+        primaryjoin="foreign(Experience.user_id) == Profile.user_id",
+        order_by="Experience.start_date.desc()",
+        viewonly=True,
+        lazy="raise",
+    )
+    educations: Mapped[list["Education"]] = relationship(
+        "Education",
+        primaryjoin="foreign(Education.user_id) == Profile.user_id",
+        order_by="Education.start_date.desc()",
+        viewonly=True,
+        lazy="raise",
+    )
+    # Reviews written by a mentee or about a mentor.
+    reviews: Mapped[list["Review"]] = relationship(
+        "Review",
+        primaryjoin=(
+            "or_(foreign(Review.mentee_id) == Profile.user_id, "
+            "foreign(Review.mentor_id) == Profile.user_id)"
+        ),
+        order_by="Review.created_at.desc()",
+        viewonly=True,
+        lazy="raise",
+    )
+
     def is_mentee(self) -> bool:
         """Check if profile has a mentee role"""
         return self.role == Role.MENTEE
@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql.sqltypes import Uuid, Text
 
@@ -12,6 +12,11 @@ class Review(BaseModel, Base):
     """Model for review."""
 
     __tablename__ = "review"
+    # Keysets of the pages of `ReviewDAO.get_reviews`.
+    __table_args__ = (
+        Index("ix_review_mentee_id_created_at", "mentee_id", "created_at", "id"),
+        Index("ix_review_mentor_id_created_at", "mentor_id", "created_at", "id"),
+    )
 
     mentee_id: Mapped[UUID] = mapped_column(
         Uuid(),
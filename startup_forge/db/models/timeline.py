@@ -0,0 +1,36 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql.sqltypes import DateTime, Uuid
+
+from startup_forge.db.base import Base
+
+
+class Timeline(Base):
+    """
+    Model for home timeline entry.
+
+    A post is pushed to the timeline of its author and of every connection of
+    its author when it is created, see `CommunityDAO.create_post`.
+    """
+
+    __tablename__ = "timeline"
+    # Keyset of the pages of `CommunityDAO.get_home`.
+    __table_args__ = (
+        Index("ix_timeline_user_id_created_at", "user_id", "created_at", "post_id"),
+    )
+
+    post_id: Mapped[UUID] = mapped_column(
+        Uuid(),
+        ForeignKey("post.id", ondelete="CASCADE", onupdate="CASCADE"),
+        primary_key=True,
+    )
+    user_id: Mapped[UUID] = mapped_column(
+        Uuid(),
+        ForeignKey("user.id", ondelete="CASCADE", onupdate="CASCADE"),
+        primary_key=True,
+    )
+    # Creation date of the post.
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
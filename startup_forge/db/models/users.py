@@ -1,8 +1,8 @@
 # type: ignore
 import uuid
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple, Optional
 
-from fastapi import Depends
+from fastapi import Depends, Request
 from fastapi_users import BaseUserManager, FastAPIUsers, UUIDIDMixin, schemas
 from fastapi_users.authentication import (
     AuthenticationBackend,
@@ -10,16 +10,27 @@ from fastapi_users.authentication import (
     JWTStrategy,
 )
 from fastapi_users.db import SQLAlchemyBaseUserTableUUID, SQLAlchemyUserDatabase
+from sqlalchemy import inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped, contains_eager, relationship
 
 from startup_forge.db.base import Base
+from startup_forge.db.dao.profile_dao import ProfileDAO
 from startup_forge.db.dependencies import get_db_session
+from startup_forge.db.models.profile import Profile
 from startup_forge.settings import settings
 
 
 class User(SQLAlchemyBaseUserTableUUID, Base):
     """Represents a user entity."""
 
+    # Only loaded along with the user by `UserDatabase.get`.
+    profile: Mapped[Optional[Profile]] = relationship(
+        primaryjoin="foreign(Profile.user_id) == User.id",
+        viewonly=True,
+        lazy="raise",
+    )
+
 
 class UserRead(schemas.BaseUser[uuid.UUID]):
     """Represents a read command for a user."""
@@ -40,6 +51,31 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
     verification_token_secret = settings.users_secret
 
 
+class UserDatabase(SQLAlchemyUserDatabase):
+    """
+    Users database loading the profile of a user along with the user.
+
+    The profile is set on `User.profile`, and ends up in the session, where
+    `ProfileDAO.get_profile` finds it without querying again.
+    """
+
+    async def get(self, id: uuid.UUID) -> Optional[User]:
+        """
+        Get a user and its profile with one joined query.
+
+        :param id: id of the user.
+        :return: the user, `None` if it does not exist.
+        """
+        rows = await self.session.execute(
+            select(User)
+            .outerjoin(User.profile)
+            .options(contains_eager(User.profile))
+            .where(User.id == id)
+            .execution_options(populate_existing=True),
+        )
+        return rows.scalars().first()
+
+
 async def get_user_db(
     session: AsyncSession = Depends(get_db_session),
 ) -> SQLAlchemyUserDatabase:
@@ -49,7 +85,7 @@ async def get_user_db(
     :param session: asynchronous SQLAlchemy session.
     :yields: instance of SQLAlchemyUserDatabase.
     """
-    yield SQLAlchemyUserDatabase(session, User)
+    yield UserDatabase(session, User)
 
 
 async def get_user_manager(
@@ -89,3 +125,38 @@ backends = [
 api_users = FastAPIUsers[User, uuid.UUID](get_user_manager, backends)
 
 current_active_user = api_users.current_user(active=True)
+current_superuser = api_users.current_user(active=True, superuser=True)
+
+
+class CurrentUser(NamedTuple):
+    """Authenticated user of a request and its profile, if created."""
+
+    user: User
+    profile: Optional[Profile]
+
+
+async def current_user_profile(
+    request: Request,
+    user: User = Depends(current_active_user),
+    session: AsyncSession = Depends(get_db_session),
+) -> CurrentUser:
+    """
+    Get the authenticated user and its profile.
+
+    Both come from the query resolving the token, see `UserDatabase.get`,
+    and are kept on the request so later calls never query again.
+
+    :param request: current request.
+    :param user: authenticated user.
+    :param session: asynchronous SQLAlchemy session.
+    :return: the user and its profile.
+    """
+    current = getattr(request.state, "current_user", None)
+    if current is None:
+        if "profile" in inspect(user).unloaded:
+            profile = await ProfileDAO(session).get_profile(user.id)
+        else:
+            profile = user.profile
+        current = CurrentUser(user, profile)
+        request.state.current_user = current
+    return current
@@ -0,0 +1,133 @@
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Any, Callable, Generic, NamedTuple, Optional, TypeVar
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from startup_forge.settings import settings
+
+T = TypeVar("T")
+# Sort column and unique tie breaker of a list, e.g. `created_at` and `id`.
+Keys = tuple[ColumnElement[datetime], ColumnElement[UUID]]
+
+
+def _to_json(value: Any) -> Any:
+    """
+    Make a keyset value JSON serializable.
+
+    :param value: keyset value.
+    :return: serializable value.
+    """
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Encode the keyset of the last item of a page into an opaque cursor.
+
+    :param values: keyset values.
+    :return: cursor.
+    """
+    payload = json.dumps([_to_json(value) for value in values])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: Callable[[Any], Any]) -> tuple[Any, ...]:
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    :param cursor: cursor.
+    :param types: converter of every keyset value, e.g. `UUID`.
+    :return: keyset values.
+    :raises ValueError: if the cursor is malformed.
+    """
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(payload)
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise ValueError("Malformed cursor") from exc
+    if not isinstance(values, list) or len(values) != len(types):
+        raise ValueError("Malformed cursor")
+    try:
+        return tuple(convert(value) for convert, value in zip(types, values))
+    except (TypeError, ValueError) as exc:
+        raise ValueError("Malformed cursor") from exc
+
+
+def decode_keyset(cursor: str) -> tuple[datetime, UUID]:
+    """
+    Decode a cursor produced by `paginate`.
+
+    :param cursor: cursor.
+    :return: creation date and id of the last item of the previous page.
+    :raises ValueError: if the cursor is malformed.
+    """
+    return decode_cursor(cursor, datetime.fromisoformat, UUID)
+
+
+class Page(NamedTuple, Generic[T]):
+    """Items of a page, newest first, and the cursor of the next one."""
+
+    items: list[T]
+    next_cursor: Optional[str]
+
+
+def keyset(
+    statement: Select[Any],
+    keys: Keys,
+    limit: int,
+    after: Optional[tuple[datetime, UUID]] = None,
+) -> Select[Any]:
+    """
+    Restrict a statement to a page, newest first.
+
+    One more item than requested is selected to tell whether there is a next
+    page. Resuming with a row comparison instead of an offset keeps every
+    page as cheap as the first one on an index over the keys. Pages never
+    exceed `max_page_size` items, whatever the caller asks for.
+
+    :param statement: statement selecting the items.
+    :param keys: sort column and tie breaker.
+    :param limit: maximum number of items of the page.
+    :param after: keys of the last item of the previous page.
+    :return: statement selecting the page.
+    """
+    limit = min(limit, settings.max_page_size)
+    if after is not None:
+        statement = statement.where(tuple_(*keys) < tuple_(*after))
+    return statement.order_by(*(key.desc() for key in keys)).limit(limit + 1)
+
+
+async def paginate(
+    session: AsyncSession,
+    statement: Select[tuple[T]],
+    keys: Keys,
+    limit: int,
+    after: Optional[tuple[datetime, UUID]] = None,
+) -> Page[T]:
+    """
+    Get a page of the entities a statement selects, newest first.
+
+    :param session: session to database.
+    :param statement: statement selecting the entities.
+    :param keys: sort column and tie breaker, attributes of the entities.
+    :param limit: maximum number of items of the page.
+    :param after: keys of the last item of the previous page.
+    :return: the page.
+    """
+    limit = min(limit, settings.max_page_size)
+    rows = await session.execute(keyset(statement, keys, limit, after))
+    items = list(rows.scalars())
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        next_cursor = encode_cursor(*(getattr(items[-1], key.key) for key in keys))
+    return Page(items, next_cursor)
@@ -1,44 +1,77 @@
-from sqlalchemy import text
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+from sqlalchemy import event, text
 from sqlalchemy.engine import make_url
-from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
 from startup_forge.settings import settings
 
 
-async def create_database() -> None:
-    """Create a database."""
+async def create_database(name: Optional[str] = None) -> None:
+    """
+    Create a database.
+
+    :param name: name of the database, defaults to the configured one.
+    """
+    name = name or settings.db_base
     db_url = make_url(str(settings.db_url.with_path("/postgres")))
     engine = create_async_engine(db_url, isolation_level="AUTOCOMMIT")
 
     async with engine.connect() as conn:
         database_existance = await conn.execute(
             text(
-                f"SELECT 1 FROM pg_database WHERE datname='{settings.db_base}'",  # noqa: E501, S608
+                f"SELECT 1 FROM pg_database WHERE datname='{name}'",  # noqa: E501, S608
             ),
         )
         database_exists = database_existance.scalar() == 1
 
     if database_exists:
-        await drop_database()
+        await drop_database(name)
 
     async with engine.connect() as conn:  # noqa: WPS440
         await conn.execute(
             text(
-                f'CREATE DATABASE "{settings.db_base}" ENCODING "utf8" TEMPLATE template1',  # noqa: E501
+                f'CREATE DATABASE "{name}" ENCODING "utf8" TEMPLATE template1',  # noqa: E501
             ),
         )
 
 
-async def drop_database() -> None:
-    """Drop current database."""
+async def drop_database(name: Optional[str] = None) -> None:
+    """
+    Drop current database.
+
+    :param name: name of the database, defaults to the configured one.
+    """
+    name = name or settings.db_base
     db_url = make_url(str(settings.db_url.with_path("/postgres")))
     engine = create_async_engine(db_url, isolation_level="AUTOCOMMIT")
     async with engine.connect() as conn:
         disc_users = (
             "SELECT pg_terminate_backend(pg_stat_activity.pid) "  # noqa: S608
             "FROM pg_stat_activity "
-            f"WHERE pg_stat_activity.datname = '{settings.db_base}' "
+            f"WHERE pg_stat_activity.datname = '{name}' "
             "AND pid <> pg_backend_pid();"
         )
         await conn.execute(text(disc_users))
-        await conn.execute(text(f'DROP DATABASE "{settings.db_base}"'))
+        await conn.execute(text(f'DROP DATABASE "{name}"'))
+
+
+@contextmanager
+def count_queries(engine: AsyncEngine) -> Iterator[list[str]]:
+    """
+    Record every statement executed on the engine.
+
+    :param engine: current engine.
+    :yield: list the executed statements are appended to.
+    """
+    statements: list[str] = []
+
+    def _record(*args: Any) -> None:  # noqa: WPS430
+        statements.append(args[2])
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _record)
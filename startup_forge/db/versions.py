@@ -0,0 +1,33 @@
+from typing import Any, Optional
+
+from sqlalchemy import Select, literal_column, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import func
+
+
+async def fetch_version(session: AsyncSession, statement: Select[Any]) -> Optional[str]:
+    """
+    Fingerprint the rows a statement selects.
+
+    The statement selects the key and `updated_at` of every row a response
+    is built from, so that the fingerprint changes whenever one of them is
+    created, updated or deleted, without loading nor serializing them.
+
+    :param session: session to database.
+    :param statement: statement selecting keys and `updated_at` columns.
+    :return: fingerprint of the rows, `None` if there are none.
+    """
+    rows = statement.subquery()
+    columns = list(rows.c)
+    version = await session.execute(
+        select(
+            func.md5(
+                func.string_agg(
+                    func.concat_ws(":", *columns),
+                    aggregate_order_by(literal_column("','"), *columns),
+                ),
+            ),
+        ),
+    )
+    return version.scalar_one()
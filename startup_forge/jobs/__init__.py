@@ -0,0 +1 @@
+"""Scheduled jobs for startup_forge."""
@@ -0,0 +1,108 @@
+"""
+Reconcile the like, comment and repost counters of posts.
+
+`CommunityDAO` keeps the counters up to date as posts are liked, commented
+and reposted, but rows removed by cascades (e.g. a deleted user) do not go
+through it. Posts are recounted in chunks of ids, every chunk in its own
+transaction, and only the posts whose counters drifted are written.
+
+Run it on a schedule with::
+
+    python -m startup_forge.jobs.post_counters
+"""
+import argparse
+import asyncio
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.sql import func
+
+from startup_forge.db.models.community import Comment, Like, Post, Repost
+from startup_forge.settings import settings
+
+
+async def reconcile_counters(
+    session_factory: async_sessionmaker[AsyncSession],
+    chunk_size: int,
+) -> int:
+    """
+    Recount the likes, comments and reposts of every post.
+
+    :param session_factory: factory of sessions to database.
+    :param chunk_size: number of posts recounted at once.
+    :return: number of posts whose counters were corrected.
+    """
+    likes = select(func.count()).where(Like.post_id == Post.id).scalar_subquery()
+    comments = select(func.count()).where(Comment.post_id == Post.id).scalar_subquery()
+    reposts = select(func.count()).where(Repost.post_id == Post.id).scalar_subquery()
+
+    corrected = 0
+    last_id: Optional[UUID] = None
+    while True:
+        async with session_factory() as session:
+            chunk = select(Post.id).order_by(Post.id).limit(chunk_size)
+            if last_id is not None:
+                chunk = chunk.where(Post.id > last_id)
+            post_ids = list(await session.scalars(chunk))
+            if not post_ids:
+                return corrected
+            last_id = post_ids[-1]
+            result = await session.execute(
+                update(Post)
+                .where(
+                    Post.id.in_(post_ids),
+                    or_(
+                        Post.like_count != likes,
+                        Post.comment_count != comments,
+                        Post.repost_count != reposts,
+                    ),
+                )
+                .values(
+                    like_count=likes,
+                    comment_count=comments,
+                    repost_count=reposts,
+                )
+                .execution_options(synchronize_session=False),
+            )
+            corrected += result.rowcount
+            await session.commit()
+
+
+async def _run(chunk_size: int) -> int:
+    """
+    Reconcile counters against the configured database.
+
+    :param chunk_size: number of posts recounted at once.
+    :return: number of posts whose counters were corrected.
+    """
+    engine = create_async_engine(str(settings.db_url), echo=settings.db_echo)
+    try:
+        return await reconcile_counters(
+            async_sessionmaker(engine, expire_on_commit=False),
+            chunk_size=chunk_size,
+        )
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    """Entrypoint of the job."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=settings.counter_chunk_size,
+    )
+    args = parser.parse_args()
+    corrected = asyncio.run(_run(args.chunk_size))
+    print(f"Corrected the counters of {corrected} posts")  # noqa: WPS421
+
+
+if __name__ == "__main__":
+    main()
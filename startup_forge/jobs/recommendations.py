@@ -0,0 +1,230 @@
+"""
+Precompute the best mentors of every mentee.
+
+Mentees only contribute their bitmasks to scoring, so mentees sharing
+bitmasks share their recommendations: distinct bitmasks are scored in
+chunks across a process pool and the ranked mentors are stored in the
+mentor_recommendation table for every mentee holding them.
+
+Run it on a schedule with::
+
+    python -m startup_forge.jobs.recommendations
+"""
+import argparse
+import asyncio
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.sql import func
+
+from startup_forge.db.dao.mentor_mentee_dao import MentorMenteeDAO
+from startup_forge.db.dao.mentor_recommendation_dao import MentorRecommendationDAO
+from startup_forge.db.models.mentor_recommendation import MentorRecommendation
+from startup_forge.db.models.options import Role
+from startup_forge.services.matching import (
+    MatchFeatures,
+    MentorIndex,
+    matching_weights,
+    top_matches,
+)
+from startup_forge.settings import settings
+
+Ranking = list[tuple[UUID, float]]
+
+# Mentor index of the current worker process, built once by `_init_worker`.
+_worker_index: Optional[MentorIndex] = None
+
+
+def _init_worker(mentors: Sequence[tuple[UUID, MatchFeatures]]) -> None:
+    """
+    Build the mentor index of a worker process.
+
+    :param mentors: id and bitmasks of every mentor.
+    """
+    global _worker_index  # noqa: WPS420
+    index = MentorIndex()
+    for mentor_id, features in mentors:
+        index.add(mentor_id, features)
+    _worker_index = index
+
+
+def score_features(
+    index: MentorIndex,
+    mentees: Sequence[MatchFeatures],
+    limit: int,
+    weights: dict[str, float],
+) -> dict[MatchFeatures, Ranking]:
+    """
+    Rank the best mentors for mentee bitmasks.
+
+    :param index: mentor index.
+    :param mentees: distinct mentee bitmasks.
+    :param limit: number of mentors to keep per mentee.
+    :param weights: weight of every factor.
+    :return: ranked mentor ids and compatibility per mentee bitmasks.
+    """
+    rankings = {}
+    for features in mentees:
+        scores = index.scores(features, weights)
+        rankings[features] = [
+            (index.mentor_ids[position], scores[position])
+            for position in top_matches(index.mentor_ids, scores, limit)
+        ]
+    return rankings
+
+
+def _score_chunk(
+    mentees: Sequence[MatchFeatures],
+    limit: int,
+    weights: dict[str, float],
+) -> dict[MatchFeatures, Ranking]:
+    """
+    Rank the best mentors for mentee bitmasks in a worker process.
+
+    :param mentees: distinct mentee bitmasks.
+    :param limit: number of mentors to keep per mentee.
+    :param weights: weight of every factor.
+    :return: ranked mentor ids and compatibility per mentee bitmasks.
+    """
+    if _worker_index is None:
+        raise RuntimeError("Worker was not initialized")
+    return score_features(_worker_index, mentees, limit, weights)
+
+
+async def compute_recommendations(
+    session_factory: async_sessionmaker[AsyncSession],
+    workers: int,
+    chunk_size: int,
+    limit: int,
+) -> int:
+    """
+    Compute and store the recommendations of every mentee.
+
+    Every chunk of bitmasks is written in its own transaction as soon as it
+    is scored, rows left over from mentees that were not rewritten are
+    removed at the end.
+
+    :param session_factory: factory of sessions to database.
+    :param workers: number of worker processes.
+    :param chunk_size: number of bitmasks scored, and mentees written, at once.
+    :param limit: number of mentors to store per mentee.
+    :return: number of mentees processed.
+    """
+    async with session_factory() as session:
+        computed_at: datetime = await session.scalar(select(func.now()))
+        mentor_mentee_dao = MentorMenteeDAO(session)
+        mentors = await mentor_mentee_dao.get_features(Role.MENTOR)
+        mentees = await mentor_mentee_dao.get_features(Role.MENTEE)
+
+    mentees_by_features: defaultdict[MatchFeatures, list[UUID]] = defaultdict(list)
+    for mentee_id, features in mentees:
+        mentees_by_features[features].append(mentee_id)
+    distinct_features = list(mentees_by_features)
+    weights = matching_weights()
+
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(mentors,),
+    ) as pool:
+        chunks = [
+            loop.run_in_executor(
+                pool,
+                _score_chunk,
+                distinct_features[start : start + chunk_size],
+                limit,
+                weights,
+            )
+            for start in range(0, len(distinct_features), chunk_size)
+        ]
+        for chunk in asyncio.as_completed(chunks):
+            rankings = await chunk
+            batch: dict[UUID, Ranking] = {}
+            for features, ranking in rankings.items():
+                for mentee_id in mentees_by_features[features]:
+                    batch[mentee_id] = ranking
+                    if len(batch) >= chunk_size:
+                        await _store(session_factory, batch, computed_at)
+                        batch = {}
+            await _store(session_factory, batch, computed_at)
+
+    async with session_factory() as session:
+        await session.execute(
+            delete(MentorRecommendation).where(
+                MentorRecommendation.computed_at < computed_at
+            )
+        )
+        await session.commit()
+    return len(mentees)
+
+
+async def _store(
+    session_factory: async_sessionmaker[AsyncSession],
+    recommendations: dict[UUID, Ranking],
+    computed_at: datetime,
+) -> None:
+    """
+    Store recommendations in their own transaction.
+
+    :param session_factory: factory of sessions to database.
+    :param recommendations: ranked mentor ids and compatibility per mentee id.
+    :param computed_at: time the mentor data was read.
+    """
+    if not recommendations:
+        return
+    async with session_factory() as session:
+        await MentorRecommendationDAO(session).replace_recommendations(
+            recommendations,
+            computed_at,
+        )
+        await session.commit()
+
+
+async def _run(workers: int, chunk_size: int, limit: int) -> int:
+    """
+    Compute recommendations against the configured database.
+
+    :param workers: number of worker processes.
+    :param chunk_size: number of bitmasks scored, and mentees written, at once.
+    :param limit: number of mentors to store per mentee.
+    :return: number of mentees processed.
+    """
+    engine = create_async_engine(str(settings.db_url), echo=settings.db_echo)
+    try:
+        return await compute_recommendations(
+            async_sessionmaker(engine, expire_on_commit=False),
+            workers=workers,
+            chunk_size=chunk_size,
+            limit=limit,
+        )
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    """Entrypoint of the job."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, default=settings.recommendation_workers)
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=settings.recommendation_chunk_size,
+    )
+    parser.add_argument("--limit", type=int, default=settings.recommendation_count)
+    args = parser.parse_args()
+    mentees = asyncio.run(_run(args.workers, args.chunk_size, args.limit))
+    print(f"Computed recommendations for {mentees} mentees")  # noqa: WPS421
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import heapq
+from typing import Iterator, Mapping, Sequence
+from uuid import UUID
+
+# Ranked mentor ids and compatibility of a mentee, best first.
+Preferences = Sequence[tuple[UUID, float]]
+
+
+def assign_mentees(
+    preferences: Mapping[UUID, Preferences],
+    capacities: Mapping[UUID, int],
+) -> dict[UUID, UUID]:
+    """
+    Assign mentees to mentors with mentee-proposing deferred acceptance.
+
+    Every mentee proposes to the mentors of their preferences in order.
+    A mentor holds on to the most compatible mentees up to their capacity
+    and lets go of the least compatible one when a better mentee proposes.
+    The result is stable: no mentor and mentee would both rather be
+    assigned to each other than to their current match.
+
+    :param preferences: preferences of every mentee.
+    :param capacities: number of mentees every mentor can still take.
+    :return: mentor id per assigned mentee id.
+    """
+    proposals: dict[UUID, Iterator[tuple[UUID, float]]] = {
+        mentee_id: iter(ranked) for mentee_id, ranked in preferences.items()
+    }
+    # Least compatible mentee held by every mentor on top of the heap,
+    # ties broken against the greatest id.
+    held: dict[UUID, list[tuple[float, int, UUID]]] = {}
+    free = list(proposals)
+    while free:
+        mentee_id = free.pop()
+        for mentor_id, score in proposals[mentee_id]:
+            capacity = capacities.get(mentor_id, 0)
+            if capacity < 1:
+                continue
+            mentees = held.setdefault(mentor_id, [])
+            candidate = (score, -mentee_id.int, mentee_id)
+            if len(mentees) < capacity:
+                heapq.heappush(mentees, candidate)
+                break
+            if candidate > mentees[0]:
+                _, _, rejected = heapq.heapreplace(mentees, candidate)
+                free.append(rejected)
+                break
+    return {
+        mentee_id: mentor_id
+        for mentor_id, mentees in held.items()
+        for _, _, mentee_id in mentees
+    }
@@ -0,0 +1,143 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Generic, Hashable, Optional, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+Value = TypeVar("Value")
+
+
+class TTLCache(Generic[Value]):
+    """
+    In-process LRU cache whose entries also expire after a time to live.
+
+    Caches are per process: every worker keeps its own entries, the time
+    to live bounds how long a worker can serve data another one changed.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[float, Value]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Value]:
+        """
+        Get a value.
+
+        :param key: key of the value.
+        :return: the value, `None` if it is missing or expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= self.clock():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: Hashable, value: Value) -> None:
+        """
+        Set a value, evicting the least recently used one if full.
+
+        :param key: key of the value.
+        :param value: value to cache.
+        """
+        self._entries[key] = (self.clock() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """
+        Delete a value, if cached.
+
+        :param key: key of the value.
+        """
+        self._entries.pop(key, None)
+
+    def delete_on_commit(self, session: AsyncSession, key: Hashable) -> None:
+        """
+        Delete a value now and once the session commits or rolls back.
+
+        The second deletion drops values cached by concurrent requests, or
+        read in this session, while the change was not committed yet.
+
+        :param session: session the data is changed in.
+        :param key: key of the value.
+        """
+        self.delete(key)
+
+        def _delete(*args: Any) -> None:  # noqa: WPS430
+            self.delete(key)
+
+        for event_name in ("after_commit", "after_rollback"):
+            event.listen(session.sync_session, event_name, _delete, once=True)
+
+    def clear(self) -> None:
+        """Delete every value and reset the statistics."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get the statistics of the cache.
+
+        :return: size, capacity, hits and misses.
+        """
+        return {
+            "size": len(self),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class VersionCounter:
+    """
+    Process-wide version of some data, part of the keys of cached results.
+
+    Bumping the version makes every result cached before unreachable.
+    """
+
+    def __init__(self) -> None:
+        self.value = 0
+
+    def bump(self) -> None:
+        """Move to a new version."""
+        self.value += 1
+
+    def bump_on_commit(self, session: AsyncSession) -> None:
+        """
+        Move to a new version now and once the session commits.
+
+        The second bump drops results computed by concurrent requests while
+        the change was not committed yet.
+
+        :param session: session the data is changed in.
+        """
+        self.bump()
+        event.listen(
+            session.sync_session,
+            "after_commit",
+            self._after_commit,
+            once=True,
+        )
+
+    def _after_commit(self, *args: Any) -> None:
+        self.bump()
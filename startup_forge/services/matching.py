@@ -0,0 +1,417 @@
+import heapq
+from array import array
+from datetime import time
+from enum import Enum
+from functools import lru_cache
+from typing import Callable, Iterable, NamedTuple, Optional, Sequence
+from uuid import UUID
+
+from startup_forge.db.models.options import (
+    Day,
+    ExpertiseName,
+    Industry,
+    LanguageName,
+    RelatedIndustry,
+    SkillName,
+)
+from startup_forge.services.cache import TTLCache, VersionCounter
+from startup_forge.settings import settings
+
+# Bitmasks are stored in signed 32 bits columns, see `Profile` and
+# `IndustryFootprint`, so an enum must not outgrow their positive range.
+MASK_BITS = 31
+# Typecodes of the unsigned arrays, by the number of bits they hold.
+ARRAY_TYPECODES = {8 * array(typecode).itemsize: typecode for typecode in "LIHB"}
+
+
+def mask_bits(options: type[Enum]) -> int:
+    """
+    Get the width of the bitmasks of an enum.
+
+    :param options: enum encoded as a bitmask.
+    :raises ValueError: if the enum has more values than a column holds.
+    :return: number of bits.
+    """
+    if len(options) > MASK_BITS:
+        raise ValueError(
+            f"{options.__name__} has {len(options)} values, "
+            f"bitmask columns hold {MASK_BITS}",
+        )
+    return len(options)
+
+
+def mask_typecode(bits: int) -> str:
+    """
+    Get the typecode of the narrowest array storing bitmasks of a width.
+
+    :param bits: width of the bitmasks.
+    :return: array typecode.
+    """
+    return ARRAY_TYPECODES[min(size for size in ARRAY_TYPECODES if size >= bits)]
+
+
+def mask_bytes(bits: int) -> int:
+    """
+    Get the number of bytes of bitmasks of a width.
+
+    :param bits: width of the bitmasks.
+    :return: number of bytes.
+    """
+    return -(-bits // 8)
+
+
+# Every industry owns one bit, in the declaration order of the enum.
+# New industries must therefore only ever be appended to `Industry`.
+INDUSTRY_BITS: dict[Industry, int] = {
+    industry: 1 << position for position, industry in enumerate(Industry)
+}
+FULL_MASK = (1 << mask_bits(Industry)) - 1
+
+DAYS = list(Day)
+MINUTES_PER_DAY = 24 * 60
+AVAILABILITY_BLOCK_MINUTES = 3 * 60
+AVAILABILITY_BLOCKS_PER_DAY = MINUTES_PER_DAY // AVAILABILITY_BLOCK_MINUTES
+AVAILABILITY_BLOCKS = len(DAYS) * AVAILABILITY_BLOCKS_PER_DAY  # fits a BIGINT
+
+# Bumped whenever mentor data that matching relies on changes.
+mentor_set_version = VersionCounter()
+# Ranked mentor ids and compatibility, keyed by the mentee's bitmasks, the
+# mentor set version and the page requested.
+match_cache: TTLCache[list[tuple[UUID, float]]] = TTLCache(
+    maxsize=settings.match_cache_size,
+    ttl=settings.match_cache_ttl,
+)
+
+
+def industry_mask(industries: Iterable[Optional[Industry]]) -> int:
+    """
+    Encode industries as a bitmask.
+
+    :param industries: industries, `None` values are ignored.
+    :return: bitmask of the industries.
+    """
+    mask = 0
+    for industry in industries:
+        if industry is not None:
+            mask |= INDUSTRY_BITS[Industry(industry)]
+    return mask
+
+
+def _build_tables() -> tuple[list[int], list[int]]:
+    """
+    Precompute popcount and related industries for every possible bitmask.
+
+    :return: popcount table and related industries table.
+    """
+    popcount = [0] * (FULL_MASK + 1)
+    related = [0] * (FULL_MASK + 1)
+    related_bits = [
+        industry_mask(RelatedIndustry[industry.name]) for industry in Industry
+    ]
+    for mask in range(1, FULL_MASK + 1):
+        rest = mask & (mask - 1)  # mask without its lowest bit
+        lowest = (mask ^ rest).bit_length() - 1
+        popcount[mask] = popcount[rest] + 1
+        related[mask] = related[rest] | related_bits[lowest]
+    return popcount, related
+
+
+POPCOUNT, RELATED_MASKS = _build_tables()
+
+
+def decode_mask(mask: int) -> set[Industry]:
+    """
+    Decode a bitmask into industries.
+
+    :param mask: bitmask of industries.
+    :return: set of industries.
+    """
+    return {industry for industry, bit in INDUSTRY_BITS.items() if mask & bit}
+
+
+@lru_cache(maxsize=None)
+def _enum_bits(options: type[Enum]) -> dict[str, int]:
+    """Bit of every value of an enum, in declaration order."""
+    return {option.value: 1 << position for position, option in enumerate(options)}
+
+
+def enum_mask(options: type[Enum], values: Optional[Iterable[str]]) -> int:
+    """
+    Encode enum values as a bitmask, in the declaration order of the enum.
+
+    :param options: enum the values belong to.
+    :param values: values, unknown values are ignored.
+    :return: bitmask of the values.
+    """
+    bits = _enum_bits(options)
+    mask = 0
+    for value in values or ():
+        mask |= bits.get(value, 0)
+    return mask
+
+
+def language_mask(languages: Optional[Iterable[Sequence[str]]]) -> int:
+    """
+    Encode the languages of a profile as a bitmask, regardless of level.
+
+    :param languages: pairs of language name and level.
+    :return: bitmask of the language names.
+    """
+    return enum_mask(LanguageName, (language[0] for language in languages or ()))
+
+
+def _utc_minutes(value: time) -> int:
+    """
+    Get the minutes elapsed since midnight UTC, outside of 0-1439 if needed.
+
+    :param value: time of the day.
+    :return: minutes since midnight UTC.
+    """
+    minutes = value.hour * 60 + value.minute
+    offset = value.utcoffset()
+    if offset:
+        minutes -= int(offset.total_seconds()) // 60
+    return minutes
+
+
+def availability_mask(slots: Iterable[tuple[Day, time, time]]) -> int:
+    """
+    Encode weekly time slots as a bitmask of UTC blocks of the week.
+
+    Every day is split in `AVAILABILITY_BLOCKS_PER_DAY` blocks starting on
+    monday, a slot sets the bit of every block it overlaps.
+
+    :param slots: day, start time and end time of every slot.
+    :return: bitmask of the blocks.
+    """
+    mask = 0
+    for day, start_time, end_time in slots:
+        day_start = DAYS.index(Day(day)) * MINUTES_PER_DAY
+        start = day_start + _utc_minutes(start_time)
+        end = day_start + _utc_minutes(end_time)
+        if end <= start:  # the slot ends on the next day
+            end += MINUTES_PER_DAY
+        first_block = start // AVAILABILITY_BLOCK_MINUTES
+        last_block = -(-end // AVAILABILITY_BLOCK_MINUTES)
+        for block in range(first_block, last_block):
+            mask |= 1 << (block % AVAILABILITY_BLOCKS)
+    return mask
+
+
+class MatchFeatures(NamedTuple):
+    """Bitmasks a profile is matched on, one per factor."""
+
+    industries: int = 0
+    skills: int = 0
+    expertises: int = 0
+    languages: int = 0
+    availability: int = 0
+
+
+def profile_features(
+    skills: Optional[Iterable[str]],
+    expertises: Optional[Iterable[str]],
+    languages: Optional[Iterable[Sequence[str]]],
+    industries: int,
+    availability: int,
+) -> MatchFeatures:
+    """
+    Build the bitmasks of a profile.
+
+    :param skills: skills of the profile.
+    :param expertises: expertises of the profile.
+    :param languages: pairs of language name and level of the profile.
+    :param industries: industry bitmask of the user.
+    :param availability: availability bitmask of the user.
+    :return: bitmasks of the profile.
+    """
+    return MatchFeatures(
+        industries=industries,
+        skills=enum_mask(SkillName, skills),
+        expertises=enum_mask(ExpertiseName, expertises),
+        languages=language_mask(languages),
+        availability=availability,
+    )
+
+
+def _popcount(mask: int) -> int:
+    """Number of bits set, for bitmasks wider than `POPCOUNT`."""
+    return bin(mask).count("1")
+
+
+def _industry_score(mentor_mask: int, mentee_mask: int) -> float:
+    """
+    Score industries.
+
+    Half of the score comes from the share of the mentee's industries the
+    mentor has worked in, the other half from the share of the mentee's
+    related industries covered by the mentor's related industries.
+    """
+    mentee_related = RELATED_MASKS[mentee_mask]
+    return (
+        POPCOUNT[mentor_mask & mentee_mask] / POPCOUNT[mentee_mask]
+        + POPCOUNT[RELATED_MASKS[mentor_mask] & mentee_related]
+        / max(POPCOUNT[mentee_related], 1)
+    ) / 2
+
+
+def _language_score(mentor_mask: int, mentee_mask: int) -> float:
+    """Any shared language is enough to communicate."""
+    return 1.0 if mentor_mask & mentee_mask else 0.0
+
+
+# Factors scored by a function of the mentor's and the (non zero) mentee's
+# bitmasks, evaluated once per distinct bitmask of the column, along with
+# the typecode of the array storing the column.
+MASK_FACTORS: dict[str, tuple[Callable[[int, int], float], str]] = {
+    "industries": (_industry_score, mask_typecode(mask_bits(Industry))),
+    "languages": (_language_score, mask_typecode(mask_bits(LanguageName))),
+}
+# Factors scored as the share of the mentee's bits the mentor has, along
+# with their width in bytes. They are stored and scored one byte at a time
+# so any width only costs 256 entry lookup tables.
+SHARE_FACTORS: dict[str, int] = {
+    "skills": mask_bytes(mask_bits(SkillName)),
+    "expertises": mask_bytes(mask_bits(ExpertiseName)),
+    "availability": mask_bytes(AVAILABILITY_BLOCKS),
+}
+
+
+class MentorIndex:
+    """
+    Column-oriented store of mentor bitmasks.
+
+    Mentors are kept as compact arrays, one per factor or per byte of a
+    factor. Scoring a mentee builds a lookup table per column and maps and
+    sums the columns with builtins, so adding mentors or factors does not
+    add Python-level work per mentor.
+    """
+
+    def __init__(self) -> None:
+        self.mentor_ids: list[UUID] = []
+        self.columns = {
+            factor: array(typecode) for factor, (_, typecode) in MASK_FACTORS.items()
+        }
+        self.byte_columns = {
+            factor: [array("B") for _ in range(width)]
+            for factor, width in SHARE_FACTORS.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.mentor_ids)
+
+    def add(self, mentor_id: UUID, features: MatchFeatures) -> None:
+        """
+        Add a mentor to the index.
+
+        :param mentor_id: id of the mentor.
+        :param features: bitmasks of the mentor.
+        """
+        self.mentor_ids.append(mentor_id)
+        for factor, mask in zip(MatchFeatures._fields, features):
+            if factor in self.columns:
+                self.columns[factor].append(mask)
+                continue
+            columns = self.byte_columns[factor]
+            for column, byte in zip(columns, mask.to_bytes(len(columns), "little")):
+                column.append(byte)
+
+    def scores(
+        self,
+        mentee: MatchFeatures,
+        weights: Optional[dict[str, float]] = None,
+    ) -> list[float]:
+        """
+        Score every mentor of the index against a mentee.
+
+        Factors the mentee has no data for are left out and the weights of the
+        others are scaled back to a total of 1.
+
+        :param mentee: bitmasks of the mentee.
+        :param weights: weight of every factor, defaults to the settings.
+        :return: compatibility between 0 and 1, in the order of `mentor_ids`.
+        """
+        if weights is None:
+            weights = matching_weights()
+        factors = [
+            (factor, weights[factor], mask)
+            for factor, mask in zip(MatchFeatures._fields, mentee)
+            if mask and weights.get(factor)
+        ]
+        total_weight = sum(weight for _, weight, _ in factors)
+        if not factors or not total_weight:
+            return [0.0] * len(self)
+
+        weighted_columns = []
+        for factor, weight, mentee_mask in factors:
+            weight /= total_weight
+            if factor in MASK_FACTORS:
+                score, _ = MASK_FACTORS[factor]
+                column = self.columns[factor]
+                table = {
+                    mask: weight * score(mask, mentee_mask) for mask in set(column)
+                }
+                weighted_columns.append(map(table.__getitem__, column))
+                continue
+            scale = weight / _popcount(mentee_mask)
+            for column in self.byte_columns[factor]:
+                mentee_byte = mentee_mask & 0xFF
+                mentee_mask >>= 8
+                if mentee_byte:
+                    byte_table = [
+                        scale * POPCOUNT[value & mentee_byte] for value in range(256)
+                    ]
+                    weighted_columns.append(map(byte_table.__getitem__, column))
+        if len(weighted_columns) == 1:
+            return list(weighted_columns[0])
+        return list(map(sum, zip(*weighted_columns)))
+
+
+def matching_weights() -> dict[str, float]:
+    """
+    Get the configured weight of every factor.
+
+    :return: weight per factor.
+    """
+    return {
+        factor: getattr(settings, f"matching_{factor}_weight")
+        for factor in MatchFeatures._fields
+    }
+
+
+def top_matches(
+    mentor_ids: list[UUID],
+    scores: list[float],
+    limit: int,
+    min_score: float = 0.0,
+    after: Optional[tuple[float, UUID]] = None,
+) -> list[int]:
+    """
+    Select the best mentors with a bounded heap.
+
+    Mentors are ranked by score, ties broken by id, so that a page can be
+    resumed from the last mentor of the previous one.
+
+    :param mentor_ids: ids of the mentors.
+    :param scores: score of every mentor.
+    :param limit: maximum number of mentors to select.
+    :param min_score: minimum score of a selected mentor.
+    :param after: score and id of the last mentor of the previous page.
+    :return: positions of the selected mentors, best first.
+    """
+    candidates = (
+        position for position, score in enumerate(scores) if score >= min_score
+    )
+    if after is not None:
+        after_score, after_id = after
+        candidates = (
+            position
+            for position in candidates
+            if scores[position] < after_score
+            or (scores[position] == after_score and mentor_ids[position] > after_id)
+        )
+    return heapq.nlargest(
+        limit,
+        candidates,
+        key=lambda position: (scores[position], -mentor_ids[position].int),
+    )
@@ -0,0 +1,89 @@
+import asyncio
+from typing import Iterable, Optional
+from uuid import UUID
+
+from fastapi import Depends
+
+from startup_forge.db.dao.profile_dao import ProfileDAO
+from startup_forge.db.models.profile import Profile
+
+
+class ProfileLoader:
+    """
+    Request-scoped batcher for profiles.
+
+    Profiles requested while the event loop is busy elsewhere are fetched
+    together with `ProfileDAO.get_profiles` once it gets to run, and every
+    profile is fetched at most once per loader. FastAPI caches dependencies
+    per request, so views and dependencies declaring
+    `ProfileLoader = Depends()` share one loader.
+    """
+
+    def __init__(self, profile_dao: ProfileDAO = Depends()):
+        self.profile_dao = profile_dao
+        self._profiles: dict[UUID, asyncio.Future[Optional[Profile]]] = {}
+        self._queue: list[UUID] = []
+        self._dispatch_task: Optional[asyncio.Task[None]] = None
+        # The session runs one statement at a time.
+        self._lock = asyncio.Lock()
+
+    def prime(self, profile: Profile) -> None:
+        """
+        Remember a profile loaded by other means.
+
+        :param profile: the profile.
+        """
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(profile)
+        self._profiles[profile.user_id] = future
+
+    async def load(self, user_id: UUID) -> Optional[Profile]:
+        """
+        Get a profile.
+
+        :param user_id: id of the profile.
+        :return: the profile, `None` if it does not exist.
+        """
+        return await self._future(user_id)
+
+    async def load_many(self, user_ids: Iterable[UUID]) -> list[Optional[Profile]]:
+        """
+        Get several profiles.
+
+        :param user_ids: ids of the profiles.
+        :return: the profiles in the order of the ids, `None` for missing ones.
+        """
+        return list(
+            await asyncio.gather(*(self._future(user_id) for user_id in user_ids))
+        )
+
+    def _future(self, user_id: UUID) -> "asyncio.Future[Optional[Profile]]":
+        """
+        Get the future of a profile, queueing it if it is not known yet.
+
+        :param user_id: id of the profile.
+        :return: future of the profile.
+        """
+        future = self._profiles.get(user_id)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._profiles[user_id] = future
+            self._queue.append(user_id)
+            if self._dispatch_task is None:
+                self._dispatch_task = asyncio.ensure_future(self._dispatch())
+        return future
+
+    async def _dispatch(self) -> None:
+        """Fetch the queued profiles and resolve their futures."""
+        async with self._lock:
+            user_ids, self._queue = self._queue, []
+            self._dispatch_task = None
+            try:
+                profiles = await self.profile_dao.get_profiles(user_ids)
+            except Exception as error:
+                for user_id in user_ids:
+                    self._profiles.pop(user_id).set_exception(error)
+                return
+        by_id = {profile.user_id: profile for profile in profiles}
+        for user_id in user_ids:
+            self._profiles[user_id].set_result(by_id.get(user_id))
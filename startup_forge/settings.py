@@ -49,6 +49,48 @@ class Settings(BaseSettings):
     db_base: str = os.getenv("STARTUP_FORGE_DB_BASE", "startup_forge")  #"startup_forge"
     db_echo: bool = False
 
+    # Weight of every factor of mentor compatibility
+    matching_industries_weight: float = 0.4
+    matching_skills_weight: float = 0.15
+    matching_expertises_weight: float = 0.15
+    matching_languages_weight: float = 0.15
+    matching_availability_weight: float = 0.15
+
+    # In-process cache of match results
+    match_cache_size: int = 10000
+    match_cache_ttl: float = 60
+    # In-process cache of profiles, see `ProfileDAO.get_profile`
+    profile_cache_size: int = 10000
+    profile_cache_ttl: float = 30
+
+    # Generate time-ordered UUIDv7 primary keys, see `startup_forge.db.ids`
+    time_ordered_ids: bool = True
+
+    # Size of the pages of lists, see `startup_forge.web.pagination.PageParams`
+    page_size: int = 20
+    max_page_size: int = 100
+
+    # Posts of authors with more connections are not pushed to the timelines
+    # of their connections, see `startup_forge.db.dao.community_dao`
+    timeline_fanout_limit: int = 500
+
+    # Levels of comments and replies per comment loaded with a thread, see
+    # `startup_forge.db.dao.community_dao.CommunityDAO.get_thread`
+    thread_max_depth: int = 10
+    thread_max_replies: int = 50
+
+    # Cohort assignment, see `MentorMenteeDAO.assign_cohort`
+    mentor_capacity: int = 5
+    cohort_candidates: int = 200
+
+    # Precomputed mentor recommendations, see `startup_forge.jobs.recommendations`
+    recommendation_count: int = 100
+    recommendation_workers: int = os.cpu_count() or 1
+    recommendation_chunk_size: int = 1000
+
+    # Counter reconciliation, see `startup_forge.jobs.post_counters`
+    counter_chunk_size: int = 1000
+
     @property
     def db_url(self) -> URL:
         """
@@ -0,0 +1,149 @@
+import asyncio
+import random
+import uuid
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.sql import func
+from starlette import status
+
+from startup_forge.db.dao.mentor_mentee_dao import ASSIGNMENT_LOCK, MentorMenteeDAO
+from startup_forge.db.models.mentor_mentee import MentorMentee
+from startup_forge.db.models.options import Industry, Role
+from startup_forge.db.models.profile import Profile
+from startup_forge.db.models.users import User
+from startup_forge.services.assignment import assign_mentees
+from startup_forge.tests.utils import create_user
+
+
+def test_assign_mentees_is_stable() -> None:
+    """Tests that assignments respect capacities and have no blocking pair."""
+    rng = random.Random(0)
+    mentors = [uuid.uuid4() for _ in range(6)]
+    mentees = [uuid.uuid4() for _ in range(20)]
+    capacities = {mentor_id: rng.randint(0, 3) for mentor_id in mentors}
+    scores = {
+        (mentee_id, mentor_id): rng.choice([0.1, 0.2, 0.5, 0.9])
+        for mentee_id in mentees
+        for mentor_id in mentors
+    }
+    preferences = {
+        mentee_id: sorted(
+            ((mentor_id, scores[mentee_id, mentor_id]) for mentor_id in mentors),
+            key=lambda mentor: (-mentor[1], mentor[0]),
+        )
+        for mentee_id in mentees
+    }
+
+    assignments = assign_mentees(preferences, capacities)
+
+    for mentor_id in mentors:
+        load = list(assignments.values()).count(mentor_id)
+        assert load <= capacities[mentor_id]
+    assert len(assignments) == min(len(mentees), sum(capacities.values()))
+
+    def rank(mentee_id: uuid.UUID, mentor_id: uuid.UUID) -> int:
+        return [mentor for mentor, _ in preferences[mentee_id]].index(mentor_id)
+
+    for mentee_id in mentees:
+        current = assignments.get(mentee_id)
+        for mentor_id in mentors:
+            if current is not None and rank(mentee_id, mentor_id) >= rank(
+                mentee_id, current
+            ):
+                continue
+            held = [
+                (scores[other, mentor_id], -other.int)
+                for other, assigned in assignments.items()
+                if assigned == mentor_id
+            ]
+            candidate = (scores[mentee_id, mentor_id], -mentee_id.int)
+            blocking = len(held) < capacities[mentor_id] or (
+                held and candidate > min(held)
+            )
+            assert not blocking
+
+
+@pytest.mark.anyio
+async def test_assign_cohort(
+    fastapi_app: FastAPI,
+    authenticated_client: AsyncClient,
+    dbsession: AsyncSession,
+) -> None:
+    """Tests that a cohort is assigned in one call within mentor capacities."""
+    url = fastapi_app.url_path_for("assign_cohort")
+    fintech = await create_user(dbsession, Role.MENTOR, [Industry.FINTECH])
+    busy = await create_user(dbsession, Role.MENTOR, [Industry.FINTECH])
+    edtech = await create_user(dbsession, Role.MENTOR, [Industry.EDTECH])
+    mentees: list[Profile] = [
+        await create_user(dbsession, Role.MENTEE, [Industry.FINTECH]) for _ in range(4)
+    ]
+    matched = await create_user(dbsession, Role.MENTEE, [Industry.FINTECH])
+    dbsession.add(MentorMentee(mentor_id=busy.user_id, mentee_id=matched.user_id))
+    await dbsession.flush()
+    mentee_ids = [str(mentee.user_id) for mentee in (*mentees, matched)]
+
+    response = await authenticated_client.post(
+        url,
+        json={"mentee_ids": mentee_ids, "capacity": 2},
+    )
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    user = await dbsession.scalar(select(User).where(User.email == "test@email.com"))
+    user.is_superuser = True
+    await dbsession.flush()
+
+    response = await authenticated_client.post(
+        url,
+        json={"mentee_ids": mentee_ids, "capacity": 2},
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    result = response.json()
+    assigned = {item["mentee_id"]: item["mentor_id"] for item in result["assigned"]}
+    assert len(assigned) == 4
+    assert result["unassigned"] == [str(matched.user_id)]
+    assert list(assigned.values()).count(str(fintech.user_id)) == 2
+    assert list(assigned.values()).count(str(busy.user_id)) == 1
+    assert list(assigned.values()).count(str(edtech.user_id)) == 1
+
+    rows = await dbsession.execute(
+        select(MentorMentee).where(MentorMentee.mentor_id == fintech.user_id)
+    )
+    assert len(rows.scalars().all()) == 2
+
+
+@pytest.mark.anyio
+async def test_assign_cohort_serialized(
+    dbsession: AsyncSession,
+    _engine: AsyncEngine,
+) -> None:
+    """Tests that concurrent assignments wait for each other to fill places."""
+    mentor = await create_user(dbsession, Role.MENTOR, [Industry.FINTECH])
+    cohorts = [
+        [await create_user(dbsession, Role.MENTEE, [Industry.FINTECH])]
+        for _ in range(2)
+    ]
+    dao = MentorMenteeDAO(dbsession)
+
+    # Another run holds the lock, this one must not read capacities meanwhile.
+    async with _engine.connect() as other:
+        await other.execute(select(func.pg_advisory_lock(ASSIGNMENT_LOCK)))
+        run = asyncio.create_task(
+            dao.assign_cohort([cohorts[0][0].user_id], capacity=1, candidates=10)
+        )
+        await asyncio.sleep(0.2)
+        assert not run.done()
+        await other.execute(select(func.pg_advisory_unlock(ASSIGNMENT_LOCK)))
+        assert await run == {cohorts[0][0].user_id: mentor.user_id}
+
+    # The place taken by the first run is seen by the next one.
+    assert not await dao.assign_cohort(
+        [cohorts[1][0].user_id], capacity=1, candidates=10
+    )
+    rows = await dbsession.execute(
+        select(MentorMentee).where(MentorMentee.mentor_id == mentor.user_id)
+    )
+    assert len(rows.scalars().all()) == 1
@@ -0,0 +1,36 @@
+import random
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from startup_forge.benchmarks.dataset import populate
+from startup_forge.db.dao.industry_footprint_dao import IndustryFootprintDAO
+from startup_forge.db.models.industry_footprint import IndustryFootprint
+from startup_forge.db.models.options import Role
+from startup_forge.db.models.profile import Profile
+
+
+@pytest.mark.anyio
+async def test_dataset_footprints(dbsession: AsyncSession) -> None:
+    """Tests that generated footprints match what the DAOs maintain."""
+    await populate(dbsession, random.Random(0), Role.MENTOR, 20)
+    profiles = await dbsession.scalars(select(Profile.user_id))
+    footprints = IndustryFootprintDAO(dbsession)
+    for user_id in profiles.all():
+        generated = await dbsession.scalar(
+            select(IndustryFootprint).where(IndustryFootprint.user_id == user_id)
+        )
+        expected = (
+            generated.industries,
+            generated.current_industries,
+            generated.availability,
+        )
+        await footprints.refresh(user_id)
+        await footprints.refresh_availability(user_id)
+        await dbsession.refresh(generated)
+        assert (
+            generated.industries,
+            generated.current_industries,
+            generated.availability,
+        ) == expected
@@ -0,0 +1,122 @@
+import uuid
+from datetime import date
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from starlette import status
+
+from startup_forge.db.dao.experience_dao import ExperienceDAO
+from startup_forge.db.dao.profile_dao import ProfileDAO, profile_cache
+from startup_forge.db.models.options import Industry, Role, SkillName
+from startup_forge.db.models.profile import Profile
+from startup_forge.db.models.users import User
+from startup_forge.services.cache import TTLCache
+from startup_forge.services.matching import match_cache, mentor_set_version
+from startup_forge.db.utils import count_queries
+from startup_forge.tests.utils import create_user
+
+
+def test_ttl_cache() -> None:
+    """Tests LRU eviction, expiry and statistics."""
+    now = [0.0]
+    cache: TTLCache[int] = TTLCache(maxsize=2, ttl=10, clock=lambda: now[0])
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)  # evicts "b", the least recently used
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+    now[0] = 10
+    assert cache.get("a") is None
+    assert len(cache) == 1
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 2
+
+
+@pytest.mark.anyio
+async def test_request_matches_cache(
+    fastapi_app: FastAPI,
+    authenticated_client3: AsyncClient,
+    mentee_profile: Profile,
+    dbsession: AsyncSession,
+    _engine: AsyncEngine,
+) -> None:
+    """Tests that polling matches is served from cache until mentors change."""
+    await ExperienceDAO(dbsession).create_experience(
+        user_id=mentee_profile.user_id,
+        company_name=uuid.uuid4().hex,
+        start_date=date(2020, 1, 1),
+        industry=Industry.FINTECH,
+    )
+    mentor = await create_user(dbsession, Role.MENTOR, [Industry.FINTECH])
+    url = fastapi_app.url_path_for("request_matches")
+
+    with count_queries(_engine) as first_queries:
+        first = await authenticated_client3.get(url)
+    with count_queries(_engine) as second_queries:
+        second = await authenticated_client3.get(url)
+    assert first.status_code == second.status_code == status.HTTP_200_OK
+    assert first.json() == second.json()
+    assert len(second_queries) < len(first_queries)
+    assert match_cache.hits == 1
+
+    version = mentor_set_version.value
+    await ExperienceDAO(dbsession).create_experience(
+        user_id=mentor.user_id,
+        company_name=uuid.uuid4().hex,
+        start_date=date(2020, 1, 1),
+        industry=Industry.AI,
+    )
+    assert mentor_set_version.value > version
+    with count_queries(_engine) as third_queries:
+        await authenticated_client3.get(url)
+    assert len(third_queries) == len(first_queries)
+
+
+@pytest.mark.anyio
+async def test_profile_cache(
+    fastapi_app: FastAPI,
+    authenticated_client: AsyncClient,
+    dbsession: AsyncSession,
+    _engine: AsyncEngine,
+) -> None:
+    """Tests that profiles are read through the cache and invalidated."""
+    profile = await create_user(dbsession, Role.MENTOR, [])
+    user_id = profile.user_id
+    dao = ProfileDAO(dbsession)
+    dbsession.expunge_all()
+
+    with count_queries(_engine) as queries:
+        first = await dao.get_profile(user_id)  # database
+        dbsession.expunge_all()
+        cached = await dao.get_profile(user_id)  # cache
+        assert await dao.get_profile(user_id) is cached  # session
+    assert len(queries) == 1
+    assert cached is not first
+    assert cached.first_name == first.first_name
+    assert profile_cache.stats()["hits"] == 1
+
+    # Cached profiles behave like loaded ones.
+    cached.bio = "Mentor."
+    await dbsession.flush()
+    await dao.register_skills(user_id, SkillName.LEADERSHIP)
+    assert profile_cache.get(user_id) is None
+    dbsession.expunge_all()
+    with count_queries(_engine) as queries:
+        profile = await dao.get_profile(user_id)
+    assert len(queries) == 1
+    assert profile.bio == "Mentor."
+    assert profile.skills == [SkillName.LEADERSHIP]
+
+    url = fastapi_app.url_path_for("cache_stats")
+    response = await authenticated_client.get(url)
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+    user = await dbsession.scalar(select(User).where(User.email == "test@email.com"))
+    user.is_superuser = True
+    await dbsession.flush()
+    response = await authenticated_client.get(url)
+    assert response.json()["profiles"]["size"] == 1
@@ -0,0 +1,161 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from starlette import status
+
+from startup_forge.db.dao.community_dao import CommentNode, CommunityDAO
+from startup_forge.db.models.community import Comment, Post
+from startup_forge.db.models.options import Role
+from startup_forge.db.models.profile import Profile
+from startup_forge.jobs.post_counters import reconcile_counters
+from startup_forge.db.utils import count_queries
+from startup_forge.tests.utils import create_user
+
+
+@pytest.mark.anyio
+async def test_counters(
+    fastapi_app: FastAPI,
+    authenticated_client3: AsyncClient,
+    mentee_profile: Profile,
+    dbsession: AsyncSession,
+) -> None:
+    """Tests that post counters follow likes, comments and reposts."""
+    other = await create_user(dbsession, Role.MENTOR, [])
+    dao = CommunityDAO(dbsession)
+    post = await dao.create_post(mentee_profile.user_id, text="Hello.")
+    await dao.like_unlike(post.id, other.user_id)
+    await dao.create_comment(other.user_id, "Hi.", post.id)
+    await dbsession.flush()
+    url = fastapi_app.url_path_for("get_my_posts")
+    etag = (await authenticated_client3.get(url)).headers["ETag"]
+
+    response = await authenticated_client3.post(
+        fastapi_app.url_path_for("like_unlike", post_id=str(post.id))
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    response = await authenticated_client3.post(
+        fastapi_app.url_path_for("create_comment", post_id=str(post.id)),
+        json={"content": "Thanks."},
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    response = await authenticated_client3.post(
+        fastapi_app.url_path_for("create_post"),
+        json={"text": None, "files_urls": None, "post_id": str(post.id)},
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    comment = await dbsession.scalar(
+        select(Comment).where(Comment.user_id == other.user_id)
+    )
+    await dao.delete_comment(comment.id)
+    await dao.like_unlike(post.id, other.user_id)  # unlike
+    await dbsession.flush()
+
+    response = await authenticated_client3.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    counts = {
+        item["id"]: (item["like_count"], item["comment_count"], item["repost_count"])
+        for item in response.json()["items"]
+    }
+    assert counts[str(post.id)] == (1, 1, 1)
+
+    await dbsession.execute(
+        update(Post)
+        .where(Post.id == post.id)
+        .values(like_count=7, comment_count=0, repost_count=3)
+    )
+    # Sessions bound to the test connection share its rolled back transaction.
+    session_factory = async_sessionmaker(dbsession.bind, expire_on_commit=False)
+    assert await reconcile_counters(session_factory, chunk_size=1) >= 1
+    await dbsession.refresh(post)
+    assert (post.like_count, post.comment_count, post.repost_count) == (1, 1, 1)
+
+
+@pytest.mark.anyio
+async def test_like_toggle(
+    fastapi_app: FastAPI,
+    authenticated_client3: AsyncClient,
+    mentee_profile: Profile,
+    dbsession: AsyncSession,
+    _engine: AsyncEngine,
+) -> None:
+    """Tests that a like is toggled, and counted, by a single statement."""
+    other = await create_user(dbsession, Role.MENTOR, [])
+    dao = CommunityDAO(dbsession)
+    post = await dao.create_post(other.user_id, text="Hello.")
+    assert await dao.like_unlike(post.id, other.user_id) == (True, 1)
+    url = fastapi_app.url_path_for("like_unlike", post_id=str(post.id))
+
+    with count_queries(_engine) as queries:
+        response = await dao.like_unlike(post.id, mentee_profile.user_id)
+    assert response == (True, 2)
+    assert len(queries) == 1
+
+    response = await authenticated_client3.post(url)
+    assert response.json() == {"liked": False, "like_count": 1}
+    response = await authenticated_client3.post(url)
+    assert response.json() == {"liked": True, "like_count": 2}
+    assert await dao.get_like(post.id, mentee_profile.user_id)
+
+    response = await authenticated_client3.post(
+        fastapi_app.url_path_for("like_unlike", post_id=str(uuid.uuid4()))
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.anyio
+async def test_thread(
+    fastapi_app: FastAPI,
+    authenticated_client3: AsyncClient,
+    mentee_profile: Profile,
+    dbsession: AsyncSession,
+    _engine: AsyncEngine,
+) -> None:
+    """Tests that a thread is loaded in one query, within its limits."""
+    dao = CommunityDAO(dbsession)
+    post = await dao.create_post(mentee_profile.user_id, text="Hello.")
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    tree = {"a": None, "b": None, "a1": "a", "a2": "a", "a1x": "a1", "a1xy": "a1x"}
+    comments = {}
+    for position, (name, parent) in enumerate(tree.items()):
+        comments[name] = Comment(
+            user_id=mentee_profile.user_id,
+            post_id=post.id,
+            content=name,
+            created_at=start + timedelta(minutes=position),
+        )
+        dbsession.add(comments[name])
+        await dbsession.flush()
+        if parent:
+            await dao.create_reply(comments[parent].id, comments[name].id)
+    await dbsession.flush()
+
+    def shape(nodes: list[CommentNode]) -> list[Any]:
+        return [(node.comment.content, shape(node.replies)) for node in nodes]
+
+    with count_queries(_engine) as queries:
+        thread = await dao.get_thread(post.id, max_depth=3)
+    assert len(queries) == 1
+    assert shape(thread) == [
+        ("a", [("a1", [("a1x", [])]), ("a2", [])]),
+        ("b", []),
+    ]
+    thread = await dao.get_thread(post.id, max_replies=1)
+    assert shape(thread) == [("a", [("a1", [("a1x", [("a1xy", [])])])])]
+
+    response = await authenticated_client3.get(
+        fastapi_app.url_path_for("get_thread", post_id=str(post.id))
+    )
+    assert response.status_code == status.HTTP_200_OK
+    first = response.json()[0]
+    assert first["comment"]["content"] == "a"
+    assert [reply["comment"]["content"] for reply in first["replies"]] == ["a1", "a2"]
+    response = await authenticated_client3.get(
+        fastapi_app.url_path_for("get_thread", post_id=str(uuid.uuid4()))
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
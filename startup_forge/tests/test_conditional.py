@@ -0,0 +1,84 @@
+import uuid
+from datetime import date, datetime, timezone
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from starlette import status
+
+from startup_forge.db.dao.community_dao import CommunityDAO
+from startup_forge.db.dao.experience_dao import ExperienceDAO
+from startup_forge.db.models.experience import Experience
+from startup_forge.db.models.options import Industry
+from startup_forge.db.models.profile import Profile
+from startup_forge.db.utils import count_queries
+
+
+@pytest.mark.anyio
+async def test_experiences_etag(
+    fastapi_app: FastAPI,
+    authenticated_client3: AsyncClient,
+    mentee_profile: Profile,
+    dbsession: AsyncSession,
+    _engine: AsyncEngine,
+) -> None:
+    """Tests that unchanged experiences are answered with 304."""
+    dao = ExperienceDAO(dbsession)
+    for industry in (Industry.AI, Industry.SAAS):
+        await dao.create_experience(
+            user_id=mentee_profile.user_id,
+            company_name=uuid.uuid4().hex,
+            start_date=date(2020, 1, 1),
+            industry=industry,
+        )
+    await dbsession.flush()
+    url = fastapi_app.url_path_for("get_experiences")
+
+    response = await authenticated_client3.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    etag = response.headers["ETag"]
+
+    with count_queries(_engine) as queries:
+        response = await authenticated_client3.get(
+            url, headers={"If-None-Match": f'"other", W/{etag}'}
+        )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["ETag"] == etag
+    assert not response.content
+    assert not any("experience.company_name" in query for query in queries)
+
+    await dbsession.execute(
+        update(Experience)
+        .where(Experience.user_id == mentee_profile.user_id)
+        .values(updated_at=datetime(2030, 1, 1, tzinfo=timezone.utc)),
+    )
+    response = await authenticated_client3.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] != etag
+    assert len(response.json()) == 2
+
+
+@pytest.mark.anyio
+async def test_profile_and_posts_etag(
+    fastapi_app: FastAPI,
+    authenticated_client3: AsyncClient,
+    mentee_profile: Profile,
+    dbsession: AsyncSession,
+) -> None:
+    """Tests conditional requests on the profile and the posts."""
+    url = fastapi_app.url_path_for("get_profile")
+    response = await authenticated_client3.get(url)
+    etag = response.headers["ETag"]
+    response = await authenticated_client3.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    await CommunityDAO(dbsession).create_post(mentee_profile.user_id, text="Hello.")
+    await dbsession.flush()
+    url = fastapi_app.url_path_for("get_my_posts")
+    response = await authenticated_client3.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    assert [post["text"] for post in response.json()["items"]] == ["Hello."]
+    response = await authenticated_client3.get(url, headers={"If-None-Match": "*"})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
@@ -0,0 +1,24 @@
+import time
+
+import pytest
+
+from startup_forge.db.ids import new_id, uuid7
+from startup_forge.settings import settings
+
+
+def test_uuid7() -> None:
+    """Tests that UUIDv7 ids carry their creation time and sort by it."""
+    before = time.time_ns() // 1_000_000
+    first = uuid7()
+    time.sleep(0.002)
+    second = uuid7()
+    assert (first.version, first.variant) == (7, "specified in RFC 4122")
+    assert before <= first.int >> 80 <= second.int >> 80
+    assert first < second
+
+
+def test_new_id(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that random ids can still be generated."""
+    assert new_id().version == 7
+    monkeypatch.setattr(settings, "time_ordered_ids", False)
+    assert new_id().version == 4
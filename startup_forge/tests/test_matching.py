@@ -0,0 +1,299 @@
+import uuid
+from datetime import date, time, timedelta, timezone
+from enum import Enum
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from starlette import status
+
+from startup_forge.db.dao.booking_dao import BookingDAO
+from startup_forge.db.dao.experience_dao import ExperienceDAO
+from startup_forge.db.dao.industry_footprint_dao import IndustryFootprintDAO
+from startup_forge.db.models.options import (
+    Day,
+    Industry,
+    LanguageLevel,
+    LanguageName,
+    RelatedIndustry,
+    Role,
+    SkillName,
+)
+from startup_forge.db.models.profile import Profile
+from startup_forge.db.utils import count_queries
+from startup_forge.services.matching import (
+    MatchFeatures,
+    MentorIndex,
+    availability_mask,
+    enum_mask,
+    language_mask,
+    decode_mask,
+    industry_mask,
+    mask_bits,
+    mask_bytes,
+    mask_typecode,
+    top_matches,
+)
+from startup_forge.tests.utils import create_user
+
+
+@pytest.mark.anyio
+async def test_request_matches_query_count(
+    fastapi_app: FastAPI,
+    authenticated_client3: AsyncClient,
+    mentee_profile: Profile,
+    dbsession: AsyncSession,
+    _engine: AsyncEngine,
+) -> None:
+    """Tests that matching does not issue a query per mentor."""
+    await ExperienceDAO(dbsession).create_experience(
+        user_id=mentee_profile.user_id,
+        company_name=uuid.uuid4().hex,
+        start_date=date(2020, 1, 1),
+        industry=Industry.FINTECH,
+    )
+    await create_user(dbsession, Role.MENTOR, [Industry.FINTECH])
+    url = fastapi_app.url_path_for("request_matches")
+
+    with count_queries(_engine) as first_queries:
+        response = await authenticated_client3.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()["items"]) == 1
+
+    await create_user(dbsession, Role.MENTOR, [Industry.AI, Industry.SAAS])
+    await create_user(dbsession, Role.MENTOR, [])
+    await create_user(dbsession, Role.MENTEE, [Industry.FINTECH])
+
+    with count_queries(_engine) as second_queries:
+        response = await authenticated_client3.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()["items"]) == 3
+    assert len(second_queries) == len(first_queries)
+
+
+@pytest.mark.anyio
+async def test_request_matches_pagination(
+    fastapi_app: FastAPI,
+    authenticated_client3: AsyncClient,
+    mentee_profile: Profile,
+    dbsession: AsyncSession,
+) -> None:
+    """Tests that match pages are ranked, bounded and resumable."""
+    await ExperienceDAO(dbsession).create_experience(
+        user_id=mentee_profile.user_id,
+        company_name=uuid.uuid4().hex,
+        start_date=date(2020, 1, 1),
+        industry=Industry.FINTECH,
+    )
+    best = await create_user(dbsession, Role.MENTOR, [Industry.FINTECH])
+    for _ in range(3):
+        await create_user(dbsession, Role.MENTOR, [Industry.EDTECH])
+    await create_user(dbsession, Role.MENTOR, [])
+    url = fastapi_app.url_path_for("request_matches")
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2, "min_score": 0.01}
+        if cursor:
+            params["cursor"] = cursor
+        response = await authenticated_client3.get(url, params=params)
+        assert response.status_code == status.HTTP_200_OK
+        page = response.json()
+        assert len(page["items"]) <= 2
+        seen.extend(page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    scores = [item["compatibility"] for item in seen]
+    assert seen[0]["profile"]["user_id"] == str(best.user_id)
+    assert scores == sorted(scores, reverse=True)
+    assert all(score >= 0.01 for score in scores)
+    assert len({item["profile"]["user_id"] for item in seen}) == len(seen)
+
+    response = await authenticated_client3.get(url, params={"cursor": "nope"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_top_matches() -> None:
+    """Tests heap selection against a full sort."""
+    mentor_ids = [uuid.uuid4() for _ in range(50)]
+    scores = [(position % 7) / 7 for position in range(50)]
+    ranked = sorted(
+        (position for position in range(50) if scores[position] >= 0.2),
+        key=lambda position: (-scores[position], mentor_ids[position]),
+    )
+
+    pages = []
+    after = None
+    while True:
+        page = top_matches(mentor_ids, scores, 8, min_score=0.2, after=after)
+        if not page:
+            break
+        pages.extend(page)
+        after = (scores[page[-1]], mentor_ids[page[-1]])
+    assert pages == ranked
+
+
+def test_mentor_index_scores() -> None:
+    """Tests bitmask scores against plain set arithmetic."""
+    mentors = [
+        {Industry.FINTECH},
+        {Industry.AI, Industry.SAAS},
+        {Industry.EDTECH},
+        set(),
+    ]
+    mentee = {Industry.FINTECH, Industry.SAAS}
+    index = MentorIndex()
+    for mentor in mentors:
+        index.add(uuid.uuid4(), MatchFeatures(industries=industry_mask(mentor)))
+
+    mentee_related = {
+        related for industry in mentee for related in RelatedIndustry[industry.name]
+    }
+    scores = index.scores(MatchFeatures(industries=industry_mask(mentee)))
+    for mentor, score in zip(mentors, scores):
+        mentor_related = {
+            related for industry in mentor for related in RelatedIndustry[industry.name]
+        }
+        expected = (
+            len(mentor & mentee) / len(mentee)
+            + len(mentor_related & mentee_related) / len(mentee_related)
+        ) / 2
+        assert score == pytest.approx(expected)
+    assert index.scores(MatchFeatures()) == [0.0] * len(mentors)
+
+
+def test_mentor_index_weights() -> None:
+    """Tests that factors are weighted and renormalised over the mentee's data."""
+    skills = enum_mask(SkillName, [SkillName.LEADERSHIP, SkillName.TEAM_WORK])
+    english = language_mask([[LanguageName.ENGLISH, LanguageLevel.FLUENT]])
+    weights = {
+        "industries": 0.5,
+        "skills": 0.25,
+        "expertises": 0.0,
+        "languages": 0.25,
+        "availability": 0.0,
+    }
+    index = MentorIndex()
+    index.add(uuid.uuid4(), MatchFeatures(skills=skills, languages=english))
+    index.add(
+        uuid.uuid4(),
+        MatchFeatures(skills=enum_mask(SkillName, [SkillName.LEADERSHIP])),
+    )
+    index.add(uuid.uuid4(), MatchFeatures())
+
+    # No industries for the mentee: skills and languages count for half each.
+    mentee = MatchFeatures(skills=skills, languages=english, expertises=1)
+    assert index.scores(mentee, weights) == pytest.approx([1.0, 0.25, 0.0])
+    assert index.scores(MatchFeatures(skills=skills), weights) == pytest.approx(
+        [1.0, 0.5, 0.0]
+    )
+
+
+def test_mask_widths() -> None:
+    """Tests that mask storage follows the size of the enums."""
+    wide = Enum("Wide", [f"SKILL_{position}" for position in range(12)])
+    index = MentorIndex()
+    index.byte_columns["skills"] = [[] for _ in range(mask_bytes(mask_bits(wide)))]
+    index.add(uuid.uuid4(), MatchFeatures(skills=1 << 11))
+    assert index.byte_columns["skills"] == [[0], [0b1000]]
+    assert [mask_typecode(bits) for bits in (3, 8, 14, 31)] == ["B", "B", "H", "I"]
+    with pytest.raises(ValueError):
+        mask_bits(Enum("Huge", [f"SKILL_{position}" for position in range(32)]))
+
+
+def test_availability_mask() -> None:
+    """Tests that time slots map to UTC blocks of the week."""
+    utc_plus_one = timezone(timedelta(hours=1))
+    assert availability_mask([(Day.MONDAY, time(9), time(12))]) == 1 << 3
+    assert availability_mask([(Day.MONDAY, time(8), time(10))]) == 0b1100
+    # 00:30+01:00 on monday is still sunday in UTC
+    assert (
+        availability_mask(
+            [
+                (
+                    Day.MONDAY,
+                    time(0, 30, tzinfo=utc_plus_one),
+                    time(2, tzinfo=utc_plus_one),
+                )
+            ]
+        )
+        == (1 << 55) | 1
+    )
+    # slots ending past midnight continue on the next day
+    assert availability_mask([(Day.SUNDAY, time(22), time(1))]) == (1 << 55) | 1
+
+
+def test_industry_mask_roundtrip() -> None:
+    """Tests that every industry set survives encoding."""
+    industries = {Industry.AI, Industry.DIGITAL_MEDIA, Industry.BLOCKCHAIN}
+    assert decode_mask(industry_mask(industries)) == industries
+    assert industry_mask([None, Industry.AI]) == industry_mask([Industry.AI])
+
+
+@pytest.mark.anyio
+async def test_industry_footprint_maintenance(dbsession: AsyncSession) -> None:
+    """Tests that experience changes keep the industry footprint in sync."""
+    profile = await create_user(dbsession, Role.MENTOR, [Industry.AI, Industry.AI])
+    experience_dao = ExperienceDAO(dbsession)
+    footprint_dao = IndustryFootprintDAO(dbsession)
+    await experience_dao.create_experience(
+        user_id=profile.user_id,
+        company_name=uuid.uuid4().hex,
+        start_date=date(2010, 1, 1),
+        end_date=date(2012, 1, 1),
+        industry=Industry.SAAS,
+    )
+
+    footprint = await footprint_dao.get_footprint(profile.user_id)
+    await dbsession.refresh(footprint)
+    assert decode_mask(footprint.industries) == {Industry.AI, Industry.SAAS}
+    assert decode_mask(footprint.current_industries) == {Industry.AI}
+
+    experiences = await experience_dao.get_experiences(profile.user_id)
+    ai_experiences = [exp for exp in experiences if exp.industry == Industry.AI]
+    await experience_dao.delete_experience(ai_experiences[0].id)
+    await dbsession.refresh(footprint)
+    assert decode_mask(footprint.industries) == {Industry.AI, Industry.SAAS}
+
+    await experience_dao.update_experience(
+        ai_experiences[1].id, industry=Industry.EDTECH
+    )
+    await dbsession.refresh(footprint)
+    assert decode_mask(footprint.industries) == {Industry.EDTECH, Industry.SAAS}
+    assert decode_mask(footprint.current_industries) == {Industry.EDTECH}
+
+
+@pytest.mark.anyio
+async def test_availability_footprint_maintenance(dbsession: AsyncSession) -> None:
+    """Tests that time slot changes keep the availability footprint in sync."""
+    profile = await create_user(dbsession, Role.MENTOR, [])
+    booking_dao = BookingDAO(dbsession)
+    footprint_dao = IndustryFootprintDAO(dbsession)
+    await booking_dao.create_time_slot(
+        user_id=profile.user_id,
+        day=Day.TUESDAY,
+        start_time=time(9, tzinfo=timezone.utc),
+        end_time=time(12, tzinfo=timezone.utc),
+    )
+
+    footprint = await footprint_dao.get_footprint(profile.user_id)
+    await dbsession.refresh(footprint)
+    assert footprint.availability == 1 << 11
+
+    (time_slot,) = await booking_dao.get_time_slots(profile.user_id)
+    await booking_dao.update_time_slot(
+        time_slot.id,
+        day=Day.WEDNESDAY,
+        start_time=None,
+        end_time=None,
+    )
+    await dbsession.refresh(footprint)
+    assert footprint.availability == 1 << 19
+
+    await booking_dao.delete_time_slot(time_slot.id)
+    await dbsession.refresh(footprint)
+    assert footprint.availability == 0
@@ -55,7 +55,7 @@
 #     assert response.status_code == status.HTTP_201_CREATED
 #     assert response2.status_code == status.HTTP_201_CREATED
 #     assert response3.status_code == status.HTTP_201_CREATED
-    
+
 #     url = fastapi_app.url_path_for("request_matches")
 #     response = await authenticated_client3.get(url)
 #     assert len(response.json()) == 0
@@ -0,0 +1,170 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette import status
+
+from startup_forge.db.dao.community_dao import CommunityDAO
+from startup_forge.db.models.community import Post
+from startup_forge.db.models.connection import Connection
+from startup_forge.db.models.options import Role
+from startup_forge.db.models.profile import Profile
+from startup_forge.db.pagination import decode_keyset, encode_cursor
+from startup_forge.settings import settings
+from startup_forge.tests.utils import create_user
+
+
+@pytest.mark.anyio
+async def test_posts_pages(
+    fastapi_app: FastAPI,
+    authenticated_client3: AsyncClient,
+    mentee_profile: Profile,
+    dbsession: AsyncSession,
+) -> None:
+    """Tests that posts are paged newest first, ties broken by id."""
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    posts = [
+        Post(
+            user_id=mentee_profile.user_id,
+            text=str(position),
+            created_at=start + timedelta(days=position // 2),
+        )
+        for position in range(5)
+    ]
+    dbsession.add_all(posts)
+    await dbsession.flush()
+    expected = sorted(posts, key=lambda post: (post.created_at, post.id), reverse=True)
+    url = fastapi_app.url_path_for("get_my_posts")
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = await authenticated_client3.get(url, params=params)
+        assert response.status_code == status.HTTP_200_OK
+        page = response.json()
+        assert len(page["items"]) <= 2
+        seen.extend(post["id"] for post in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == [str(post.id) for post in expected]
+
+    response = await authenticated_client3.get(url, params={"cursor": "nope"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    response = await authenticated_client3.get(url, params={"limit": 10_000})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.anyio
+async def test_feed(
+    fastapi_app: FastAPI,
+    authenticated_client3: AsyncClient,
+    mentee_profile: Profile,
+    dbsession: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Tests that the feed pages every post and caps the page size."""
+    other = await create_user(dbsession, Role.MENTOR, [])
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    posts = [
+        Post(user_id=user_id, created_at=start + timedelta(hours=position))
+        for position, user_id in enumerate([mentee_profile.user_id, other.user_id] * 3)
+    ]
+    dbsession.add_all(posts)
+    await dbsession.flush()
+    url = fastapi_app.url_path_for("get_feed")
+
+    response = await authenticated_client3.get(url, params={"limit": 4})
+    page = response.json()
+    assert [post["id"] for post in page["items"]] == [
+        str(post.id) for post in reversed(posts[2:])
+    ]
+    response = await authenticated_client3.get(
+        url, params={"limit": 4, "cursor": page["next_cursor"]}
+    )
+    assert [post["id"] for post in response.json()["items"]][:2] == [
+        str(post.id) for post in reversed(posts[:2])
+    ]
+
+    monkeypatch.setattr(settings, "max_page_size", 3)
+    page = await CommunityDAO(dbsession).get_feed(limit=1000)
+    assert len(page.items) == 3
+    assert page.next_cursor is not None
+
+
+@pytest.mark.anyio
+async def test_home(
+    fastapi_app: FastAPI,
+    authenticated_client3: AsyncClient,
+    mentee_profile: Profile,
+    dbsession: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Tests that the home feed merges pushed and pulled posts of connections."""
+    friend, star, fan, other_fan, stranger = [
+        await create_user(dbsession, Role.MENTOR, []) for _ in range(5)
+    ]
+    for request_from, request_to in (
+        (friend, mentee_profile),
+        (mentee_profile, star),
+        (fan, star),
+        (other_fan, star),
+    ):
+        dbsession.add(
+            Connection(request_from=request_from.user_id, request_to=request_to.user_id)
+        )
+    await dbsession.flush()
+    monkeypatch.setattr(settings, "timeline_fanout_limit", 2)
+    dao = CommunityDAO(dbsession)
+    posts = [
+        await dao.create_post(profile.user_id, text="Hello.")
+        for profile in (friend, star, mentee_profile, stranger, friend)
+    ]
+    assert [post.fanned_out for post in posts[:3]] == [True, False, True]
+    expected = sorted(posts[:3] + posts[4:], key=lambda post: post.id, reverse=True)
+    url = fastapi_app.url_path_for("get_home")
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 1}
+        if cursor:
+            params["cursor"] = cursor
+        response = await authenticated_client3.get(url, params=params)
+        assert response.status_code == status.HTTP_200_OK
+        page = response.json()
+        seen.extend(post["id"] for post in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    # Every post is created in the same transaction, hence at the same time.
+    assert seen == [str(post.id) for post in expected]
+
+    page = await dao.get_home(fan.user_id)
+    assert [post.id for post in page.items] == [posts[1].id]
+
+    # Posts published before a connection was accepted are not pulled.
+    dbsession.add(
+        Connection(
+            request_from=stranger.user_id,
+            request_to=star.user_id,
+            accepted_at=posts[1].created_at + timedelta(hours=1),
+        )
+    )
+    await dbsession.flush()
+    page = await dao.get_home(stranger.user_id)
+    assert [post.id for post in page.items] == [posts[3].id]
+
+
+def test_keyset_cursor() -> None:
+    """Tests that keyset cursors survive encoding."""
+    keys = (datetime(2024, 1, 1, 12, tzinfo=timezone.utc), uuid.uuid4())
+    assert decode_keyset(encode_cursor(*keys)) == keys
+    with pytest.raises(ValueError):
+        decode_keyset(encode_cursor("yesterday", str(keys[1])))
@@ -0,0 +1,270 @@
+import uuid
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette import status
+
+from startup_forge.db.dao.profile_dao import ProfileDAO
+from startup_forge.db.models.options import (
+    ExpertiseName,
+    LanguageLevel,
+    LanguageName,
+    Platform,
+    Role,
+    SkillName,
+)
+from startup_forge.db.models.profile import Profile, pack_language, unpack_languages
+from startup_forge.db.models.users import User
+from startup_forge.services.matching import enum_mask, language_mask
+
+
+async def create_profile(dbsession: AsyncSession, role: Role) -> Profile:
+    """
+    Create a user with an empty profile.
+
+    :param dbsession: session to database.
+    :param role: role of the user.
+    :return: profile of the user.
+    """
+    user = User(email=f"{uuid.uuid4().hex}@email.com", hashed_password="school")
+    dbsession.add(user)
+    await dbsession.flush()
+    profile = Profile(
+        user_id=user.id,
+        role=role,
+        first_name=uuid.uuid4().hex,
+        last_name=uuid.uuid4().hex,
+    )
+    dbsession.add(profile)
+    await dbsession.flush()
+    return profile
+
+
+@pytest.mark.anyio
+async def test_names(dbsession: AsyncSession) -> None:
+    """Tests that skills and expertises are merged and removed in place."""
+    profile = await create_profile(dbsession, Role.MENTOR)
+    dao = ProfileDAO(dbsession)
+
+    await dao.register_skills(profile.user_id, SkillName.LEADERSHIP)
+    await dao.register_skills(
+        profile.user_id, [SkillName.TEAM_WORK, SkillName.LEADERSHIP]
+    )
+    await dao.register_expertises(profile.user_id, list(ExpertiseName)[:2])
+    profile = await dao.get_profile(profile.user_id)
+    assert profile.skills == [SkillName.LEADERSHIP, SkillName.TEAM_WORK]
+    assert profile.expertises == list(ExpertiseName)[:2]
+
+    await dao.remove_skills(profile.user_id, [SkillName.LEADERSHIP])
+    await dao.remove_expertises(profile.user_id, list(ExpertiseName)[0])
+    profile = await dao.get_profile(profile.user_id)
+    assert profile.skills == [SkillName.TEAM_WORK]
+    assert profile.expertises == list(ExpertiseName)[1:2]
+
+
+@pytest.mark.anyio
+async def test_pairs(dbsession: AsyncSession) -> None:
+    """Tests that languages and social links are keyed by their first element."""
+    profile = await create_profile(dbsession, Role.MENTEE)
+    dao = ProfileDAO(dbsession)
+
+    await dao.register_language(
+        profile.user_id, [LanguageName.ENGLISH, LanguageLevel.FLUENT]
+    )
+    await dao.register_language(
+        profile.user_id,
+        [
+            [LanguageName.SPANISH, LanguageLevel.FLUENT],
+            [LanguageName.ENGLISH, LanguageLevel.CONVERSATIONAL],
+        ],
+    )
+    await dao.register_social_link(
+        profile.user_id, [Platform.LINKEDIN, "https://linkedin.com/in/forge"]
+    )
+    profile = await dao.get_profile(profile.user_id)
+    # An updated pair keeps its place.
+    assert profile.languages == [
+        [LanguageName.ENGLISH, LanguageLevel.CONVERSATIONAL],
+        [LanguageName.SPANISH, LanguageLevel.FLUENT],
+    ]
+    assert profile.social_links == [
+        [Platform.LINKEDIN, "https://linkedin.com/in/forge"]
+    ]
+
+    await dao.remove_language(profile.user_id, LanguageName.SPANISH)
+    await dao.remove_social_link(profile.user_id, Platform.LINKEDIN)
+    profile = await dao.get_profile(profile.user_id)
+    assert profile.languages == [[LanguageName.ENGLISH, LanguageLevel.CONVERSATIONAL]]
+    assert profile.social_links == []
+
+
+@pytest.mark.anyio
+async def test_skills_endpoints(
+    fastapi_app: FastAPI,
+    authenticated_client: AsyncClient,
+    dbsession: AsyncSession,
+) -> None:
+    """Tests skill registration and removal through the API."""
+    response = await authenticated_client.post(
+        fastapi_app.url_path_for("create_profile"),
+        json={"first_name": "ada", "last_name": "lovelace", "role": Role.MENTEE},
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    url = fastapi_app.url_path_for("record_skills")
+
+    response = await authenticated_client.put(
+        url, json={"names": [SkillName.LEADERSHIP, SkillName.TEAM_WORK]}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    response = await authenticated_client.request(
+        "DELETE", url, json={"names": SkillName.LEADERSHIP}
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    response = await authenticated_client.get(fastapi_app.url_path_for("get_profile"))
+    assert response.json()["skills"] == [SkillName.TEAM_WORK]
+
+
+@pytest.mark.anyio
+async def test_filter(dbsession: AsyncSession) -> None:
+    """Tests array filters, with language levels rechecked per pair."""
+    dao = ProfileDAO(dbsession)
+    fluent = await create_profile(dbsession, Role.MENTOR)
+    await dao.register_expertises(fluent.user_id, ExpertiseName.MARKETING)
+    await dao.register_skills(fluent.user_id, SkillName.LEADERSHIP)
+    await dao.register_language(
+        fluent.user_id, [LanguageName.ENGLISH, LanguageLevel.FLUENT]
+    )
+    # Has every token of ENGLISH FLUENT, but not as a pair.
+    mixed = await create_profile(dbsession, Role.MENTOR)
+    await dao.register_expertises(mixed.user_id, ExpertiseName.MARKETING)
+    await dao.register_language(
+        mixed.user_id,
+        [
+            [LanguageName.ENGLISH, LanguageLevel.BASIC],
+            [LanguageName.SPANISH, LanguageLevel.FLUENT],
+        ],
+    )
+    mentee = await create_profile(dbsession, Role.MENTEE)
+    await dao.register_expertises(mentee.user_id, ExpertiseName.MARKETING)
+
+    async def search(**filters: Any) -> set[uuid.UUID]:
+        return {profile.user_id for profile in (await dao.filter(**filters)).items}
+
+    mentors = {fluent.user_id, mixed.user_id}
+    assert await search(
+        role=Role.MENTOR,
+        expertises=[ExpertiseName.MARKETING],
+        languages=[(LanguageName.ENGLISH, LanguageLevel.FLUENT)],
+    ) == {fluent.user_id}
+    assert (
+        await search(role=Role.MENTOR, languages=[(LanguageName.ENGLISH, None)])
+        == mentors
+    )
+    assert await search(
+        skills=[SkillName.LEADERSHIP, SkillName.TEAM_WORK], match_all=False
+    ) == {fluent.user_id}
+    assert not await search(skills=[SkillName.LEADERSHIP, SkillName.TEAM_WORK])
+    assert await search(
+        languages=[
+            (LanguageName.ARABIC, LanguageLevel.FLUENT),
+            (LanguageName.SPANISH, None),
+        ],
+        match_all=False,
+    ) == {mixed.user_id}
+
+
+@pytest.mark.anyio
+async def test_search_endpoint(
+    fastapi_app: FastAPI,
+    authenticated_client: AsyncClient,
+    dbsession: AsyncSession,
+) -> None:
+    """Tests the profile search API filters."""
+    mentor = await create_profile(dbsession, Role.MENTOR)
+    await ProfileDAO(dbsession).register_language(
+        mentor.user_id, [LanguageName.ARABIC, LanguageLevel.BASIC]
+    )
+    url = fastapi_app.url_path_for("search_profiles")
+
+    response = await authenticated_client.get(
+        url, params={"role": Role.MENTOR.value, "languages": ["ARABIC:BASIC"]}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert [profile["user_id"] for profile in response.json()["items"]] == [
+        str(mentor.user_id)
+    ]
+
+    response = await authenticated_client.get(url, params={"languages": "ARABIC:"})
+    assert str(mentor.user_id) in {
+        profile["user_id"] for profile in response.json()["items"]
+    }
+    response = await authenticated_client.get(url, params={"languages": "KLINGON"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.anyio
+async def test_text_search(
+    fastapi_app: FastAPI,
+    authenticated_client: AsyncClient,
+    dbsession: AsyncSession,
+) -> None:
+    """Tests that text search is ranked, prefix based and resumable."""
+    named = await create_profile(dbsession, Role.MENTOR)
+    named.first_name = "Grace"
+    named.last_name = "Hopper"
+    described = await create_profile(dbsession, Role.MENTOR)
+    described.bio = "Worked with grace hopper on compilers."
+    other = await create_profile(dbsession, Role.MENTOR)
+    other.bio = "Grace under pressure."
+    await dbsession.flush()
+    url = fastapi_app.url_path_for("search_profiles")
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"q": "grac HOP!", "limit": 1}
+        if cursor:
+            params["cursor"] = cursor
+        response = await authenticated_client.get(url, params=params)
+        assert response.status_code == status.HTTP_200_OK
+        page = response.json()
+        seen.extend(profile["user_id"] for profile in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    # Names weigh more than the bio, both words are required.
+    assert seen == [str(named.user_id), str(described.user_id)]
+
+    response = await authenticated_client.get(url, params={"cursor": "nope"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    response = await authenticated_client.get(url, params={"q": "&|!:*"})
+    assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.anyio
+async def test_compact_encodings(dbsession: AsyncSession) -> None:
+    """Tests that the database encodes arrays like the matching service."""
+    profile = await create_profile(dbsession, Role.MENTOR)
+    dao = ProfileDAO(dbsession)
+    skills = [SkillName.TEAM_WORK, SkillName.LEADERSHIP]
+    languages = [
+        (LanguageName.ARABIC, LanguageLevel.CONVERSATIONAL),
+        (LanguageName.ENGLISH, LanguageLevel.BASIC),
+    ]
+    await dao.register_skills(profile.user_id, skills)
+    await dao.register_expertises(profile.user_id, ExpertiseName.MARKETING)
+    await dao.register_language(profile.user_id, languages)
+
+    profile = await dao.get_profile(profile.user_id)
+    await dbsession.refresh(profile)
+    assert profile.skills_mask == enum_mask(SkillName, skills)
+    assert profile.expertises_mask == enum_mask(
+        ExpertiseName, [ExpertiseName.MARKETING]
+    )
+    assert profile.languages_mask == language_mask(languages)
+    assert profile.languages_packed == [pack_language(*pair) for pair in languages]
+    assert unpack_languages(profile.languages_packed) == languages
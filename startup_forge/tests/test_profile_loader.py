@@ -0,0 +1,221 @@
+import asyncio
+import uuid
+from datetime import date, time, timezone
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from starlette import status
+
+from startup_forge.db.dao.profile_dao import ProfileDAO, profile_cache
+from startup_forge.db.models.booking import Booking, BookingActivity, TimeSlot
+from startup_forge.db.models.connection import Connection
+from startup_forge.db.models.education import Education
+from startup_forge.db.models.options import BookingStatus, Day, Industry, Role
+from startup_forge.db.models.profile import Profile
+from startup_forge.db.models.review import Review
+from startup_forge.services.profile_loader import ProfileLoader
+from startup_forge.db.utils import count_queries
+from startup_forge.tests.utils import create_user
+
+
+@pytest.mark.anyio
+async def test_loader_batches(dbsession: AsyncSession, _engine: AsyncEngine) -> None:
+    """Tests that concurrent loads share one query and repeated loads none."""
+    profiles = [await create_user(dbsession, Role.MENTOR, []) for _ in range(3)]
+    user_ids = [profile.user_id for profile in profiles]
+    missing = (await create_user(dbsession, Role.MENTEE, [])).user_id
+    await dbsession.delete(await dbsession.get(Profile, missing))
+    await dbsession.flush()
+    loader = ProfileLoader(ProfileDAO(dbsession))
+
+    with count_queries(_engine) as queries:
+        first, rest = await asyncio.gather(
+            loader.load(user_ids[0]),
+            loader.load_many([*user_ids, missing]),
+        )
+        assert await loader.load(user_ids[1]) is rest[1]
+    assert len(queries) == 1
+    assert first is rest[0]
+    assert [profile.user_id for profile in rest[:3]] == user_ids
+    assert rest[3] is None
+
+
+@pytest.mark.anyio
+async def test_connections_and_reviews(
+    fastapi_app: FastAPI,
+    authenticated_client3: AsyncClient,
+    mentee_profile: Profile,
+    dbsession: AsyncSession,
+    _engine: AsyncEngine,
+) -> None:
+    """Tests that listings load the profiles they render in one query."""
+    mentors = [await create_user(dbsession, Role.MENTOR, []) for _ in range(3)]
+    for mentor in mentors:
+        dbsession.add(
+            Connection(request_from=mentor.user_id, request_to=mentee_profile.user_id)
+        )
+        dbsession.add(
+            Review(
+                mentee_id=mentee_profile.user_id,
+                mentor_id=mentor.user_id,
+                content="Helpful.",
+            )
+        )
+    await dbsession.flush()
+    dbsession.expunge_all()
+    profile_cache.clear()
+
+    with count_queries(_engine) as queries:
+        response = await authenticated_client3.get(
+            fastapi_app.url_path_for("get_requests")
+        )
+    assert response.status_code == status.HTTP_200_OK
+    assert {profile["user_id"] for profile in response.json()} == {
+        str(mentor.user_id) for mentor in mentors
+    }
+    profile_queries = [query for query in queries if "FROM profile" in query]
+    # The user's own profile comes with the user.
+    assert len(profile_queries) == 1
+
+    dbsession.expunge_all()
+    profile_cache.clear()
+    with count_queries(_engine) as queries:
+        response = await authenticated_client3.get(
+            fastapi_app.url_path_for(
+                "get_reviews", profile_id=str(mentee_profile.user_id)
+            )
+        )
+    assert response.status_code == status.HTTP_200_OK
+    reviews = response.json()["items"]
+    assert {review["mentor"]["user_id"] for review in reviews} == {
+        str(mentor.user_id) for mentor in mentors
+    }
+    assert {review["mentee"]["user_id"] for review in reviews} == {
+        str(mentee_profile.user_id)
+    }
+    profile_queries = [query for query in queries if "FROM profile" in query]
+    assert len(profile_queries) == 2
+
+
+@pytest.mark.anyio
+async def test_current_user_profile(
+    fastapi_app: FastAPI,
+    authenticated_client3: AsyncClient,
+    mentee_profile: Profile,
+    dbsession: AsyncSession,
+    _engine: AsyncEngine,
+) -> None:
+    """Tests that the user and its profile are loaded with one query."""
+    dbsession.expunge_all()
+    profile_cache.clear()
+
+    with count_queries(_engine) as queries:
+        response = await authenticated_client3.get(
+            fastapi_app.url_path_for("get_requests")
+        )
+    assert response.status_code == status.HTTP_200_OK
+    assert len(queries) == 2  # user and profile, then connections
+
+    dbsession.expunge_all()
+    profile_cache.clear()
+    with count_queries(_engine) as queries:
+        response = await authenticated_client3.get(
+            fastapi_app.url_path_for("get_profile")
+        )
+    assert response.json()["user_id"] == str(mentee_profile.user_id)
+    assert len(queries) == 1
+
+
+@pytest.mark.anyio
+async def test_profile_card(
+    fastapi_app: FastAPI,
+    authenticated_client3: AsyncClient,
+    mentee_profile: Profile,
+    dbsession: AsyncSession,
+    _engine: AsyncEngine,
+) -> None:
+    """Tests that a profile card is loaded with a fixed number of queries."""
+    mentor = await create_user(dbsession, Role.MENTOR, [Industry.AI])
+    url = fastapi_app.url_path_for("get_card", profile_id=str(mentor.user_id))
+    dbsession.expunge_all()
+    with count_queries(_engine) as first_queries:
+        response = await authenticated_client3.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()["experiences"]) == 1
+
+    mentor = await create_user(dbsession, Role.MENTOR, [Industry.AI, Industry.SAAS])
+    for start in (2015, 2018):
+        dbsession.add(
+            Education(
+                user_id=mentor.user_id,
+                institution_name=uuid.uuid4().hex,
+                course_of_study="Physics",
+                start_date=date(start, 9, 1),
+                state="Lagos",
+                country="Nigeria",
+            )
+        )
+    dbsession.add(
+        Review(
+            mentee_id=mentee_profile.user_id,
+            mentor_id=mentor.user_id,
+            content="Helpful.",
+        )
+    )
+    time_slot = TimeSlot(
+        user_id=mentor.user_id,
+        day=Day.MONDAY,
+        start_time=time(9, tzinfo=timezone.utc),
+        end_time=time(10, tzinfo=timezone.utc),
+    )
+    dbsession.add(time_slot)
+    await dbsession.flush()
+    for day, activity in ((5, BookingStatus.COMPLETED), (12, BookingStatus.PENDING)):
+        booking = Booking(
+            user_id=mentee_profile.user_id,
+            time_slot_id=time_slot.id,
+            date=date(2024, 2, day),
+        )
+        dbsession.add(booking)
+        await dbsession.flush()
+        dbsession.add(BookingActivity(booking_id=booking.id, mentor_activity=activity))
+    await dbsession.flush()
+    url = fastapi_app.url_path_for("get_card", profile_id=str(mentor.user_id))
+
+    dbsession.expunge_all()
+    with count_queries(_engine) as second_queries:
+        response = await authenticated_client3.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    card = response.json()
+    assert card["profile"]["user_id"] == str(mentor.user_id)
+    assert len(card["experiences"]) == 2
+    assert [education["start_date"] for education in card["educations"]] == [
+        "2018-09-01",
+        "2015-09-01",
+    ]
+    assert [review["mentee_id"] for review in card["reviews"]] == [
+        str(mentee_profile.user_id)
+    ]
+    assert card["completed_sessions"] == 1
+    assert len(second_queries) == len(first_queries)
+
+    response = await authenticated_client3.get(
+        fastapi_app.url_path_for("get_card", profile_id=str(uuid.uuid4()))
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.anyio
+async def test_profile_card_requires_login(
+    fastapi_app: FastAPI,
+    client: AsyncClient,
+    dbsession: AsyncSession,
+) -> None:
+    """Tests that profile cards are not served to anonymous users."""
+    mentor = await create_user(dbsession, Role.MENTOR, [Industry.AI])
+    response = await client.get(
+        fastapi_app.url_path_for("get_card", profile_id=str(mentor.user_id))
+    )
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,153 @@
+import uuid
+from datetime import date, timedelta
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.sql import func
+from starlette import status
+
+from startup_forge.db.dao.experience_dao import ExperienceDAO
+from startup_forge.db.dao.mentor_recommendation_dao import MentorRecommendationDAO
+from startup_forge.db.dao.profile_dao import ProfileDAO
+from startup_forge.db.models.mentor_recommendation import MentorRecommendation
+from startup_forge.db.models.options import Industry, Role, SkillName
+from startup_forge.db.models.profile import Profile
+from startup_forge.jobs.recommendations import compute_recommendations
+from startup_forge.services.matching import match_cache
+from startup_forge.tests.utils import create_user
+
+
+@pytest.mark.anyio
+async def test_compute_recommendations(dbsession: AsyncSession) -> None:
+    """Tests that the job stores ranked mentors for every mentee."""
+    best = await create_user(dbsession, Role.MENTOR, [Industry.FINTECH])
+    other = await create_user(dbsession, Role.MENTOR, [Industry.EDTECH])
+    mentees = [
+        await create_user(dbsession, Role.MENTEE, [Industry.FINTECH]),
+        await create_user(dbsession, Role.MENTEE, [Industry.FINTECH]),
+    ]
+
+    # Sessions bound to the test connection share its rolled back transaction.
+    session_factory = async_sessionmaker(dbsession.bind, expire_on_commit=False)
+    processed = await compute_recommendations(
+        session_factory, workers=1, chunk_size=1, limit=2
+    )
+    assert processed >= len(mentees)
+
+    for mentee in mentees:
+        rows = await dbsession.execute(
+            select(MentorRecommendation)
+            .where(MentorRecommendation.mentee_id == mentee.user_id)
+            .order_by(MentorRecommendation.rank)
+        )
+        ranked = [row.mentor_id for row in rows.scalars()]
+        assert ranked == [best.user_id, other.user_id]
+
+
+@pytest.mark.anyio
+async def test_request_matches_serves_recommendations(
+    fastapi_app: FastAPI,
+    authenticated_client3: AsyncClient,
+    mentee_profile: Profile,
+    dbsession: AsyncSession,
+) -> None:
+    """Tests that stored recommendations are served until they are stale."""
+    experience_dao = ExperienceDAO(dbsession)
+    await experience_dao.create_experience(
+        user_id=mentee_profile.user_id,
+        company_name=uuid.uuid4().hex,
+        start_date=date(2020, 1, 1),
+        industry=Industry.FINTECH,
+    )
+    mentor = await create_user(dbsession, Role.MENTOR, [Industry.FINTECH])
+    recommendation_dao = MentorRecommendationDAO(dbsession)
+    now = await dbsession.scalar(select(func.now()))
+    await recommendation_dao.replace_recommendations(
+        {mentee_profile.user_id: [(mentor.user_id, 0.25)]},
+        computed_at=now,
+    )
+    url = fastapi_app.url_path_for("request_matches")
+
+    response = await authenticated_client3.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    assert [item["compatibility"] for item in response.json()["items"]] == [0.25]
+
+    # The footprint changed after the recommendations were computed.
+    await recommendation_dao.replace_recommendations(
+        {mentee_profile.user_id: [(mentor.user_id, 0.25)]},
+        computed_at=now - timedelta(hours=1),
+    )
+    match_cache.clear()  # cached rankings outlive stored ones until they expire
+    response = await authenticated_client3.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    assert 0.25 not in [item["compatibility"] for item in response.json()["items"]]
+
+
+@pytest.mark.anyio
+async def test_request_matches_past_stored_window(
+    fastapi_app: FastAPI,
+    authenticated_client3: AsyncClient,
+    mentee_profile: Profile,
+    dbsession: AsyncSession,
+) -> None:
+    """Tests that pages past the stored recommendations are scored."""
+    mentors = [await create_user(dbsession, Role.MENTOR, []) for _ in range(3)]
+    now = await dbsession.scalar(select(func.now()))
+    await MentorRecommendationDAO(dbsession).replace_recommendations(
+        {
+            mentee_profile.user_id: [
+                (mentors[0].user_id, 0.5),
+                (mentors[1].user_id, 0.25),
+            ],
+        },
+        computed_at=now,
+    )
+    match_cache.clear()
+    url = fastapi_app.url_path_for("request_matches")
+
+    page = (await authenticated_client3.get(url, params={"limit": 1})).json()
+    assert [item["compatibility"] for item in page["items"]] == [0.5]
+    page = (
+        await authenticated_client3.get(
+            url, params={"limit": 1, "cursor": page["next_cursor"]}
+        )
+    ).json()
+    # The third mentor is not stored, every mentor scores 0 on live scoring.
+    assert [item["compatibility"] for item in page["items"]] == [0.0]
+    assert page["next_cursor"] is not None
+
+
+@pytest.mark.anyio
+async def test_request_matches_after_skills_change(
+    fastapi_app: FastAPI,
+    authenticated_client3: AsyncClient,
+    mentee_profile: Profile,
+    dbsession: AsyncSession,
+) -> None:
+    """Tests that editing the profile after a run outdates the recommendations."""
+    mentor = await create_user(dbsession, Role.MENTOR, [])
+    now = await dbsession.scalar(select(func.now()))
+    await dbsession.execute(
+        update(Profile)
+        .where(Profile.user_id == mentee_profile.user_id)
+        .values(updated_at=now - timedelta(hours=2))
+    )
+    await MentorRecommendationDAO(dbsession).replace_recommendations(
+        {mentee_profile.user_id: [(mentor.user_id, 0.25)]},
+        computed_at=now - timedelta(hours=1),
+    )
+    match_cache.clear()
+    url = fastapi_app.url_path_for("request_matches")
+
+    response = await authenticated_client3.get(url)
+    assert [item["compatibility"] for item in response.json()["items"]] == [0.25]
+
+    await ProfileDAO(dbsession).register_skills(
+        mentee_profile.user_id, SkillName.LEADERSHIP
+    )
+    response = await authenticated_client3.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    assert 0.25 not in [item["compatibility"] for item in response.json()["items"]]
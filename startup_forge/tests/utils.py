@@ -0,0 +1,44 @@
+import uuid
+from datetime import date
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from startup_forge.db.dao.experience_dao import ExperienceDAO
+from startup_forge.db.models.options import Industry, Role
+from startup_forge.db.models.profile import Profile
+from startup_forge.db.models.users import User
+
+
+async def create_user(
+    dbsession: AsyncSession,
+    role: Role,
+    industries: list[Industry],
+) -> Profile:
+    """
+    Create a user with a profile and one experience per industry.
+
+    :param dbsession: session to database.
+    :param role: role of the user.
+    :param industries: industries the user has worked in.
+    :return: profile of the user.
+    """
+    user = User(email=f"{uuid.uuid4().hex}@email.com", hashed_password="school")
+    dbsession.add(user)
+    await dbsession.flush()
+    profile = Profile(
+        user_id=user.id,
+        role=role,
+        first_name=uuid.uuid4().hex,
+        last_name=uuid.uuid4().hex,
+    )
+    dbsession.add(profile)
+    dao = ExperienceDAO(dbsession)
+    for industry in industries:
+        await dao.create_experience(
+            user_id=user.id,
+            company_name=uuid.uuid4().hex,
+            start_date=date(2020, 1, 1),
+            industry=industry,
+        )
+    await dbsession.flush()
+    return profile
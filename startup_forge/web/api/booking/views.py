@@ -5,30 +5,36 @@ from fastapi.param_functions import Depends
 
 from startup_forge.db.dao.profile_dao import ProfileDAO
 from startup_forge.db.dao.booking_dao import BookingDAO
-from startup_forge.db.models.users import User, current_active_user
+from startup_forge.db.models.users import (
+    CurrentUser,
+    User,
+    current_active_user,
+    current_user_profile,
+)
 from startup_forge.db.models.booking import Booking, BookingActivity, TimeSlot
 from startup_forge.web.api.booking.schema import *
 from startup_forge.web.error_message import BookingErrorDetails, ProfileErrorDetails
 from startup_forge.db.models.options import Role
+from startup_forge.db.pagination import Page
+from startup_forge.web.pagination import PageDTO, PageParams
 
 router = APIRouter()
 
 
 @router.get("/timeslots", response_model=list[TimeSlotDTO])
 async def get_time_slots(
-    user: User = Depends(current_active_user),
+    current: CurrentUser = Depends(current_user_profile),
     user_id: Optional[UUID] = None,
-    profile_dao: ProfileDAO = Depends(),
     booking_dao: BookingDAO = Depends(),
 ) -> list[TimeSlot]:
     """
     Retrieve time_slot objects from the database.
 
-    :param user: current user.
+    :param current: current user and profile.
     :param user_id: user id.
     :return: profile object from database.
     """
-    profile = await profile_dao.get_profile(user.id)  # get profile
+    user, profile = current
     if not profile:  # check if profile already exists
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -45,19 +51,17 @@ async def get_time_slots(
 @router.post("/timeslots", status_code=status.HTTP_201_CREATED)
 async def create_timeslot(
     time_slot_object: TimeSlotDTO,
-    user: User = Depends(current_active_user),
-    profile_dao: ProfileDAO = Depends(),
+    current: CurrentUser = Depends(current_user_profile),
     booking_dao: BookingDAO = Depends(),
 ) -> None:
     """
     Creates timeslot in the database.
 
-    :param user: current user.
+    :param current: current user and profile.
     :param time_slot_object: new time_slot item.
-    :param profile_dao: DAO for profiles.
     :param booking_dao: DAO for bookings.
     """
-    profile = await profile_dao.get_profile(user.id)  # get profile
+    user, profile = current
     if not profile:  # check if profile already exists
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -88,20 +92,18 @@ async def create_timeslot(
 async def update_timeslot(
     time_slot_object: TimeSlotDTO,
     time_slot_id: UUID,
-    user: User = Depends(current_active_user),
-    profile_dao: ProfileDAO = Depends(),
+    current: CurrentUser = Depends(current_user_profile),
     booking_dao: BookingDAO = Depends(),
 ) -> None:
     """
     Updates timeslot in the database.
 
-    :param user: current user.
+    :param current: current user and profile.
     :param time_slot_id: time_slot id.
     :param time_slot_object: new time_slot item.
-    :param profile_dao: DAO for profiles.
     :param booking_dao: DAO for bookings.
     """
-    profile = await profile_dao.get_profile(user.id)  # get profile
+    user, profile = current
     if not profile:  # check if profile already exists
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -134,19 +136,17 @@ async def update_timeslot(
 @router.delete("/timeslots/{time_slot_id}", status_code=status.HTTP_201_CREATED)
 async def delete_timeslot(
     time_slot_id: UUID,
-    user: User = Depends(current_active_user),
-    profile_dao: ProfileDAO = Depends(),
+    current: CurrentUser = Depends(current_user_profile),
     booking_dao: BookingDAO = Depends(),
 ) -> None:
     """
     Updates timeslot in the database.
 
-    :param user: current user.
+    :param current: current user and profile.
     :param time_slot_id: time_slot id.
-    :param profile_dao: DAO for profiles.
     :param booking_dao: DAO for bookings.
     """
-    profile = await profile_dao.get_profile(user.id)  # get profile
+    user, profile = current
     if not profile:  # check if profile already exists
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -174,20 +174,18 @@ async def delete_timeslot(
 async def book(
     time_slot_id: UUID,
     booking_object: BookingInputDTO,
-    user: User = Depends(current_active_user),
-    profile_dao: ProfileDAO = Depends(),
+    current: CurrentUser = Depends(current_user_profile),
     booking_dao: BookingDAO = Depends(),
 ) -> None:
     """
     Create a booking in the database.
 
-    :param user: current user.
+    :param current: current user and profile.
     :param time_slot_id: time_slot id.
     :param booking_object: booking object.
-    :param profile_dao: DAO for profiles.
     :param booking_dao: DAO for bookings.
     """
-    profile = await profile_dao.get_profile(user.id)  # get profile
+    user, profile = current
     if not profile:  # check if profile already exists
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -228,20 +226,18 @@ async def book(
 async def update_booking(
     booking_id: UUID,
     booking_object: BookingUpdateDTO,
-    user: User = Depends(current_active_user),
-    profile_dao: ProfileDAO = Depends(),
+    current: CurrentUser = Depends(current_user_profile),
     booking_dao: BookingDAO = Depends(),
 ) -> None:
     """
     Update a booking in the database.
 
-    :param user: current user.
+    :param current: current user and profile.
     :param booking_id: booking id.
     :param booking_object: booking object.
-    :param profile_dao: DAO for profiles.
     :param booking_dao: DAO for bookings.
     """
-    profile = await profile_dao.get_profile(user.id)  # get profile
+    user, profile = current
     if not profile:  # check if profile already exists
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -269,20 +265,20 @@ async def update_booking(
     await booking_dao.update_booking(booking.id, booking_object.date, profile.role)
 
 
-@router.get("/")
+@router.get("/", response_model=PageDTO[BookingDTO])
 async def get_bookings(
-    user: User = Depends(current_active_user),
-    profile_dao: ProfileDAO = Depends(),
+    page: PageParams = Depends(),
+    current: CurrentUser = Depends(current_user_profile),
     booking_dao: BookingDAO = Depends(),
-) -> list[BookingDTO] | None:
+) -> Page[Booking]:
     """
-    Get bookings.
+    Get a page of bookings, newest first.
 
-    :param user: current user.
-    :param profile_dao: DAO for profiles.
+    :param page: page requested.
+    :param current: current user and profile.
     :param booking_dao: DAO for bookings.
     """
-    profile = await profile_dao.get_profile(user.id)  # get profile
+    user, profile = current
     if not profile:  # check if profile already exists
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -290,6 +286,8 @@ async def get_bookings(
         )
     return await booking_dao.get_bookings(
         user_id=user.id,
+        limit=page.limit,
+        after=page.after,
     )
 
 
@@ -297,8 +295,7 @@ async def get_bookings(
 async def change_booking_status(
     booking_id: UUID,
     booking_status_object: BookingStatusDTO,
-    user: User = Depends(current_active_user),
-    profile_dao: ProfileDAO = Depends(),
+    current: CurrentUser = Depends(current_user_profile),
     booking_dao: BookingDAO = Depends(),
 ) -> None:
     """
@@ -306,11 +303,10 @@ async def change_booking_status(
 
     :param booking_id: booking id.
     :param booking_status_object: booking status object.
-    :param user: current user.
-    :param profile_dao: DAO for profiles.
+    :param current: current user and profile.
     :param booking_dao: DAO for bookings.
     """
-    profile = await profile_dao.get_profile(user.id)  # get profile
+    user, profile = current
     if not profile:  # check if profile already exists
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
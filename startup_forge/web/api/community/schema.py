@@ -16,6 +16,9 @@ class PostDTO(BaseModel):
     user_id: UUID
     text: Optional[str]
     files_urls: Optional[HttpUrl]
+    like_count: int
+    comment_count: int
+    repost_count: int
     created_at: datetime
     updated_at: datetime
     model_config = ConfigDict(from_attributes=True)
@@ -36,6 +39,14 @@ class PostUpdateDTO(BaseModel):
     files_urls: Optional[HttpUrl]
 
 
+class LikeDTO(BaseModel):
+    """DTO for the like of a post by the current user."""
+
+    liked: bool
+    like_count: int
+    model_config = ConfigDict(from_attributes=True)
+
+
 class CommentDTO(BaseModel):
     """
     DTO for comment.
@@ -51,6 +62,18 @@ class CommentDTO(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class CommentNodeDTO(BaseModel):
+    """
+    DTO for comment thread.
+
+    It is returned when accessing the comments of a post as a tree.
+    """
+
+    comment: CommentDTO
+    replies: list["CommentNodeDTO"]
+    model_config = ConfigDict(from_attributes=True)
+
+
 class CommentInputDTO(BaseModel):
     """DTO for creating comment."""
 
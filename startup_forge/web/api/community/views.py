@@ -1,75 +1,130 @@
 from typing import List
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, Response, status
 from fastapi.param_functions import Depends
 
-from startup_forge.db.dao.profile_dao import ProfileDAO
-from startup_forge.db.dao.community_dao import CommunityDAO
-from startup_forge.db.models.users import User, current_active_user
+from startup_forge.db.dao.community_dao import CommentNode, CommunityDAO, LikeState
+from startup_forge.db.models.users import CurrentUser, current_user_profile
 from startup_forge.db.models.profile import Profile
 from startup_forge.db.models.community import Post, Comment
+from startup_forge.db.pagination import Page
 from startup_forge.web.api.community.schema import *
+from startup_forge.web.conditional import check_etag
+from startup_forge.web.pagination import PageDTO, PageParams
 from startup_forge.web.error_message import ErrorMessage, CommunityErrorDetails
 
 router = APIRouter()
 
 
-@router.get("/", response_model=list[PostDTO])
-async def get_posts(
-    user: User = Depends(current_active_user),
-    profile_dao: ProfileDAO = Depends(),
+@router.get("/", response_model=PageDTO[PostDTO])
+async def get_feed(
+    request: Request,
+    response: Response,
+    page: PageParams = Depends(),
+    current: CurrentUser = Depends(current_user_profile),
     community_dao: CommunityDAO = Depends(),
-) -> list[Post]:
+) -> Page[Post]:
     """
-    Retrieve a list of random post object from the database.
+    Retrieve a page of the community feed, newest first.
 
-    :param user: current user.
-    :return: stream of post object from database.
+    :param request: current request.
+    :param response: response to tag.
+    :param page: page requested.
+    :param current: current user and profile.
+    :return: page of posts from database.
     """
-    profile = await profile_dao.get_profile(user.id)
+    user, profile = current
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=ErrorMessage.PROFILE_DOES_NOT_EXIST,
         )
-    return community_dao.get_posts()
+    check_etag(
+        request,
+        response,
+        await community_dao.get_feed_version(limit=page.limit, after=page.after),
+    )
+    return await community_dao.get_feed(limit=page.limit, after=page.after)
 
 
-@router.get("/me", response_model=list[PostDTO])
+@router.get("/me", response_model=PageDTO[PostDTO])
 async def get_my_posts(
-    user: User = Depends(current_active_user),
-    profile_dao: ProfileDAO = Depends(),
+    request: Request,
+    response: Response,
+    page: PageParams = Depends(),
+    current: CurrentUser = Depends(current_user_profile),
+    community_dao: CommunityDAO = Depends(),
+) -> Page[Post]:
+    """
+    Retrieve a page of the current user's posts, newest first.
+
+    :param request: current request.
+    :param response: response to tag.
+    :param page: page requested.
+    :param current: current user and profile.
+    :return: page of posts from database.
+    """
+    user, profile = current
+    if not profile:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=ErrorMessage.PROFILE_DOES_NOT_EXIST,
+        )
+    check_etag(
+        request,
+        response,
+        await community_dao.get_posts_version(
+            user.id, limit=page.limit, after=page.after
+        ),
+    )
+    return await community_dao.get_posts(user.id, limit=page.limit, after=page.after)
+
+
+@router.get("/home", response_model=PageDTO[PostDTO])
+async def get_home(
+    request: Request,
+    response: Response,
+    page: PageParams = Depends(),
+    current: CurrentUser = Depends(current_user_profile),
     community_dao: CommunityDAO = Depends(),
-) -> list[Post]:
+) -> Page[Post]:
     """
-    Retrieve a list of random post object from the database.
+    Retrieve a page of the posts of the current user and their connections.
 
-    :param user: current user.
-    :return: stream of post object from database.
+    :param request: current request.
+    :param response: response to tag.
+    :param page: page requested.
+    :param current: current user and profile.
+    :return: page of posts from database.
     """
-    profile = await profile_dao.get_profile(user.id)
+    user, profile = current
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=ErrorMessage.PROFILE_DOES_NOT_EXIST,
         )
-    return community_dao.get_posts(user.id)
+    check_etag(
+        request,
+        response,
+        await community_dao.get_home_version(
+            user.id, limit=page.limit, after=page.after
+        ),
+    )
+    return await community_dao.get_home(user.id, limit=page.limit, after=page.after)
 
 
 @router.post("/", status_code=status.HTTP_201_CREATED)
 async def create_post(
     post_object: PostInputDTO,
-    user: User = Depends(current_active_user),
-    profile_dao: ProfileDAO = Depends(),
+    current: CurrentUser = Depends(current_user_profile),
     community_dao: CommunityDAO = Depends(),
 ) -> None:
     """
     Creates post in the database.
 
     :param post_object: new post item.
-    :param profile_dao: DAO for profiles.
     """
-    profile = await profile_dao.get_profile(user.id)  # get profile
+    user, profile = current
     if not profile:  # check if profile already exists
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -89,8 +144,7 @@ async def create_post(
 async def update_post(
     post_id: UUID,
     post_object: PostUpdateDTO,
-    user: User = Depends(current_active_user),
-    profile_dao: ProfileDAO = Depends(),
+    current: CurrentUser = Depends(current_user_profile),
     community_dao: CommunityDAO = Depends(),
 ) -> None:
     """
@@ -98,9 +152,8 @@ async def update_post(
 
     :param post_id: post id.
     :param post_object: post item.
-    :param profile_dao: DAO for profiles.
     """
-    profile = await profile_dao.get_profile(user.id)  # get profile
+    user, profile = current
     if not profile:  # check if profile already exists
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -118,17 +171,15 @@ async def update_post(
 @router.delete("/{post_id}")
 async def delete_post(
     post_id: UUID,
-    user: User = Depends(current_active_user),
-    profile_dao: ProfileDAO = Depends(),
+    current: CurrentUser = Depends(current_user_profile),
     community_dao: CommunityDAO = Depends(),
 ) -> None:
     """
     Updates post in the database.
 
     :param post_id: post id.
-    :param profile_dao: DAO for profiles.
     """
-    profile = await profile_dao.get_profile(user.id)  # get profile
+    user, profile = current
     if not profile:  # check if profile already exists
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -144,8 +195,7 @@ async def delete_post(
 async def create_comment(
     post_id: UUID,
     comment_object: CommentInputDTO,
-    user: User = Depends(current_active_user),
-    profile_dao: ProfileDAO = Depends(),
+    current: CurrentUser = Depends(current_user_profile),
     community_dao: CommunityDAO = Depends(),
 ) -> None:
     """
@@ -153,9 +203,8 @@ async def create_comment(
 
     :param post_id: post id.
     :param comment_object: new comment item.
-    :param profile_dao: DAO for profiles.
     """
-    profile = await profile_dao.get_profile(user.id)  # get profile
+    user, profile = current
     if not profile:  # check if profile already exists
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -169,7 +218,7 @@ async def create_comment(
         )
     new_comment = await community_dao.create_comment(
         user_id=user.id,
-        text=comment_object.content,
+        content=comment_object.content,
         post_id=post_id,
     )
     if comment_object.comment_id:
@@ -183,8 +232,7 @@ async def create_comment(
 async def update_comment(
     comment_id: UUID,
     comment_object: CommentUpdateDTO,
-    user: User = Depends(current_active_user),
-    profile_dao: ProfileDAO = Depends(),
+    current: CurrentUser = Depends(current_user_profile),
     community_dao: CommunityDAO = Depends(),
 ) -> None:
     """
@@ -192,9 +240,8 @@ async def update_comment(
 
     :param comment_id: comment id.
     :param comment_object: comment item.
-    :param profile_dao: DAO for profiles.
     """
-    profile = await profile_dao.get_profile(user.id)  # get profile
+    user, profile = current
     if not profile:  # check if profile already exists
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -212,17 +259,15 @@ async def update_comment(
 @router.delete("/comments/{comment_id}")
 async def delete_comment(
     comment_id: UUID,
-    user: User = Depends(current_active_user),
-    profile_dao: ProfileDAO = Depends(),
+    current: CurrentUser = Depends(current_user_profile),
     community_dao: CommunityDAO = Depends(),
 ) -> None:
     """
     Deletes comment in the database.
 
     :param comment_id: comment id.
-    :param profile_dao: DAO for profiles.
     """
-    profile = await profile_dao.get_profile(user.id)  # get profile
+    user, profile = current
     if not profile:  # check if profile already exists
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -234,21 +279,22 @@ async def delete_comment(
     await community_dao.delete_comment(comment_id)
 
 
-@router.get("/comments", response_model=list[CommentDTO])
+@router.get("/comments", response_model=PageDTO[CommentDTO])
 async def get_comments(
     post_id: UUID,
-    user: User = Depends(current_active_user),
-    profile_dao: ProfileDAO = Depends(),
+    page: PageParams = Depends(),
+    current: CurrentUser = Depends(current_user_profile),
     community_dao: CommunityDAO = Depends(),
-) -> list[Comment]:
+) -> Page[Comment]:
     """
-    Retrieve a list of random post object from the database.
+    Retrieve a page of comments from the database, newest first.
 
     :param post_id: post id.
-    :param user: current user.
-    :return: stream of post object from database.
+    :param page: page requested.
+    :param current: current user and profile.
+    :return: page of comments from database.
     """
-    profile = await profile_dao.get_profile(user.id)
+    user, profile = current
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -261,26 +307,29 @@ async def get_comments(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=CommunityErrorDetails.POST_NOT_FOUND,
             )
-        return await community_dao.get_comments(post_id)
-    return await community_dao.get_my_comments(user.id)
+        return await community_dao.get_comments(
+            post_id, limit=page.limit, after=page.after
+        )
+    return await community_dao.get_my_comments(
+        user.id, limit=page.limit, after=page.after
+    )
 
 
-@router.post("/{post_id}/likes", status_code=status.HTTP_201_CREATED)
-async def like_unlike(
+@router.get("/{post_id}/thread", response_model=list[CommentNodeDTO])
+async def get_thread(
     post_id: UUID,
-    user: User = Depends(current_active_user),
-    profile_dao: ProfileDAO = Depends(),
+    current: CurrentUser = Depends(current_user_profile),
     community_dao: CommunityDAO = Depends(),
-) -> None:
+) -> list[CommentNode]:
     """
-    Creates comment in the database.
+    Retrieve the comments of a post and their replies, oldest first.
 
     :param post_id: post id.
-    :param comment_object: new comment item.
-    :param profile_dao: DAO for profiles.
+    :param current: current user and profile.
+    :return: comments of the post with their replies.
     """
-    profile = await profile_dao.get_profile(user.id)  # get profile
-    if not profile:  # check if profile already exists
+    user, profile = current
+    if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=ErrorMessage.PROFILE_DOES_NOT_EXIST,
@@ -291,4 +340,33 @@ async def like_unlike(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=CommunityErrorDetails.POST_NOT_FOUND,
         )
-    await community_dao.like_unlike(post_id, user.id)
+    return await community_dao.get_thread(post_id)
+
+
+@router.post(
+    "/{post_id}/likes", status_code=status.HTTP_201_CREATED, response_model=LikeDTO
+)
+async def like_unlike(
+    post_id: UUID,
+    current: CurrentUser = Depends(current_user_profile),
+    community_dao: CommunityDAO = Depends(),
+) -> LikeState:
+    """
+    Likes or unlikes a post.
+
+    :param post_id: post id.
+    :return: whether the user now likes the post, and its like count.
+    """
+    user, profile = current
+    if not profile:  # check if profile already exists
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=ErrorMessage.PROFILE_DOES_NOT_EXIST,
+        )
+    like = await community_dao.like_unlike(post_id, user.id)
+    if not like:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=CommunityErrorDetails.POST_NOT_FOUND,
+        )
+    return like
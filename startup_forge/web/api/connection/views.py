@@ -6,53 +6,57 @@ from fastapi.param_functions import Depends
 
 from startup_forge.db.dao.profile_dao import ProfileDAO
 from startup_forge.db.dao.connection_dao import ConnectionDAO
-from startup_forge.db.models.users import User, current_active_user
+from startup_forge.db.models.users import CurrentUser, current_user_profile
 from startup_forge.db.models.connection import Connection, ConnectionRequest
 from startup_forge.web.api.connection.schema import *
+from startup_forge.db.pagination import Page
 from startup_forge.web.error_message import ProfileErrorDetails, ConnectionErrorDetails
+from startup_forge.web.pagination import PageDTO, PageParams
 
 router = APIRouter()
 
 
-@router.get("/requests", response_model=list[ConnectionRequestDTO])
+@router.get("/requests", response_model=PageDTO[ConnectionRequestDTO])
 async def get_requests(
-    user: User = Depends(current_active_user),
-    profile_dao: ProfileDAO = Depends(),
+    page: PageParams = Depends(),
+    current: CurrentUser = Depends(current_user_profile),
     connection_dao: ConnectionDAO = Depends(),
-) -> list[ConnectionRequest]:
+) -> Page[ConnectionRequest]:
     """
-    Retrieve a profile object from the database.
+    Retrieve a page of the connection requests sent to the current user.
 
-    :param user: current user.
-    :param profile_dao: DAO for profiles.
+    :param page: page requested.
+    :param current: current user and profile.
     :param connection_dao: DAO for connections.
-    :return: profile object from database.
+    :return: page of connection requests, newest first.
     """
-    profile = await profile_dao.get_profile(user.id)
+    user, profile = current
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=ProfileErrorDetails.PROFILE_DOES_NOT_EXIST,
         )
-    return await connection_dao.get_requests(user_id=user.id)
+    return await connection_dao.get_requests(
+        user_id=user.id, limit=page.limit, after=page.after
+    )
 
 
 @router.post("/requests/{profile_id}", status_code=status.HTTP_201_CREATED)
 async def send_request(
     profile_id: UUID,
-    user: User = Depends(current_active_user),
+    current: CurrentUser = Depends(current_user_profile),
     profile_dao: ProfileDAO = Depends(),
     connection_dao: ConnectionDAO = Depends(),
 ) -> None:
     """
     Send a connection request.
 
-    :param user: current user.
+    :param current: current user and profile.
     :param profile_id: profile id.
     :param profile_dao: DAO for profiles.
     :param connection_dao: DAO for connections.
     """
-    request_from = await profile_dao.get_profile(user.id)  # get profile
+    user, request_from = current
     request_to = await profile_dao.get_profile(profile_id)
     if not request_from or not request_to:
         raise HTTPException(
@@ -71,20 +75,18 @@ async def send_request(
 async def accept_request(
     request_from: UUID,
     request_to: UUID,
-    user: User = Depends(current_active_user),
-    profile_dao: ProfileDAO = Depends(),
+    current: CurrentUser = Depends(current_user_profile),
     connection_dao: ConnectionDAO = Depends(),
 ) -> None:
     """
     Send a connection request.
 
-    :param user: current user.
+    :param current: current user and profile.
     :param request_from: id of the user who sent the request.
     :param request_to: id of the user who recieved the request.
-    :param profile_dao: DAO for profiles.
     :param connection_dao: DAO for connections.
     """
-    profile = await profile_dao.get_profile(user.id)  # get profile
+    user, profile = current
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -114,20 +116,18 @@ async def accept_request(
 async def reject_request(
     request_from: UUID,
     request_to: UUID,
-    user: User = Depends(current_active_user),
-    profile_dao: ProfileDAO = Depends(),
+    current: CurrentUser = Depends(current_user_profile),
     connection_dao: ConnectionDAO = Depends(),
 ) -> None:
     """
     Reject a connection request.
 
-    :param user: current user.
+    :param current: current user and profile.
     :param request_from: id of the user who sent the request.
     :param request_to: id of the user who recieved the request.
-    :param profile_dao: DAO for profiles.
     :param connection_dao: DAO for connections.
     """
-    profile = await profile_dao.get_profile(user.id)  # get profile
+    user, profile = current
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
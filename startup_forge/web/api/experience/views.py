@@ -1,12 +1,17 @@
 from uuid import UUID
 from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, Response, status
 from fastapi.param_functions import Depends
 
 from startup_forge.db.dao.experience_dao import ExperienceDAO
 from startup_forge.db.dao.profile_dao import ProfileDAO
-from startup_forge.db.models.users import User, current_active_user
+from startup_forge.db.models.users import (
+    CurrentUser,
+    User,
+    current_active_user,
+    current_user_profile,
+)
 from startup_forge.db.models.experience import Experience
 from startup_forge.web.api.experience.schema import (
     ExperienceDTO,
@@ -14,6 +19,7 @@ from startup_forge.web.api.experience.schema import (
     ExperienceUpdateDTO,
 )
 from startup_forge.db.models.options import Industry
+from startup_forge.web.conditional import check_etag
 from startup_forge.web.error_message import ErrorMessage
 
 router = APIRouter()
@@ -21,6 +27,8 @@ router = APIRouter()
 
 @router.get("/", response_model=list[ExperienceDTO])
 async def get_experiences(
+    request: Request,
+    response: Response,
     user_id: Optional[str] = None,
     user: User = Depends(current_active_user),
     experience_dao: ExperienceDAO = Depends(),
@@ -28,6 +36,8 @@ async def get_experiences(
     """
     Retrieve a list of experience objects from the database.
 
+    :param request: current request.
+    :param response: response to tag.
     :param user: current user.
     :param experience: experience's data access model instance.
     :return: list of experience object from database.
@@ -36,6 +46,7 @@ async def get_experiences(
         u_id = user_id
     else:
         u_id = user.id
+    check_etag(request, response, await experience_dao.get_experiences_version(u_id))
     experiences = await experience_dao.get_experiences(u_id)
     if len(experiences) < 1:
         raise HTTPException(
@@ -47,17 +58,26 @@ async def get_experiences(
 
 @router.get("/{experience_id}", response_model=ExperienceDTO)
 async def get_experience(
+    request: Request,
+    response: Response,
     experience_id: UUID,
     experience_dao: ExperienceDAO = Depends(),
 ) -> Experience:
     """
     Retrieve an experience object from the database.
 
+    :param request: current request.
+    :param response: response to tag.
     :param experience_id: id of the experience.
     :param user: current user.
     :param experience: experience's data access model instance.
     :return: an experience object from database.
     """
+    check_etag(
+        request,
+        response,
+        await experience_dao.get_experience_version(experience_id),
+    )
     experience = await experience_dao.get_experience(experience_id=experience_id)
     if not experience:
         raise HTTPException(
@@ -70,18 +90,17 @@ async def get_experience(
 @router.post("/", status_code=status.HTTP_201_CREATED)
 async def create_experience(
     experience_object: ExperienceInputDTO,
-    user: User = Depends(current_active_user),
+    current: CurrentUser = Depends(current_user_profile),
     experience_dao: ExperienceDAO = Depends(),
-    profile_dao: ProfileDAO = Depends(),
 ) -> None:
     """
     Creates experience in the database.
 
     :param experience_object: new experience item.
-    :param user: current user.
+    :param current: current user and profile.
     :param experience_dao: DAO for experiences.
     """
-    profile = await profile_dao.get_profile(user.id)
+    user, profile = current
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -125,7 +144,8 @@ async def update_experience(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=ErrorMessage.UNAUTHORIZED,
         )
-    await experience_dao.update_profile(
+    await experience_dao.update_experience(
+        experience_id=experience_id,
         company_name=experience_object.company_name,
         start_date=experience_object.start_date,
         industry=experience_object.industry,
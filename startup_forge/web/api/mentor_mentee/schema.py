@@ -2,9 +2,11 @@ from datetime import datetime
 from uuid import UUID
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 from startup_forge.db.models.options import Role
+from startup_forge.web.api.profile.schema import ProfileDTO
+from startup_forge.web.pagination import PageDTO
 
 
 class MentorMenteeDTO(BaseModel):
@@ -31,3 +33,40 @@ class MentorMenteeDeleteDTO(BaseModel):
 
     mentor_comment: Optional[str] = None
     mentee_comment: Optional[str] = None
+
+
+class MatchDTO(BaseModel):
+    """DTO for a compatible mentor."""
+
+    profile: ProfileDTO
+    compatibility: float
+    model_config = ConfigDict(from_attributes=True)
+
+
+class MatchPageDTO(PageDTO[MatchDTO]):
+    """DTO for a page of compatible mentors, best first."""
+
+
+class CohortInputDTO(BaseModel):
+    """
+    DTO for assigning a cohort of mentees to mentors.
+
+    `capacity` defaults to the `mentor_capacity` setting.
+    """
+
+    mentee_ids: list[UUID] = Field(min_length=1)
+    capacity: Optional[int] = Field(default=None, ge=1)
+
+
+class AssignmentDTO(BaseModel):
+    """DTO for a mentee assigned to a mentor."""
+
+    mentee_id: UUID
+    mentor_id: UUID
+
+
+class CohortAssignmentDTO(BaseModel):
+    """DTO for the result of a cohort assignment."""
+
+    assigned: list[AssignmentDTO]
+    unassigned: list[UUID]
@@ -1,61 +1,129 @@
-from typing import List
+from typing import Any, List, Optional
+from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Query, status
 from fastapi.param_functions import Depends
 
 from startup_forge.db.dao.profile_dao import ProfileDAO
 from startup_forge.db.dao.mentor_mentee_dao import MentorMenteeDAO
-from startup_forge.db.models.users import User, current_active_user
+from startup_forge.db.pagination import decode_cursor, encode_cursor
+from startup_forge.db.models.users import (
+    CurrentUser,
+    User,
+    current_superuser,
+    current_user_profile,
+)
 from startup_forge.db.models.mentor_mentee import MentorMentee
-from startup_forge.db.models.profile import Profile
 from startup_forge.web.api.mentor_mentee.schema import (
     MentorMenteeDTO,
     MentorMenteeInputDTO,
     MentorMenteeDeleteDTO,
+    MatchPageDTO,
+    CohortInputDTO,
+    CohortAssignmentDTO,
 )
-from startup_forge.web.api.profile.schema import ProfileDTO
 from startup_forge.web.error_message import ErrorMessage
 from startup_forge.db.models.options import Role
+from startup_forge.settings import settings
 
 router = APIRouter()
 
 
-@router.get("/request", response_model=list[tuple[ProfileDTO, float]])
+@router.get("/request", response_model=MatchPageDTO)
 async def request_matches(
-    user: User = Depends(current_active_user),
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    min_score: float = Query(default=0.0, ge=0, le=1),
+    current: CurrentUser = Depends(current_user_profile),
     mentor_mentee_dao: MentorMenteeDAO = Depends(),
-    profile_dao: ProfileDAO = Depends(),
-) -> list[tuple[Profile, float]]:
+) -> dict[str, Any]:
     """
-    Retrieve a list of compatible mentors from the database.
+    Retrieve a page of the most compatible mentors from the database.
 
-    :param user: current user.
-    :param profile_dao: DAO for profiles.
+    :param limit: maximum number of mentors in the page.
+    :param cursor: `next_cursor` of the previous page.
+    :param min_score: minimum compatibility of a mentor.
+    :param current: current user and profile.
     :return: profile object(s) from database.
     """
-    profile = await profile_dao.get_profile(user.id)
+    user, profile = current
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=ErrorMessage.USER_NOT_ASSOCIATED_WITH_AN_ACTIVE_PROFILE,
         )
-    return await mentor_mentee_dao.match_mentees_to_mentors(mentee=profile)
+    after = None
+    if cursor:
+        try:
+            after = decode_cursor(cursor, float, UUID)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=ErrorMessage.INVALID_CURSOR,
+            )
+    matches = await mentor_mentee_dao.match_mentees_to_mentors(
+        mentee=profile, limit=limit + 1, min_score=min_score, after=after
+    )
+    next_cursor = None
+    if len(matches) > limit:
+        matches = matches[:limit]
+        last_profile, last_score = matches[-1]
+        next_cursor = encode_cursor(last_score, last_profile.user_id)
+    return {
+        "items": [
+            {"profile": mentor, "compatibility": score} for mentor, score in matches
+        ],
+        "next_cursor": next_cursor,
+    }
+
+
+@router.post(
+    "/cohort",
+    response_model=CohortAssignmentDTO,
+    status_code=status.HTTP_201_CREATED,
+)
+async def assign_cohort(
+    cohort: CohortInputDTO,
+    user: User = Depends(current_superuser),
+    mentor_mentee_dao: MentorMenteeDAO = Depends(),
+) -> dict[str, Any]:
+    """
+    Assign a cohort of mentees to mentors in one pass.
+
+    :param cohort: mentees to assign and capacity of the mentors.
+    :param user: current user, must be a superuser.
+    :param mentor_mentee_dao: DAO for MentorMentees.
+    :return: assigned mentees and mentees left without a mentor.
+    """
+    mentee_ids = list(dict.fromkeys(cohort.mentee_ids))
+    assignments = await mentor_mentee_dao.assign_cohort(
+        mentee_ids,
+        capacity=cohort.capacity or settings.mentor_capacity,
+        candidates=settings.cohort_candidates,
+    )
+    return {
+        "assigned": [
+            {"mentee_id": mentee_id, "mentor_id": mentor_id}
+            for mentee_id, mentor_id in assignments.items()
+        ],
+        "unassigned": [
+            mentee_id for mentee_id in mentee_ids if mentee_id not in assignments
+        ],
+    }
 
 
 @router.get("/", response_model=MentorMenteeDTO | list[MentorMenteeDTO])
 async def get_matches(
-    user: User = Depends(current_active_user),
+    current: CurrentUser = Depends(current_user_profile),
     mentor_mentee_dao: MentorMenteeDAO = Depends(),
-    profile_dao: ProfileDAO = Depends(),
 ) -> MentorMentee | list[MentorMentee]:
     """
     Retrieve mentor_mentee object(s) from the database.
 
-    :param user: current user.
-    :param profile_dao: DAO for profiles.
+    :param current: current user and profile.
     :return: mentor_mentee object(s) from database.
     """
-    profile = await profile_dao.get_profile(user.id)
+    user, profile = current
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -73,7 +141,7 @@ async def get_matches(
 @router.post("/", status_code=status.HTTP_201_CREATED)
 async def create_match(
     mentor_mentee_object: MentorMenteeInputDTO,
-    user: User = Depends(current_active_user),
+    current: CurrentUser = Depends(current_user_profile),
     mentor_mentee_dao: MentorMenteeDAO = Depends(),
     profile_dao: ProfileDAO = Depends(),
 ) -> None:
@@ -81,11 +149,11 @@ async def create_match(
     Creates profile in the database.
 
     :param mentor_mentee_object: new mentor_mentee item.
-    :param user: current user.
+    :param current: current user and profile.
     :param mentor_mentee_dao: DAO for MentorMentees.
     :param profile_dao: DAO for profiles.
     """
-    user_profile = await profile_dao.get_profile(user.id)  # get user profile
+    user, user_profile = current
     if not user_profile:  # check if profile already exists
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -112,18 +180,16 @@ async def create_match(
 @router.delete("/")
 async def unmatch(
     mentor_mentee_object: MentorMenteeDeleteDTO,
-    user: User = Depends(current_active_user),
-    profile_dao: ProfileDAO = Depends(),
+    current: CurrentUser = Depends(current_user_profile),
     mentor_mentee_dao: MentorMenteeDAO = Depends(),
 ) -> None:
     """
     Deletes MentorMentee instance in the database.
 
-    :param user: current user.
-    :param profile_dao: DAO for profiles.
+    :param current: current user and profile.
     :param mentor_mentee_dao: DAO for MentorMentees.
     """
-    profile = await profile_dao.get_profile(user.id)  # get profile
+    user, profile = current
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
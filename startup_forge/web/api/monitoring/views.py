@@ -1,4 +1,11 @@
+from typing import Any
+
 from fastapi import APIRouter
+from fastapi.param_functions import Depends
+
+from startup_forge.db.dao.profile_dao import profile_cache
+from startup_forge.db.models.users import User, current_superuser
+from startup_forge.services.matching import match_cache
 
 router = APIRouter()
 
@@ -10,3 +17,19 @@ def health_check() -> None:
 
     It returns 200 if the project is healthy.
     """
+
+
+@router.get("/cache")
+def cache_stats(
+    user: User = Depends(current_superuser),
+) -> dict[str, dict[str, Any]]:
+    """
+    Get the statistics of the in-process caches of this worker.
+
+    :param user: current user, a superuser.
+    :return: size, capacity, hits and misses of every cache.
+    """
+    return {
+        "profiles": profile_cache.stats(),
+        "matches": match_cache.stats(),
+    }
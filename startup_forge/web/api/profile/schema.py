@@ -11,6 +11,7 @@ from startup_forge.db.models.options import (
     LanguageLevel,
     LanguageName,
 )
+from startup_forge.web.pagination import PageDTO
 
 
 class ProfileDTO(BaseModel):
@@ -24,17 +25,21 @@ class ProfileDTO(BaseModel):
     first_name: str
     last_name: str
     role: Role
-    years_of_experienc: Optional[str]
-    bio: Optional[str]
-    expertises: Optional[Tuple[ExpertiseName]]
-    skills: Optional[Tuple[SkillName]]
-    profile_picture_url: Optional[HttpUrl]
-    languages: Optional[List[Tuple[LanguageName, LanguageLevel]]]
-    social_lists: Optional[List[Tuple[Platform, HttpUrl]]]
+    years_of_experience: Optional[str] = None
+    bio: Optional[str] = None
+    expertises: Optional[List[ExpertiseName]] = None
+    skills: Optional[List[SkillName]] = None
+    profile_picture_url: Optional[HttpUrl] = None
+    languages: Optional[List[Tuple[LanguageName, LanguageLevel]]] = None
+    social_links: Optional[List[Tuple[Platform, HttpUrl]]] = None
 
     model_config = ConfigDict(from_attributes=True)
 
 
+class ProfilePageDTO(PageDTO[ProfileDTO]):
+    """DTO for a page of profiles, best ranked first."""
+
+
 class ProfileInputDTO(BaseModel):
     """DTO for creating profile."""
 
@@ -89,7 +94,9 @@ class SocialLinkDeleteDTO(BaseModel):
 class LanguageDTO(BaseModel):
     """DTO for language."""
 
-    languages: List[Tuple[LanguageName, LanguageLevel]] | Tuple[LanguageName, LanguageLevel]
+    languages: List[Tuple[LanguageName, LanguageLevel]] | Tuple[
+        LanguageName, LanguageLevel
+    ]
 
 
 class LanguageDeleteDTO(BaseModel):
@@ -1,19 +1,28 @@
 from datetime import date, time
-from typing import List
+from typing import Any, List
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
 from fastapi.param_functions import Depends
 
 from startup_forge.db.dao.profile_dao import ProfileDAO
 from startup_forge.db.dao.review_dao import ReviewDAO
 from startup_forge.db.dao.connection_dao import ConnectionDAO
 from startup_forge.db.dao.booking_dao import BookingDAO
-from startup_forge.db.models.users import User, current_active_user
+from startup_forge.db.pagination import decode_cursor, encode_cursor
+from startup_forge.services.profile_loader import ProfileLoader
+from startup_forge.db.models.users import (
+    CurrentUser,
+    User,
+    current_active_user,
+    current_user_profile,
+)
 from startup_forge.db.models.profile import Profile
 from startup_forge.db.models.review import Review
-from startup_forge.db.models.options import Day
+from startup_forge.db.models.options import Day, LanguageLevel, LanguageName, Role
 from startup_forge.web.api.profile.schema import *
 from startup_forge.web.api.review.schema import *
+from startup_forge.web.conditional import check_etag, make_version
+from startup_forge.web.pagination import PageDTO, PageParams
 from startup_forge.web.error_message import ErrorMessage, ProfileErrorDetails
 
 router = APIRouter()
@@ -21,38 +30,111 @@ router = APIRouter()
 
 @router.get("/", response_model=ProfileDTO | None)
 async def get_profile(
-    user: User = Depends(current_active_user),
-    profile_dao: ProfileDAO = Depends(),
+    request: Request,
+    response: Response,
+    current: CurrentUser = Depends(current_user_profile),
 ) -> Profile | None:
     """
     Retrieve a profile object from the database.
 
-    :param user: current user.
+    :param request: current request.
+    :param response: response to tag.
+    :param current: current user and profile.
     :return: profile object from database.
     """
-    profile = await profile_dao.get_profile(user.id)
+    profile = current.profile
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=ErrorMessage.PROFILE_DOES_NOT_EXIST,
         )
+    check_etag(request, response, make_version(profile.user_id, profile.updated_at))
     return profile
 
 
+@router.get("/search", response_model=ProfilePageDTO)
+async def search_profiles(
+    q: Optional[str] = None,
+    role: Optional[Role] = None,
+    skills: list[SkillName] = Query(default=[]),
+    expertises: list[ExpertiseName] = Query(default=[]),
+    languages: list[str] = Query(default=[]),
+    match_all: bool = True,
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    user: User = Depends(current_active_user),
+    profile_dao: ProfileDAO = Depends(),
+) -> dict[str, Any]:
+    """
+    Search profiles by name and bio, role, skills, expertises and languages.
+
+    :param q: words the first name, last name or bio start with.
+    :param role: role of the profiles.
+    :param skills: skills of the profiles.
+    :param expertises: expertises of the profiles.
+    :param languages: languages of the profiles, as `NAME` or `NAME:LEVEL`.
+    :param match_all: whether profiles must have every skill, expertise and
+        language given or any of them.
+    :param limit: maximum number of profiles in the page.
+    :param cursor: `next_cursor` of the previous page.
+    :param user: current user.
+    :param profile_dao: DAO for profiles.
+    :return: page of matching profiles, best ranked first.
+    """
+    try:
+        language_filters = [
+            (LanguageName(name), LanguageLevel(level) if level else None)
+            for name, _, level in (language.partition(":") for language in languages)
+        ]
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=ProfileErrorDetails.INVALID_LANGUAGE,
+        )
+    after = None
+    if cursor:
+        try:
+            after = decode_cursor(cursor, float, UUID)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=ErrorMessage.INVALID_CURSOR,
+            )
+    results = await profile_dao.search(
+        q,
+        limit=limit + 1,
+        after=after,
+        role=role,
+        skills=skills,
+        expertises=expertises,
+        languages=language_filters,
+        match_all=match_all,
+    )
+    next_cursor = None
+    if len(results) > limit:
+        results = results[:limit]
+        last_profile, last_rank = results[-1]
+        next_cursor = encode_cursor(last_rank, last_profile.user_id)
+    return {
+        "items": [profile for profile, _ in results],
+        "next_cursor": next_cursor,
+    }
+
+
 @router.post("/", status_code=status.HTTP_201_CREATED)
 async def create_profile(
     profile_object: ProfileInputDTO,
-    user: User = Depends(current_active_user),
+    current: CurrentUser = Depends(current_user_profile),
     profile_dao: ProfileDAO = Depends(),
 ) -> None:
     """
     Creates profile in the database.
 
-    :param user: current user.
+    :param current: current user and profile.
     :param profile_object: new profile item.
     :param profile_dao: DAO for profiles.
     """
-    profile = await profile_dao.get_profile(user.id)  # get profile
+    user, profile = current
     if profile:  # check if profile already exists
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -69,17 +151,17 @@ async def create_profile(
 @router.patch("/")
 async def update_profile(
     profile_object: ProfileUpdateDTO,
-    user: User = Depends(current_active_user),
+    current: CurrentUser = Depends(current_user_profile),
     profile_dao: ProfileDAO = Depends(),
 ) -> None:
     """
     Updates profile in the database.
 
-    :param user: current user.
+    :param current: current user and profile.
     :param profile_object: profile item.
     :param profile_dao: DAO for profiles.
     """
-    profile = await profile_dao.get_profile(user.id)  # get profile
+    user, profile = current
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -94,6 +176,7 @@ async def update_profile(
         profile_picture_url=profile_object.profile_picture_url,
         expertises=profile_object.expertises,
         skills=profile_object.skills,
+        languages=profile_object.languages,
         social_links=profile_object.social_lists,
     )
 
@@ -101,24 +184,24 @@ async def update_profile(
 @router.put("/expertises")
 async def record_expertises(
     expertise: ExpertiseDTO,
-    user: User = Depends(current_active_user),
+    current: CurrentUser = Depends(current_user_profile),
     profile_dao: ProfileDAO = Depends(),
 ) -> None:
     """
     Updates profile in the database.
 
-    :param user: current user.
+    :param current: current user and profile.
     :param expertise: expertise object.
     :param profile_dao: DAO for profiles.
     """
 
-    profile = await profile_dao.get_profile(user.id)
+    user, profile = current
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=ProfileErrorDetails.PROFILE_DOES_NOT_EXIST,
         )
-    await profile_dao.record_expertise(
+    await profile_dao.register_expertises(
         user_id=user.id,
         expertise_names=expertise.names,
     )
@@ -127,24 +210,24 @@ async def record_expertises(
 @router.delete("/expertises")
 async def remove_expertises(
     expertise: ExpertiseDTO,
-    user: User = Depends(current_active_user),
+    current: CurrentUser = Depends(current_user_profile),
     profile_dao: ProfileDAO = Depends(),
 ) -> None:
     """
     Updates profile in the database.
 
-    :param user: current user.
+    :param current: current user and profile.
     :param expertise: expertise object.
     :param profile_dao: DAO for profiles.
     """
 
-    profile = await profile_dao.get_profile(user.id)
+    user, profile = current
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=ProfileErrorDetails.PROFILE_DOES_NOT_EXIST,
         )
-    await profile_dao.remove_expertise(
+    await profile_dao.remove_expertises(
         user_id=user.id,
         expertise_names=expertise.names,
     )
@@ -153,18 +236,18 @@ async def remove_expertises(
 @router.put("/skills")
 async def record_skills(
     skill: SkillDTO,
-    user: User = Depends(current_active_user),
+    current: CurrentUser = Depends(current_user_profile),
     profile_dao: ProfileDAO = Depends(),
 ) -> None:
     """
     Updates profile in the database.
 
-    :param user: current user.
+    :param current: current user and profile.
     :param skill: skill object.
     :param profile_dao: DAO for profiles.
     """
 
-    profile = await profile_dao.get_profile(user.id)
+    user, profile = current
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -177,20 +260,20 @@ async def record_skills(
 
 
 @router.delete("/skills")
-async def record_skills(
+async def remove_skills(
     skill: SkillDTO,
-    user: User = Depends(current_active_user),
+    current: CurrentUser = Depends(current_user_profile),
     profile_dao: ProfileDAO = Depends(),
 ) -> None:
     """
     Updates profile in the database.
 
-    :param user: current user.
+    :param current: current user and profile.
     :param skill: skill object.
     :param profile_dao: DAO for profiles.
     """
 
-    profile = await profile_dao.get_profile(user.id)
+    user, profile = current
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -205,18 +288,18 @@ async def record_skills(
 @router.put("/socials")
 async def register_socials(
     social_link: SocialLinkDTO,
-    user: User = Depends(current_active_user),
+    current: CurrentUser = Depends(current_user_profile),
     profile_dao: ProfileDAO = Depends(),
 ) -> None:
     """
     Updates profile in the database.
 
-    :param user: current user.
+    :param current: current user and profile.
     :param social_link: social_link object.
     :param profile_dao: DAO for profiles.
     """
 
-    profile = await profile_dao.get_profile(user.id)
+    user, profile = current
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -231,44 +314,44 @@ async def register_socials(
 @router.delete("/socials")
 async def remove_social(
     social_link: SocialLinkDeleteDTO,
-    user: User = Depends(current_active_user),
+    current: CurrentUser = Depends(current_user_profile),
     profile_dao: ProfileDAO = Depends(),
 ) -> None:
     """
     Updates profile in the database.
 
-    :param user: current user.
+    :param current: current user and profile.
     :param social_link: social_link object.
     :param profile_dao: DAO for profiles.
     """
 
-    profile = await profile_dao.get_profile(user.id)
+    user, profile = current
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=ProfileErrorDetails.PROFILE_DOES_NOT_EXIST,
         )
-    await profile_dao.register_social_link(
+    await profile_dao.remove_social_link(
         user_id=user.id,
         platform=social_link.platform,
     )
 
 
 @router.put("/languages")
-async def remove_language(
+async def register_languages(
     language: LanguageDTO,
-    user: User = Depends(current_active_user),
+    current: CurrentUser = Depends(current_user_profile),
     profile_dao: ProfileDAO = Depends(),
 ) -> None:
     """
     Updates profile in the database.
 
-    :param user: current user.
+    :param current: current user and profile.
     :param language: language object.
     :param profile_dao: DAO for profiles.
     """
 
-    profile = await profile_dao.get_profile(user.id)
+    user, profile = current
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -282,18 +365,18 @@ async def remove_language(
 @router.delete("/languages")
 async def remove_language(
     language: LanguageDeleteDTO,
-    user: User = Depends(current_active_user),
+    current: CurrentUser = Depends(current_user_profile),
     profile_dao: ProfileDAO = Depends(),
 ) -> None:
     """
     Updates profile in the database.
 
-    :param user: current user.
+    :param current: current user and profile.
     :param language: language object.
     :param profile_dao: DAO for profiles.
     """
 
-    profile = await profile_dao.get_profile(user.id)
+    user, profile = current
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -305,37 +388,105 @@ async def remove_language(
     )
 
 
-@router.get("/{profile_id}/reviews", response_model=ReviewDTO)
-async def get_reviews(
+@router.get("/{profile_id}/card", response_model=ProfileCardDTO)
+async def get_card(
     profile_id: UUID,
+    user: User = Depends(current_active_user),
     profile_dao: ProfileDAO = Depends(),
+) -> dict[str, Any]:
+    """
+    Retrieve a profile with its experiences, educations, reviews and sessions.
+
+    :param profile_id: profile id.
+    :param user: current user.
+    :param profile_dao: DAO for profiles.
+    :return: profile card.
+    """
+    card = await profile_dao.get_card(profile_id)
+    if not card:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=ProfileErrorDetails.PROFILE_DOES_NOT_EXIST,
+        )
+    profile, completed_sessions = card
+    return {
+        "profile": profile,
+        "experiences": profile.experiences,
+        "educations": profile.educations,
+        "reviews": profile.reviews,
+        "completed_sessions": completed_sessions,
+    }
+
+
+@router.get("/{profile_id}/reviews", response_model=PageDTO[ProfileReviewDTO])
+async def get_reviews(
+    request: Request,
+    response: Response,
+    profile_id: UUID,
+    page: PageParams = Depends(),
+    profile_loader: ProfileLoader = Depends(),
     review_dao: ReviewDAO = Depends(),
-) -> list[Review] | None:
+) -> dict[str, Any]:
     """
-    Retrieve review objects from the database.
+    Retrieve a page of review objects from the database, newest first.
 
+    :param request: current request.
+    :param response: response to tag.
     :param profile_id: profile id.
-    :param profile_dao: profile dao.
+    :param page: page requested.
+    :param profile_loader: request-scoped profile batcher.
     :param review_dao: review dao.
-    :return: review objects from database.
+    :return: page of reviews from database, with the profiles involved.
     """
-    profile = await profile_dao.get_profile(user_id=profile_id)
+    profile = await profile_loader.load(profile_id)
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=ProfileErrorDetails.PROFILE_DOES_NOT_EXIST,
         )
-    return await review_dao.get_reviews(
+    check_etag(
+        request,
+        response,
+        await review_dao.get_reviews_version(
+            user_id=profile_id,
+            role=profile.role,
+            limit=page.limit,
+            after=page.after,
+        ),
+    )
+    reviews = await review_dao.get_reviews(
         user_id=profile_id,
         role=profile.role,
+        limit=page.limit,
+        after=page.after,
+    )
+    profiles = await profile_loader.load_many(
+        {
+            user_id
+            for review in reviews.items
+            for user_id in (review.mentee_id, review.mentor_id)
+        }
     )
+    by_id = {profile.user_id: profile for profile in profiles if profile}
+    return {
+        "items": [
+            {
+                **ReviewDTO.model_validate(review).model_dump(),
+                "mentee_id": review.mentee_id,
+                "mentee": by_id.get(review.mentee_id),
+                "mentor": by_id.get(review.mentor_id),
+            }
+            for review in reviews.items
+        ],
+        "next_cursor": reviews.next_cursor,
+    }
 
 
 @router.get("/connections", response_model=list[ProfileDTO])
 async def get_requests(
     user: User = Depends(current_active_user),
     user_id: Optional[UUID] = None,
-    profile_dao: ProfileDAO = Depends(),
+    profile_loader: ProfileLoader = Depends(),
     connection_dao: ConnectionDAO = Depends(),
 ) -> list[Profile]:
     """
@@ -343,11 +494,11 @@ async def get_requests(
 
     :param user: current user.
     :param user_id: user id.
-    :param profile_dao: DAO for profiles.
+    :param profile_loader: request-scoped profile batcher.
     :param connection_dao: DAO for connections.
     :return: profile objects from database.
     """
-    profile = await profile_dao.get_profile(user.id)
+    profile = await profile_loader.load(user.id)
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -356,11 +507,8 @@ async def get_requests(
     connections_ids = await connection_dao.get_connections(
         user_id=user.id if not user_id else user_id
     )
-
-    return [
-        profile_dao.get_profile(user_id=connection_id)
-        for connection_id in connections_ids
-    ]
+    profiles = await profile_loader.load_many(connections_ids)
+    return [profile for profile in profiles if profile]
 
 
 @router.get("/mentors/available")
@@ -1,8 +1,14 @@
 from datetime import datetime
 from uuid import UUID
 
+from typing import Optional
+
 from pydantic import BaseModel, ConfigDict
 
+from startup_forge.web.api.education.schema import EducationDTO
+from startup_forge.web.api.experience.schema import ExperienceDTO
+from startup_forge.web.api.profile.schema import ProfileDTO
+
 
 class ReviewInputDTO(BaseModel):
     """DTO for creating review."""
@@ -30,3 +36,35 @@ class ReviewDTO(ReviewInputDTO):
     created_at: datetime
     updated_at: datetime
     model_config = ConfigDict(from_attributes=True)
+
+
+class ProfileReviewDTO(ReviewDTO):
+    """
+    DTO for reviews listed on a profile.
+
+    It comes with the profiles of the mentee and the mentor.
+    """
+
+    mentee_id: UUID
+    mentee: Optional[ProfileDTO] = None
+    mentor: Optional[ProfileDTO] = None
+
+
+class CardReviewDTO(ReviewDTO):
+    """DTO for reviews shown on a profile card."""
+
+    mentee_id: UUID
+
+
+class ProfileCardDTO(BaseModel):
+    """
+    DTO for profile cards.
+
+    It gathers what a profile page shows in one response.
+    """
+
+    profile: ProfileDTO
+    experiences: list[ExperienceDTO]
+    educations: list[EducationDTO]
+    reviews: list[CardReviewDTO]
+    completed_sessions: int
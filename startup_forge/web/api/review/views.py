@@ -4,8 +4,7 @@ from fastapi import APIRouter, HTTPException, status
 from fastapi.param_functions import Depends
 
 from startup_forge.db.dao.review_dao import ReviewDAO
-from startup_forge.db.dao.profile_dao import ProfileDAO
-from startup_forge.db.models.users import User, current_active_user
+from startup_forge.db.models.users import CurrentUser, current_user_profile
 from startup_forge.db.models.review import Review
 from startup_forge.web.api.review.schema import *
 from startup_forge.web.error_message import ProfileErrorDetails, ReviewErrorDetails
@@ -16,19 +15,17 @@ router = APIRouter()
 @router.post("/", status_code=status.HTTP_201_CREATED)
 async def create_review(
     review_object: ReviewInputDTO,
-    user: User = Depends(current_active_user),
-    profile_dao: ProfileDAO = Depends(),
+    current: CurrentUser = Depends(current_user_profile),
     review_dao: ReviewDAO = Depends(),
 ) -> None:
     """
     Creates review in the database.
 
     :param review_object: new review item.
-    :param user: current user.
-    :param profile_dao: profile dao.
+    :param current: current user and profile.
     :param review_dao: review dao.
     """
-    profile = await profile_dao.get_profile(user_id=user.id)  # get profile
+    user, profile = current
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -45,8 +42,7 @@ async def create_review(
 async def update_review(
     review_object: ReviewUpdateDTO,
     review_id: UUID,
-    user: User = Depends(current_active_user),
-    profile_dao: ProfileDAO = Depends(),
+    current: CurrentUser = Depends(current_user_profile),
     review_dao: ReviewDAO = Depends(),
 ) -> None:
     """
@@ -54,11 +50,10 @@ async def update_review(
 
     :param review_object: new review item.
     :param review_id: review id.
-    :param user: current user.
-    :param profile_dao: profile dao.
+    :param current: current user and profile.
     :param review_dao: review dao.
     """
-    profile = await profile_dao.get_profile(user_id=user.id)  # get profile
+    user, profile = current
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -84,19 +79,17 @@ async def update_review(
 @router.delete("/{review_id}")
 async def delete_education(
     review_id: UUID,
-    user: User = Depends(current_active_user),
+    current: CurrentUser = Depends(current_user_profile),
     review_dao: ReviewDAO = Depends(),
-    profile_dao: ProfileDAO = Depends(),
 ) -> None:
     """
     Deletes a review object in the database.
 
     :param review_id: review id.
-    :param user: current user.
+    :param current: current user and profile.
     :param review_dao: review dao.
-    :param profile_dao: DAO for profiles.
     """
-    profile = await profile_dao.get_profile(user.id)  # get profile
+    user, profile = current
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -0,0 +1,39 @@
+import hashlib
+from typing import Any, Optional
+
+from fastapi import HTTPException, Request, Response, status
+
+
+def make_version(*parts: Any) -> str:
+    """
+    Fingerprint values already loaded, such as the key and `updated_at` of a row.
+
+    :param parts: values the response is built from.
+    :return: fingerprint of the values.
+    """
+    return hashlib.md5(":".join(map(str, parts)).encode()).hexdigest()
+
+
+def check_etag(request: Request, response: Response, version: Optional[str]) -> None:
+    """
+    Tag a response and answer conditional requests for it.
+
+    :param request: current request.
+    :param response: response to tag.
+    :param version: fingerprint of the data of the response, `None` to skip.
+    :raises HTTPException: 304 if the client copy is current.
+    """
+    if version is None:
+        return
+    etag = f'"{version}"'
+    response.headers["ETag"] = etag
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match is None:
+        return
+    # If-None-Match uses the weak comparison.
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    if "*" in tags or etag in tags:
+        raise HTTPException(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag},
+        )
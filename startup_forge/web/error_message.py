@@ -18,6 +18,7 @@ class ErrorMessage(str, Enum):
         "MENTOR_NOT_ASSOCIATED_WITH_AN_ACTIVE_PROFILE"
     )
     USER_HAS_A_MENTOR_ALREADY = "USER_HAS_A_MENTOR_ALREADY"
+    INVALID_CURSOR = "INVALID_CURSOR"
 
 
 class ProfileErrorDetails(str, Enum):
@@ -34,6 +35,7 @@ class ProfileErrorDetails(str, Enum):
     PROFILE_ROLE_NOT_MENTOR = "PROFILE_ROLE_NOT_MENTOR"
     PROFILE_ROLE_NOT_MENTEE = "PROFILE_ROLE_NOT_MENTEE"
     PROFILE_ALREADY_EXISTS = "PROFILE_ALREADY_EXISTS"
+    INVALID_LANGUAGE = "INVALID_LANGUAGE"
 
 
 class EducationErrorDetails(str, Enum):
@@ -0,0 +1,50 @@
+from datetime import datetime
+from typing import Generic, Optional, TypeVar
+from uuid import UUID
+
+from fastapi import HTTPException, Query, status
+from pydantic import BaseModel
+
+from startup_forge.db.pagination import decode_keyset
+from startup_forge.settings import settings
+from startup_forge.web.error_message import ErrorMessage
+
+T = TypeVar("T")
+
+
+class PageDTO(BaseModel, Generic[T]):
+    """
+    DTO for a page of a list.
+
+    `next_cursor` is `None` on the last page.
+    """
+
+    items: list[T]
+    next_cursor: Optional[str] = None
+
+
+class PageParams:
+    """Query parameters of a page, see `startup_forge.db.pagination.paginate`."""
+
+    def __init__(
+        self,
+        limit: int = Query(default=settings.page_size, ge=1, le=settings.max_page_size),
+        cursor: Optional[str] = None,
+    ):
+        """
+        Validate the page requested.
+
+        :param limit: maximum number of items in the page.
+        :param cursor: `next_cursor` of the previous page.
+        :raises HTTPException: if the cursor is malformed.
+        """
+        self.limit = limit
+        self.after: Optional[tuple[datetime, UUID]] = None
+        if cursor:
+            try:
+                self.after = decode_keyset(cursor)
+            except ValueError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=ErrorMessage.INVALID_CURSOR,
+                )